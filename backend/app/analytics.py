@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .batch_writer import BatchWriter
+
+# Funnel stages. Each session is counted once per stage, in the hour it
+# first reached it; the lab stages are also counted once per lab tool.
+FUNNEL_STAGES = ("chat_started", "lab_offered", "lab_run", "escalated")
+LAB_STAGES = ("lab_offered", "lab_run")
+# dim of the any-tool row of a lab stage
+ANY_TOOL = ""
+# Plain event volumes kept next to the funnel in the same rollup table
+VOLUME_STAGES = ("turns", "lab_runs")
+
+BUCKETS = {"hour": 1, "day": 24, "week": 24 * 7}
+
+# (kind, ts, fields) as queued by AnalyticsLog; kind is "turn" or "lab_run"
+Record = Tuple[str, float, Tuple[Any, ...]]
+
+
+def _text(value: Any) -> Optional[str]:
+  return None if value is None else str(value)
+
+
+def lab_summary(result: Dict[str, Any]) -> Tuple[Optional[float], Optional[str]]:
+  """(score, tier) of a lab result: scores.score or the mean of the scores; tier or delivery model."""
+  if not isinstance(result, dict):
+    return None, None
+  scores = result.get("scores")
+  score = None
+  if isinstance(scores, dict):
+    if isinstance(scores.get("score"), (int, float)):
+      score = float(scores["score"])
+    else:
+      values = [v for v in scores.values() if isinstance(v, (int, float)) and not isinstance(v, bool)]
+      score = round(sum(values) / len(values), 2) if values else None
+  return score, _text(result.get("tier") or result.get("model"))
+
+
+class AnalyticsStore:
+  """Per-turn and per-lab-run rows plus hourly funnel rollups, in one SQLite file.
+
+  Each write batch (one transaction) appends the raw rows, marks the
+  funnel stages sessions reach for the first time in `session_stages`, and
+  adds the batch's counts to `funnel_hourly` and `funnel_daily` with an
+  UPSERT. Funnel queries read only the rollups -- whole days from
+  `funnel_daily`, the partial days at either end from `funnel_hourly` --
+  so their cost depends on the days asked for, not on how many turns
+  were logged.
+  """
+
+  def __init__(self, path: str) -> None:
+    self.path = path
+    self._local = threading.local()
+    directory = os.path.dirname(path)
+    if directory:
+      os.makedirs(directory, exist_ok=True)
+    with self._conn() as conn:
+      conn.execute(
+        "CREATE TABLE IF NOT EXISTS turns ("
+        " ts REAL NOT NULL,"
+        " session_id TEXT NOT NULL,"
+        " state TEXT,"
+        " intent TEXT,"
+        " confidence REAL,"
+        " action TEXT,"
+        " lab_tool TEXT)"
+      )
+      conn.execute(
+        "CREATE TABLE IF NOT EXISTS lab_runs ("
+        " ts REAL NOT NULL,"
+        " session_id TEXT,"
+        " tool TEXT NOT NULL,"
+        " score REAL,"
+        " tier TEXT,"
+        " scores TEXT)"
+      )
+      conn.execute(
+        "CREATE TABLE IF NOT EXISTS session_stages ("
+        " session_id TEXT NOT NULL,"
+        " stage TEXT NOT NULL,"
+        " dim TEXT NOT NULL,"
+        " hour INTEGER NOT NULL,"
+        " PRIMARY KEY (session_id, stage, dim)) WITHOUT ROWID"
+      )
+      conn.execute(
+        "CREATE TABLE IF NOT EXISTS funnel_hourly ("
+        " hour INTEGER NOT NULL,"
+        " stage TEXT NOT NULL,"
+        " dim TEXT NOT NULL,"
+        " n INTEGER NOT NULL,"
+        " PRIMARY KEY (hour, stage, dim)) WITHOUT ROWID"
+      )
+      conn.execute(
+        "CREATE TABLE IF NOT EXISTS funnel_daily ("
+        " day INTEGER NOT NULL,"
+        " stage TEXT NOT NULL,"
+        " dim TEXT NOT NULL,"
+        " n INTEGER NOT NULL,"
+        " PRIMARY KEY (day, stage, dim)) WITHOUT ROWID"
+      )
+      conn.execute("CREATE INDEX IF NOT EXISTS turns_session ON turns (session_id, ts)")
+      conn.execute("CREATE INDEX IF NOT EXISTS lab_runs_session ON lab_runs (session_id, ts)")
+
+  def _conn(self) -> sqlite3.Connection:
+    conn = getattr(self._local, "conn", None)
+    if conn is None:
+      conn = sqlite3.connect(self.path, timeout=5.0)
+      conn.execute("PRAGMA journal_mode=WAL")
+      conn.execute("PRAGMA synchronous=NORMAL")
+      self._local.conn = conn
+    return conn
+
+  def write(self, records: Sequence[Record]) -> None:
+    turns, runs = [], []
+    counts: Counter = Counter()
+    # (session_id, stage, dim, hour) candidates; only first reaches are counted
+    reached: Dict[Tuple[str, str, str], int] = {}
+    for kind, ts, fields in records:
+      hour = int(ts // 3600)
+      if kind == "turn":
+        session_id, state, intent, confidence, action, lab_tool = fields
+        turns.append((ts, session_id, _text(state), _text(intent), confidence, _text(action), _text(lab_tool)))
+        counts[(hour, "turns", _text(intent) or "")] += 1
+        reached.setdefault((session_id, "chat_started", ""), hour)
+        if action == "open_lab_tool":
+          reached.setdefault((session_id, "lab_offered", ANY_TOOL), hour)
+          reached.setdefault((session_id, "lab_offered", _text(lab_tool) or "unknown"), hour)
+        elif action == "escalate_human":
+          reached.setdefault((session_id, "escalated", ""), hour)
+      else:
+        tool, session_id, result = fields
+        score, tier = lab_summary(result)
+        scores = result.get("scores") if isinstance(result, dict) else None
+        runs.append((ts, session_id, tool, score, tier, json.dumps(scores, separators=(",", ":")) if scores else None))
+        counts[(hour, "lab_runs", tool)] += 1
+        if session_id:
+          reached.setdefault((session_id, "lab_run", ANY_TOOL), hour)
+          reached.setdefault((session_id, "lab_run", tool), hour)
+
+    with self._conn() as conn:
+      if turns:
+        conn.executemany("INSERT INTO turns VALUES (?, ?, ?, ?, ?, ?, ?)", turns)
+      if runs:
+        conn.executemany("INSERT INTO lab_runs VALUES (?, ?, ?, ?, ?, ?)", runs)
+      insert = "INSERT OR IGNORE INTO session_stages VALUES (?, ?, ?, ?)"
+      # A lab run only counts toward the funnel for a session that started a
+      # chat: the widget assigns its session id on page load, so visitors who
+      # never chat still send one with their lab runs.
+      insert_lab_run = (
+        "INSERT OR IGNORE INTO session_stages SELECT ?, ?, ?, ?"
+        " WHERE EXISTS (SELECT 1 FROM session_stages"
+        " WHERE session_id = ? AND stage = 'chat_started' AND dim = '')"
+      )
+      lab_runs = []
+      for (session_id, stage, dim), hour in reached.items():
+        if stage == "lab_run":
+          lab_runs.append((session_id, stage, dim, hour))
+        elif conn.execute(insert, (session_id, stage, dim, hour)).rowcount:
+          counts[(hour, stage, dim)] += 1
+      # After the other stages, so a chat started in this same batch counts
+      for session_id, stage, dim, hour in lab_runs:
+        if conn.execute(insert_lab_run, (session_id, stage, dim, hour, session_id)).rowcount:
+          counts[(hour, stage, dim)] += 1
+      daily: Counter = Counter()
+      for (hour, stage, dim), n in counts.items():
+        daily[(hour // 24, stage, dim)] += n
+      for table, key, rollup in (("funnel_hourly", "hour", counts), ("funnel_daily", "day", daily)):
+        conn.executemany(
+          f"INSERT INTO {table} VALUES (?, ?, ?, ?)"
+          f" ON CONFLICT ({key}, stage, dim) DO UPDATE SET n = n + excluded.n",
+          [(at, stage, dim, n) for (at, stage, dim), n in rollup.items()],
+        )
+
+  def counts(self) -> Dict[str, int]:
+    conn = self._conn()
+    return {
+      table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+      for table in ("turns", "lab_runs", "session_stages", "funnel_hourly", "funnel_daily")
+    }
+
+  def funnel(
+    self,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    bucket: Optional[str] = None,
+    tool: Optional[str] = None,
+  ) -> Dict[str, Any]:
+    """Funnel totals (and per-bucket series) from the rollups.
+
+    `since` / `until` are epoch seconds, rounded down to the hour; `bucket`
+    is hour, day or week (None for totals only); `tool` narrows the lab
+    stages to one lab. Conversion is each stage over chat_started.
+    Raises ValueError for an unknown bucket.
+    """
+    if bucket is not None and bucket not in BUCKETS:
+      raise ValueError(f"bucket must be one of {tuple(BUCKETS)}; got {bucket!r}")
+    width = BUCKETS[bucket] if bucket else 0
+    lo = None if since is None else int(since // 3600)
+    hi = None if until is None else int(until // 3600)
+    # (table, hours per row, lo, hi) ranges covering [lo, hi)
+    parts: List[Tuple[str, int, Optional[int], Optional[int]]] = []
+    day_lo = None if lo is None else -(-lo // 24)
+    day_hi = None if hi is None else hi // 24
+    if bucket == "hour" or (day_lo is not None and day_hi is not None and day_lo >= day_hi):
+      parts.append(("funnel_hourly", 1, lo, hi))
+    else:
+      parts.append(("funnel_daily", 24, day_lo, day_hi))
+      if lo is not None and lo < day_lo * 24:
+        parts.append(("funnel_hourly", 1, lo, day_lo * 24))
+      if hi is not None and day_hi * 24 < hi:
+        parts.append(("funnel_hourly", 1, day_hi * 24, hi))
+
+    selects, params = [], []
+    for table, per, part_lo, part_hi in parts:
+      key = "hour" if per == 1 else "day"
+      where = []
+      if part_lo is not None:
+        where.append(f"{key} >= ?")
+        params.append(part_lo)
+      if part_hi is not None:
+        where.append(f"{key} < ?")
+        params.append(part_hi)
+      if tool is not None:
+        where.append("(stage NOT IN ('lab_offered', 'lab_run', 'lab_runs') OR dim = ?)")
+        params.append(tool)
+      start = f"({key} / {width // per}) * {width * 3600}" if width else "0"
+      selects.append(
+        f"SELECT {start} AS start, stage, dim, SUM(n) FROM {table}"
+        + (f" WHERE {' AND '.join(where)}" if where else "")
+        + " GROUP BY start, stage, dim"
+      )
+    sql = " UNION ALL ".join(selects) + " ORDER BY start"
+    # Lab stage totals come from the any-tool rows unless one tool was asked for
+    total_dim = ANY_TOOL if tool is None else tool
+
+    stages = FUNNEL_STAGES + VOLUME_STAGES
+    totals: Dict[str, int] = dict.fromkeys(stages, 0)
+    by_tool: Dict[str, Dict[str, int]] = {}
+    series: Dict[int, Dict[str, int]] = {}
+    for start_ts, stage, dim, n in self._conn().execute(sql, params):
+      if stage in LAB_STAGES or stage == "lab_runs":
+        if dim != ANY_TOOL:
+          tools = by_tool.setdefault(dim, {"lab_offered": 0, "lab_run": 0, "lab_runs": 0})
+          tools[stage] += n
+        if stage in LAB_STAGES and dim != total_dim:
+          continue
+      totals[stage] += n
+      if width:
+        point = series.setdefault(start_ts, {"start": start_ts, **dict.fromkeys(stages, 0)})
+        point[stage] += n
+
+    started = totals["chat_started"]
+    conversion = {
+      stage: round(totals[stage] / started, 4) if started else None for stage in FUNNEL_STAGES[1:]
+    }
+    result: Dict[str, Any] = {
+      "since": since,
+      "until": until,
+      "tool": tool,
+      "totals": totals,
+      "conversion": conversion,
+      "by_tool": by_tool,
+    }
+    if width:
+      result["bucket"] = bucket
+      result["series"] = list(series.values())
+    return result
+
+
+class AnalyticsLog:
+  """Conversation analytics ingestion: record_*() buffer, a writer thread persists."""
+
+  def __init__(self, store: AnalyticsStore, max_batch: int = 1_000, max_delay: float = 1.0,
+               capacity: int = 100_000) -> None:
+    self.store = store
+    self.writer: BatchWriter[Record] = BatchWriter(
+      store.write, capacity=capacity, max_batch=max_batch, max_delay=max_delay, name="analytics-writer",
+    )
+
+  def record_turn(self, session_id: str, state: Optional[str], intent: Optional[str],
+                  confidence: Optional[float], action: Optional[str], lab_tool: Optional[str] = None) -> None:
+    self.writer.submit(("turn", time.time(), (session_id, state, intent, confidence, action, lab_tool)))
+
+  def record_lab_run(self, tool: str, session_id: Optional[str], result: Dict[str, Any]) -> None:
+    # Score / tier are pulled out of the result on the writer thread
+    self.writer.submit(("lab_run", time.time(), (tool, session_id or None, result)))
+
+  def start(self) -> None:
+    self.writer.start()
+
+  def stop(self) -> None:
+    self.writer.stop()
+
+  def stats(self) -> Dict[str, Any]:
+    return {"path": self.store.path, **self.writer.stats()}
+
+
+def create_analytics_log_from_env() -> AnalyticsLog:
+  """
+  ANALYTICS_DB_PATH           SQLite file (default data/analytics.db)
+  ANALYTICS_FLUSH_ROWS        records per write batch (default 1000)
+  ANALYTICS_FLUSH_SECONDS     max delay before buffered records are written (default 1)
+  ANALYTICS_BUFFER_ROWS       ring buffer size; oldest records are dropped beyond it (default 100000)
+  """
+  return AnalyticsLog(
+    AnalyticsStore(os.getenv("ANALYTICS_DB_PATH", "data/analytics.db")),
+    max_batch=int(os.getenv("ANALYTICS_FLUSH_ROWS", 1_000)),
+    max_delay=float(os.getenv("ANALYTICS_FLUSH_SECONDS", 1)),
+    capacity=int(os.getenv("ANALYTICS_BUFFER_ROWS", 100_000)),
+  )
@@ -1,24 +1,44 @@
 
 from typing import Dict, List
 
+import numpy as np
+
+from .batch_scoring import clamp, flags, lookup
+
+STAGE_WEIGHTS = {
+  "idea": 20,
+  "mvp": 40,
+  "early_revenue": 55,
+  "growth": 75,
+  "scaleup": 85,
+}
+
+FREQ_WEIGHTS = {
+  "ad_hoc": -15,
+  "monthly": 0,
+  "biweekly": 10,
+  "weekly": 20,
+  "daily": 25,
+}
+
+TESTING_WEIGHTS = {
+  "none": 0,
+  "low": 15,
+  "medium": 30,
+  "high": 45,
+}
+
+ANALYTICS_WEIGHTS = {
+  "none": 0,
+  "basic": 15,
+  "intermediate": 30,
+  "advanced": 45,
+}
+
+
 def _score_product(stage: str, release_freq: str) -> int:
-  score = 50
-  stage_weights = {
-    "idea": 20,
-    "mvp": 40,
-    "early_revenue": 55,
-    "growth": 75,
-    "scaleup": 85,
-  }
-  freq_weights = {
-    "ad_hoc": -15,
-    "monthly": 0,
-    "biweekly": 10,
-    "weekly": 20,
-    "daily": 25,
-  }
-  score = stage_weights.get(stage, 40)
-  score += freq_weights.get(release_freq, 0)
+  score = STAGE_WEIGHTS.get(stage, 40)
+  score += FREQ_WEIGHTS.get(release_freq, 0)
   return max(0, min(100, score))
 
 
@@ -26,13 +46,7 @@ def _score_engineering(ci_cd: bool, testing: str) -> int:
   base = 30
   if ci_cd:
     base += 25
-  testing_weights = {
-    "none": 0,
-    "low": 15,
-    "medium": 30,
-    "high": 45,
-  }
-  base += testing_weights.get(testing, 10)
+  base += TESTING_WEIGHTS.get(testing, 10)
   return max(0, min(100, base))
 
 
@@ -40,13 +54,7 @@ def _score_data_ai(data_centralized: bool, analytics: str) -> int:
   base = 20
   if data_centralized:
     base += 25
-  analytics_weights = {
-    "none": 0,
-    "basic": 15,
-    "intermediate": 30,
-    "advanced": 45,
-  }
-  base += analytics_weights.get(analytics, 10)
+  base += ANALYTICS_WEIGHTS.get(analytics, 10)
   return max(0, min(100, base))
 
 
@@ -119,3 +127,36 @@ def run_audit(payload: dict) -> dict:
     "scores": scores,
     "recommendations": recs,
   }
+
+
+def score_audit_batch(payloads: List[dict]) -> Dict[str, np.ndarray]:
+  """Audit scores for many payloads as NumPy columns (enum fields -> integer codes)."""
+  product = clamp(
+    lookup((p.get("product_stage", "") for p in payloads), STAGE_WEIGHTS, 40)
+    + lookup((p.get("release_freq", "") for p in payloads), FREQ_WEIGHTS, 0)
+  )
+  engineering = clamp(
+    30
+    + 25 * flags(p.get("ci_cd", False) for p in payloads)
+    + lookup((p.get("testing", "low") for p in payloads), TESTING_WEIGHTS, 10)
+  )
+  data_ai = clamp(
+    20
+    + 25 * flags(p.get("data_centralized", False) for p in payloads)
+    + lookup((p.get("analytics", "basic") for p in payloads), ANALYTICS_WEIGHTS, 10)
+  )
+  return {"product": product, "engineering": engineering, "data_ai": data_ai}
+
+
+def run_audit_batch(payloads: List[dict]) -> List[dict]:
+  """run_audit over many payloads, identical results; scores come from score_audit_batch."""
+  columns = score_audit_batch(payloads)
+  results = []
+  rows = zip(columns["product"].tolist(), columns["engineering"].tolist(), columns["data_ai"].tolist())
+  for payload, row in zip(payloads, rows):
+    scores = {"product": row[0], "engineering": row[1], "data_ai": row[2]}
+    results.append({
+      "scores": scores,
+      "recommendations": _build_recommendations(scores, payload.get("pain_points", []) or []),
+    })
+  return results
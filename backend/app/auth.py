@@ -1,11 +1,16 @@
 # app/auth.py
+import hashlib
+import hmac
 import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Header
 from fastapi.security import OAuth2PasswordRequestForm
-from jose import JWTError, jwt
+from jose import ExpiredSignatureError, JWTError, jwk, jwt
 from pydantic import BaseModel
 
 SECRET_KEY = os.getenv("AMEOTECH_AUTH_SECRET", "CHANGE_ME_SUPER_SECRET")
@@ -18,6 +23,158 @@ ADMIN_PASSWORD = os.getenv("AMEOTECH_ADMIN_PASSWORD", "Cool@coder1")  # change i
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+def key_id(secret: str) -> str:
+    """
+    Id of a signing secret, sent as the JWT `kid` header: an HMAC keyed by the
+    secret rather than a plain hash of it. Only shown to admins and token
+    holders, who could already test guesses against a token's signature.
+    """
+    return hmac.new(secret.encode(), b"ameotech-auth-kid", hashlib.sha256).hexdigest()[:16]
+
+
+class TokenVerifier:
+    """
+    Verifies bearer JWTs and caches the claims of good ones until they expire.
+
+    Keys: the first secret signs new tokens; the rest are still accepted, so a
+    secret can be rotated without logging everyone out. HMAC key objects are
+    built once per secret, not per request, and a token's `kid` header picks
+    its key directly (tokens without one are tried against every key).
+
+    Cache: up to `max_entries` verified tokens, keyed by the SHA-256 of the
+    token (the token itself is not kept), least recently used evicted first.
+    A hit is only honored until the token's `exp`. Changing the keys clears
+    the cache, so tokens signed with a dropped key stop working at once.
+    max_entries=0 disables the cache.
+    """
+
+    def __init__(self, secrets: Sequence[str], algorithm: str = ALGORITHM, max_entries: int = 1024) -> None:
+        self.algorithm = algorithm
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._counts: Dict[str, int] = {"hits": 0, "misses": 0, "expired": 0, "invalid": 0}
+        self.set_keys(secrets)
+
+    def set_keys(self, secrets: Sequence[str]) -> None:
+        secrets = [s for s in secrets if s]
+        if not secrets:
+            raise ValueError("at least one signing secret is required")
+        keys = {key_id(s): jwk.construct(s, self.algorithm) for s in secrets}
+        with self._lock:
+            self._secrets = secrets
+            self._keys = keys
+            self._all_keys: List[Any] = list(keys.values())
+            self._cache.clear()
+
+    def rotate(self, secret: str, keep: int = 1) -> None:
+        """Sign with `secret` from now on; the newest `keep` old secrets stay valid."""
+        self.set_keys([secret] + [s for s in self._secrets if s != secret][:keep])
+
+    def sign(self, claims: Dict[str, Any]) -> str:
+        secret = self._secrets[0]
+        return jwt.encode(claims, secret, algorithm=self.algorithm, headers={"kid": key_id(secret)})
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        """Claims of a valid token; raises JWTError (ExpiredSignatureError once expired)."""
+        digest = hashlib.sha256(token.encode()).digest()
+        now = time.time()
+        with self._lock:
+            entry = self._cache.get(digest)
+            if entry is not None:
+                if now < entry[0]:
+                    self._cache.move_to_end(digest)
+                    self._counts["hits"] += 1
+                    return entry[1]
+                del self._cache[digest]
+                self._counts["expired"] += 1
+                raise ExpiredSignatureError("Signature has expired.")
+            self._counts["misses"] += 1
+            keys, all_keys = self._keys, self._all_keys
+
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+            claims = jwt.decode(token, keys.get(kid) or all_keys, algorithms=[self.algorithm])
+        except JWTError:
+            with self._lock:
+                self._counts["invalid"] += 1
+            raise
+
+        exp = claims.get("exp")
+        if self.max_entries > 0 and isinstance(exp, (int, float)):
+            with self._lock:
+                # Skip the insert if the keys changed while we were decoding
+                if keys is self._keys:
+                    self._cache[digest] = (float(exp), claims)
+                    if len(self._cache) > self.max_entries:
+                        self._cache.popitem(last=False)
+        return claims
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "keys": list(self._keys),
+                "signing_kid": key_id(self._secrets[0]),
+                "cached": len(self._cache),
+                "max_entries": self.max_entries,
+                **self._counts,
+            }
+
+
+def create_token_verifier_from_env() -> TokenVerifier:
+    """
+    AMEOTECH_AUTH_SECRET              signs new tokens
+    AMEOTECH_AUTH_PREVIOUS_SECRETS    comma-separated secrets still accepted (key rotation)
+    AUTH_TOKEN_CACHE_SIZE             verified tokens cached until their exp (default 1024, 0 disables)
+    """
+    previous = [s.strip() for s in os.getenv("AMEOTECH_AUTH_PREVIOUS_SECRETS", "").split(",")]
+    return TokenVerifier(
+        [SECRET_KEY] + previous,
+        max_entries=int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "1024")),
+    )
+
+
+TOKEN_VERIFIER = create_token_verifier_from_env()
+
+
+def token_role(claims: Dict[str, Any]) -> Optional[str]:
+    role = claims.get("role")
+    if role is None and claims.get("is_admin"):
+        return "admin"
+    return role
+
+
+class RequireRole:
+    """
+    FastAPI dependency: `Authorization: Bearer <jwt>` whose role is one of `roles`.
+    Returns the token claims; 401 for a missing/invalid/expired token, 403 for
+    the wrong role. One instance is shared by every route that needs it.
+    Async so FastAPI runs it on the event loop: a cache hit is a hash and a
+    dict lookup, cheaper than the threadpool hop a plain `def` would cost.
+    """
+
+    def __init__(self, *roles: str, verifier: TokenVerifier = TOKEN_VERIFIER) -> None:
+        self.roles = frozenset(roles)
+        self.verifier = verifier
+
+    async def __call__(self, authorization: Optional[str] = Header(default=None)) -> Dict[str, Any]:
+        if not authorization or authorization[:7].lower() != "bearer ":
+            raise HTTPException(status_code=401, detail="Not authenticated",
+                                headers={"WWW-Authenticate": "Bearer"})
+        try:
+            claims = self.verifier.verify(authorization[7:].strip())
+        except JWTError:
+            raise HTTPException(status_code=401, detail="Invalid token",
+                                headers={"WWW-Authenticate": "Bearer"})
+        if token_role(claims) not in self.roles:
+            raise HTTPException(status_code=403, detail="Not enough permissions")
+        return claims
+
+
+require_admin = RequireRole("admin")
+require_content_editor = RequireRole("admin", "content_editor")
+
+
 class Token(BaseModel):
     access_token: str
     token_type: str = "bearer"
@@ -27,8 +184,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     to_encode = data.copy()
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    return TOKEN_VERIFIER.sign(to_encode)
 
 
 @router.post("/login", response_model=Token)
@@ -37,5 +193,5 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
     if form_data.username.lower() != ADMIN_EMAIL.lower() or form_data.password != ADMIN_PASSWORD:
         raise HTTPException(status_code=401, detail="Incorrect email or password")
 
-    access_token = create_access_token({"sub": form_data.username, "is_admin": True})
+    access_token = create_access_token({"sub": form_data.username, "is_admin": True, "role": "admin"})
     return Token(access_token=access_token)
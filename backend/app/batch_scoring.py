@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Sequence
+
+import numpy as np
+
+
+def encode(values: Iterable[Any], vocabulary: Sequence[str]) -> np.ndarray:
+  """Integer codes over `vocabulary`; anything else (incl. unhashable) -> len(vocabulary)."""
+  codes_of = {v: i for i, v in enumerate(vocabulary)}
+  unknown = len(vocabulary)
+
+  def code(value: Any) -> int:
+    try:
+      return codes_of.get(value, unknown)
+    except TypeError:
+      return unknown
+
+  return np.fromiter(map(code, values), dtype=np.intp)
+
+
+def lookup(values: Iterable[Any], mapping: Dict[str, int], default: int) -> np.ndarray:
+  """mapping.get(value, default) for every value, as an int64 array."""
+  table = np.array([*mapping.values(), default], dtype=np.int64)
+  return table[encode(values, list(mapping))]
+
+
+def flags(values: Iterable[Any]) -> np.ndarray:
+  """Truthiness of every value, as a 0/1 int64 array."""
+  return np.fromiter((1 if v else 0 for v in values), dtype=np.int64)
+
+
+def membership(selections: Iterable[Any], signals: Dict[str, int]) -> np.ndarray:
+  """(rows, signals) 0/1 matrix of `signal in selection`, columns in `signals` order."""
+  names = list(signals)
+  rows: List[List[int]] = [[1 if name in selected else 0 for name in names] for selected in selections]
+  return np.array(rows, dtype=np.int64).reshape(len(rows), len(names))
+
+
+def clamp(values: np.ndarray, minimum: int = 0, maximum: int = 100) -> np.ndarray:
+  return np.minimum(np.maximum(values, minimum), maximum)
+
+
+def truncate(values: np.ndarray) -> np.ndarray:
+  """int() of every float (truncation toward zero), as int64."""
+  return np.trunc(values).astype(np.int64)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, Generic, List, TypeVar
+
+T = TypeVar("T")
+
+
+class BatchWriter(Generic[T]):
+  """Ring buffer in front of a slow sink, flushed by a background thread.
+
+  `submit()` is what request handlers call: one deque.append, which is
+  atomic under the GIL, so producers take no lock and never touch disk.
+  The deque is bounded (`capacity`); when the writer falls behind, the
+  oldest items are overwritten and counted as dropped.
+
+  The writer thread hands the sink batches of up to `max_batch` items,
+  whenever `max_batch` items are waiting or `max_delay` seconds have passed
+  since the last flush, and once more on stop().
+  """
+
+  def __init__(
+    self,
+    sink: Callable[[List[T]], None],
+    capacity: int = 100_000,
+    max_batch: int = 1_000,
+    max_delay: float = 1.0,
+    name: str = "batch-writer",
+  ) -> None:
+    self.sink = sink
+    self.capacity = capacity
+    self.max_batch = max_batch
+    self.max_delay = max_delay
+    self.name = name
+    self._ring: Deque[T] = deque(maxlen=capacity)
+    self._wake = threading.Event()
+    self._stopping = False
+    self._thread: threading.Thread | None = None
+    # Written by producers without a lock; approximate under contention
+    self._submitted = 0
+    self._dropped = 0
+    self._counts: Dict[str, int] = {"flushed": 0, "batches": 0, "sink_errors": 0}
+    self._lock = threading.Lock()
+
+  def submit(self, item: T) -> None:
+    ring = self._ring
+    if len(ring) == self.capacity:
+      self._dropped += 1
+    ring.append(item)
+    self._submitted += 1
+    if len(ring) >= self.max_batch:
+      self._wake.set()
+
+  def start(self) -> None:
+    if self._thread is not None and self._thread.is_alive():
+      return
+    self._stopping = False
+    self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+    self._thread.start()
+
+  def stop(self, timeout: float = 10.0) -> None:
+    """Flush everything buffered, then stop the thread."""
+    if self._thread is None:
+      return
+    self._stopping = True
+    self._wake.set()
+    self._thread.join(timeout)
+    self._thread = None
+
+  def _take(self) -> List[T]:
+    ring = self._ring
+    batch: List[T] = []
+    try:
+      while len(batch) < self.max_batch:
+        batch.append(ring.popleft())
+    except IndexError:
+      pass
+    return batch
+
+  def flush(self) -> int:
+    """Drain the buffer into the sink (writer thread, or callers in tests/benchmarks)."""
+    total = 0
+    while True:
+      batch = self._take()
+      if not batch:
+        return total
+      try:
+        self.sink(batch)
+      except Exception as exc:  # keep the writer alive; the batch is lost
+        with self._lock:
+          self._counts["sink_errors"] += 1
+        print(f"[{self.name.upper()}-ERROR]", exc)
+        continue
+      total += len(batch)
+      with self._lock:
+        self._counts["flushed"] += len(batch)
+        self._counts["batches"] += 1
+
+  def _run(self) -> None:
+    while not self._stopping:
+      self._wake.wait(self.max_delay)
+      self._wake.clear()
+      self.flush()
+    self.flush()
+
+  def stats(self) -> Dict[str, int | bool]:
+    with self._lock:
+      counts = dict(self._counts)
+    return {
+      "running": self._thread is not None and self._thread.is_alive(),
+      "buffered": len(self._ring),
+      "capacity": self.capacity,
+      "submitted": self._submitted,
+      "dropped": self._dropped,
+      **counts,
+    }
@@ -1,65 +1,77 @@
 from typing import Dict, List
 
+import numpy as np
+
+from .batch_scoring import lookup
+
+PROJECT_TYPE_COMPLEXITY = {
+  "Pricing / Forecasting / Optimization": 90,
+  "Add AI to existing system": 80,
+  "Modernize legacy platform": 75,
+  "Data engineering / warehouse": 70,
+  "Build a new product": 60,
+  "Workflow automation": 45,
+}
+
+URGENCY_SCORES = {
+  "4-6": 90,
+  "8-12": 60,
+  "future": 20,
+}
+
+TEAM_SCORES = {
+  "none": 20,
+  "small": 40,
+  "strong": 70,
+  "mature": 90,
+}
+
+BUDGET_SCORES = {
+  "exploring": 20,
+  "5-10": 40,
+  "10-20": 60,
+  "20-40": 80,
+  "40+": 100,
+}
+
+# In determine_model's order of precedence
+MODELS = (
+  "Discovery Sprint Only",
+  "AI Pod Retainer",
+  "Hybrid (Sprint → Pod)",
+  "Discovery Sprint → Fixed Project",
+)
+
+TIMELINES = ("4–6 weeks", "8–12 weeks", "Flexible")
+
 
 def score_complexity(types: List[str]) -> int:
   m = 0
   for t in types:
-    t = t.strip()
-    if t == "Pricing / Forecasting / Optimization":
-      m = max(m, 90)
-    elif t == "Add AI to existing system":
-      m = max(m, 80)
-    elif t == "Modernize legacy platform":
-      m = max(m, 75)
-    elif t == "Data engineering / warehouse":
-      m = max(m, 70)
-    elif t == "Build a new product":
-      m = max(m, 60)
-    elif t == "Workflow automation":
-      m = max(m, 45)
-    else:
-      m = max(m, 50)
+    m = max(m, PROJECT_TYPE_COMPLEXITY.get(t.strip(), 50))
   return m
 
 
 def score_urgency(u: str) -> int:
-  mapping = {
-    "4-6": 90,
-    "8-12": 60,
-    "future": 20,
-  }
-  return mapping.get(u, 20)
+  return URGENCY_SCORES.get(u, 20)
 
 
 def score_team(t: str) -> int:
-  mapping = {
-    "none": 20,
-    "small": 40,
-    "strong": 70,
-    "mature": 90,
-  }
-  return mapping.get(t, 40)
+  return TEAM_SCORES.get(t, 40)
 
 
 def score_budget(b: str) -> int:
-  mapping = {
-    "exploring": 20,
-    "5-10": 40,
-    "10-20": 60,
-    "20-40": 80,
-    "40+": 100,
-  }
-  return mapping.get(b, 20)
+  return BUDGET_SCORES.get(b, 20)
 
 
 def determine_model(scores: Dict[str, int]) -> str:
   if scores["budget"] < 50:
-    return "Discovery Sprint Only"
+    return MODELS[0]
   if scores["complexity"] > 75 and scores["budget"] >= 80:
-    return "AI Pod Retainer"
+    return MODELS[1]
   if scores["urgency"] > 70:
-    return "Hybrid (Sprint → Pod)"
-  return "Discovery Sprint → Fixed Project"
+    return MODELS[2]
+  return MODELS[3]
 
 
 def determine_budget_band(model: str) -> str:
@@ -74,10 +86,10 @@ def determine_budget_band(model: str) -> str:
 
 def determine_timeline(scores: Dict[str, int]) -> str:
   if scores["urgency"] > 70:
-    return "4–6 weeks"
+    return TIMELINES[0]
   if scores["urgency"] > 40:
-    return "8–12 weeks"
-  return "Flexible"
+    return TIMELINES[1]
+  return TIMELINES[2]
 
 
 def build_plan(model: str) -> List[str]:
@@ -194,3 +206,59 @@ def run_estimator(payload: dict) -> dict:
     "plan": build_plan(model),
     "recommendations": build_recommendations(model, scores),
   }
+
+
+def score_estimator_batch(payloads: List[dict]) -> Dict[str, np.ndarray]:
+  """
+  Estimator scores for many payloads as NumPy columns, plus `model` and
+  `timeline` as indices into MODELS / TIMELINES.
+  """
+  # Complexity is a max over a variable-length list: score every project type
+  # of every payload in one array and reduce per payload.
+  types = [payload.get("project_types") or [] for payload in payloads]
+  counts = np.fromiter(map(len, types), dtype=np.intp, count=len(types))
+  flat = lookup((t.strip() for row in types for t in row), PROJECT_TYPE_COMPLEXITY, 50)
+  complexity = np.zeros(len(payloads), dtype=np.int64)
+  nonempty = counts > 0
+  if flat.size:
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    complexity[nonempty] = np.maximum.reduceat(flat, starts[nonempty])
+
+  urgency = lookup((p.get("urgency", "future") for p in payloads), URGENCY_SCORES, 20)
+  team = lookup((p.get("team", "small") for p in payloads), TEAM_SCORES, 40)
+  budget = lookup((p.get("budget", "exploring") for p in payloads), BUDGET_SCORES, 20)
+
+  model = np.select(
+    [budget < 50, (complexity > 75) & (budget >= 80), urgency > 70],
+    [0, 1, 2],
+    default=3,
+  )
+  timeline = np.select([urgency > 70, urgency > 40], [0, 1], default=2)
+  return {
+    "complexity": complexity,
+    "urgency": urgency,
+    "team": team,
+    "budget": budget,
+    "model": model,
+    "timeline": timeline,
+  }
+
+
+def run_estimator_batch(payloads: List[dict]) -> List[dict]:
+  """run_estimator over many payloads, identical results; scores come from score_estimator_batch."""
+  columns = score_estimator_batch(payloads)
+  names = ("complexity", "urgency", "team", "budget", "model", "timeline")
+  results = []
+  rows = zip(*(columns[name].tolist() for name in names))
+  for c, u, t, b, m, tl in rows:
+    scores = {"complexity": c, "urgency": u, "team": t, "budget": b}
+    name = MODELS[m]
+    results.append({
+      "model": name,
+      "budget": determine_budget_band(name),
+      "timeline": TIMELINES[tl],
+      "scores": scores,
+      "plan": build_plan(name),
+      "recommendations": build_recommendations(name, scores),
+    })
+  return results
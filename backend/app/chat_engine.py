@@ -1,32 +1,60 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from collections import deque
+from typing import Deque, Dict, List, Optional
+import os
+import sys
+import threading
+import time
 import uuid
-import datetime as dt
 
+from .chat_history import TranscriptLog
 from .schemas import SuggestedReply, ChatMessageResponse
 
 
-@dataclass
+# Messages kept per session; older ones fall off the ring buffer (and are
+# spilled to the transcript log, if enabled)
+MAX_HISTORY = 50
+
+
 class Message:
-  role: str  # 'user' | 'assistant'
-  content: str
-  created_at: dt.datetime = field(default_factory=lambda: dt.datetime.utcnow())
+  __slots__ = ("role", "content", "created_at")
+
+  def __init__(self, role: str, content: str, created_at: Optional[int] = None) -> None:
+    self.role = sys.intern(role)  # 'user' | 'assistant'
+    self.content = content
+    self.created_at = int(time.time()) if created_at is None else created_at  # epoch seconds
 
 
-@dataclass
 class SessionState:
-  id: str
-  stage: str = "intro"
-  created_at: dt.datetime = field(default_factory=lambda: dt.datetime.utcnow())
-  updated_at: dt.datetime = field(default_factory=lambda: dt.datetime.utcnow())
-  domain: Optional[str] = None
-  company_size: Optional[str] = None
-  urgency: Optional[str] = None
-  budget: Optional[str] = None
-  email: Optional[str] = None
-  messages: List[Message] = field(default_factory=list)
+  """Per-session chat state. Slotted and int-timestamped to keep RSS low."""
+
+  __slots__ = (
+    "id",
+    "stage",
+    "created_at",
+    "updated_at",
+    "domain",
+    "company_size",
+    "urgency",
+    "budget",
+    "email",
+    "messages",
+  )
+
+  def __init__(self, id: str, stage: str = "intro", history_limit: int = MAX_HISTORY) -> None:
+    now = int(time.time())
+    self.id = id
+    self.stage = sys.intern(stage)
+    self.created_at = now
+    self.updated_at = now
+    # Enum-like fields only ever hold string literals from the flow below
+    self.domain: Optional[str] = None
+    self.company_size: Optional[str] = None
+    self.urgency: Optional[str] = None
+    self.budget: Optional[str] = None
+    self.email: Optional[str] = None
+    self.messages: Deque[Message] = deque(maxlen=history_limit)
 
 
 class ChatEngine:
@@ -38,29 +66,62 @@ class ChatEngine:
   - Suggest quick-reply buttons so users can move fast.
   """
 
-  def __init__(self) -> None:
+  def __init__(
+    self,
+    history_window: int = MAX_HISTORY,
+    idle_ttl_seconds: float = 3600,
+    transcript: Optional[TranscriptLog] = None,
+    sweep_interval_seconds: float = 60,
+  ) -> None:
     self.sessions: Dict[str, SessionState] = {}
+    self.history_window = history_window
+    self.idle_ttl_seconds = idle_ttl_seconds
+    self.transcript = transcript or TranscriptLog(None)
+    self.sweep_interval_seconds = sweep_interval_seconds
+    self._last_sweep = time.time()
+    self._sweep_lock = threading.Lock()
 
   # Session management ----------------------------------------------------- #
 
   def create_session(self) -> SessionState:
+    self._maybe_sweep()
     session_id = str(uuid.uuid4())
-    session = SessionState(id=session_id)
+    session = SessionState(id=session_id, history_limit=self.history_window)
     self.sessions[session_id] = session
     return session
 
   def get_session(self, session_id: str) -> Optional[SessionState]:
     return self.sessions.get(session_id)
 
+  def sweep_idle(self, now: Optional[float] = None) -> int:
+    """Drop sessions idle for longer than idle_ttl_seconds, spilling their transcript."""
+    now = time.time() if now is None else now
+    with self._sweep_lock:
+      self._last_sweep = now
+      expired = [
+        sid for sid, s in list(self.sessions.items())
+        if now - s.updated_at > self.idle_ttl_seconds
+      ]
+      for sid in expired:
+        session = self.sessions.pop(sid, None)
+        if session is not None:
+          self._spill_session(session)
+      return len(expired)
+
+  def _maybe_sweep(self) -> None:
+    if time.time() - self._last_sweep >= self.sweep_interval_seconds:
+      self.sweep_idle()
+
   # Chat flow -------------------------------------------------------------- #
 
   def handle_message(self, session_id: str, message_text: str) -> ChatMessageResponse:
+    self._maybe_sweep()
     session = self.sessions.get(session_id)
     if not session:
-      session = self.create_session()
+      # Unknown or expired: the API maps this to 404 instead of leaking a new session
+      raise KeyError(session_id)
 
-    session.messages.append(Message(role="user", content=message_text))
-    session.updated_at = dt.datetime.utcnow()
+    self._append_message(session, "user", message_text)
 
     # Normalise input for simple keyword rules
     text_lower = message_text.lower().strip()
@@ -260,8 +321,31 @@ class ChatEngine:
   # Helpers ---------------------------------------------------------------- #
 
   def _add_bot_message(self, session: SessionState, content: str) -> None:
-    session.messages.append(Message(role="assistant", content=content))
-    session.updated_at = dt.datetime.utcnow()
+    self._append_message(session, "assistant", content)
+
+  def _append_message(self, session: SessionState, role: str, content: str) -> None:
+    history = session.messages
+    if history.maxlen is not None and len(history) == history.maxlen:
+      # Oldest turn is about to fall off the window
+      self.transcript.append([_message_record(session.id, history[0])])
+    history.append(Message(role=role, content=content))
+    session.updated_at = int(time.time())
+
+  def _spill_session(self, session: SessionState) -> None:
+    records = [_message_record(session.id, m) for m in session.messages]
+    records.append({
+      "event": "session_end",
+      "session_id": session.id,
+      "stage": session.stage,
+      "domain": session.domain,
+      "company_size": session.company_size,
+      "urgency": session.urgency,
+      "budget": session.budget,
+      "email": session.email,
+      "created_at": session.created_at,
+      "updated_at": session.updated_at,
+    })
+    self.transcript.append(records)
 
   def _compute_recommendation(self, session: SessionState) -> str:
     domain = session.domain or "other"
@@ -289,4 +373,18 @@ class ChatEngine:
     ]
 
 
-chat_engine = ChatEngine()
+def _message_record(session_id: str, message: Message) -> dict:
+  return {
+    "event": "message",
+    "session_id": session_id,
+    "role": message.role,
+    "content": message.content,
+    "created_at": message.created_at,
+  }
+
+
+chat_engine = ChatEngine(
+  history_window=int(os.getenv("CHAT_HISTORY_WINDOW", MAX_HISTORY)),
+  idle_ttl_seconds=float(os.getenv("CHAT_SESSION_IDLE_TTL_SECONDS", 3600)),
+  transcript=TranscriptLog(os.getenv("CHAT_TRANSCRIPT_PATH", "data/chat_transcripts.jsonl")),
+)
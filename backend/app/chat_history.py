@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import Iterator, Optional
+
+from .jsonl_log import JsonlLog
+
+
+class TranscriptLog(JsonlLog):
+  """Append-only JSONL transcript log for chat turns that leave memory.
+
+  ChatEngine keeps only a short window of messages per session; messages that
+  fall off the window and sessions swept for idleness are appended here so the
+  transcript survives without being held in RAM. `path=None` disables it.
+  """
+
+  def read(self, session_id: Optional[str] = None) -> Iterator[dict]:
+    """Stream records back (optionally for one session) without loading the file."""
+    if session_id is None:
+      return super().read()
+    return super().read(session_id=session_id)
@@ -1,106 +1,258 @@
 from __future__ import annotations
 
+import os
+import sqlite3
 import threading
+import time
 import uuid
-from typing import Dict, List, Optional
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from .schemas import ContentItem, ContentItemCreate, ContentStatus, ContentType
 
 
-class InMemoryContentStore:
-  def __init__(self) -> None:
-    self._items: Dict[str, ContentItem] = {}
-    self._lock = threading.Lock()
-    self._ensure_seed_data()
+class ContentStore(ABC):
+  """Interface used by the API layer; see InMemoryContentStore / SQLiteContentStore."""
 
-  def _ensure_seed_data(self) -> None:
-    # Seed a couple of case studies and a sample job so the UI has something to show
-    if self._items:
-      return
+  @property
+  @abstractmethod
+  def generation(self) -> int:
+    raise NotImplementedError
 
-    demo_items = [
-      ContentItem(
-        id=str(uuid.uuid4()),
-        type=ContentType.CASE_STUDY,
-        title="Dynamic Pricing at Enterprise Scale",
-        slug="dynamic-pricing-walmart",
-        excerpt="Large-scale dynamic pricing engine integrated with demand forecasting and competitive intelligence.",
-        body_rich=(
-          "Challenge: Manual pricing causing 2–3% margin loss monthly.\n"
-          "Solution: ML-driven pricing engine with explicit margin guardrails and elasticity-based price moves.\n"
-          "Result: 5–7% margin improvement across thousands of SKUs."
-        ),
-        tags=["Retail", "Pricing", "Enterprise"],
-        meta={},
-        status=ContentStatus.PUBLISHED,
+  @abstractmethod
+  def list_items(self, type: Optional[str] = None, status: Optional[str] = None) -> List[ContentItem]:
+    raise NotImplementedError
+
+  @abstractmethod
+  def get_by_slug(self, type: str, slug: str, status: Optional[str] = None) -> Optional[ContentItem]:
+    raise NotImplementedError
+
+  @abstractmethod
+  def get(self, id: str) -> Optional[ContentItem]:
+    raise NotImplementedError
+
+  @abstractmethod
+  def create(self, data: ContentItemCreate) -> ContentItem:
+    raise NotImplementedError
+
+  @abstractmethod
+  def update(self, id: str, data: ContentItemCreate) -> Optional[ContentItem]:
+    raise NotImplementedError
+
+  @abstractmethod
+  def set_status(self, id: str, status: str) -> Optional[ContentItem]:
+    raise NotImplementedError
+
+
+def _demo_items() -> List[ContentItem]:
+  # A couple of case studies and a sample job so the UI has something to show
+  return [
+    ContentItem(
+      id=str(uuid.uuid4()),
+      type=ContentType.CASE_STUDY,
+      title="Dynamic Pricing at Enterprise Scale",
+      slug="dynamic-pricing-walmart",
+      excerpt="Large-scale dynamic pricing engine integrated with demand forecasting and competitive intelligence.",
+      body_rich=(
+        "Challenge: Manual pricing causing 2–3% margin loss monthly.\n"
+        "Solution: ML-driven pricing engine with explicit margin guardrails and elasticity-based price moves.\n"
+        "Result: 5–7% margin improvement across thousands of SKUs."
       ),
-      ContentItem(
-        id=str(uuid.uuid4()),
-        type=ContentType.CASE_STUDY,
-        title="Demand Forecasting & Inventory Optimization",
-        slug="demand-forecasting-wwe",
-        excerpt="Forecast-driven inventory and supply planning for a global entertainment brand.",
-        body_rich=(
-          "Challenge: Overstock on seasonal inventory and inconsistent demand prediction.\n"
-          "Solution: Hierarchical forecasting models feeding supply chain planning.\n"
-          "Result: 18% reduction in overstock and improved cash flow."
-        ),
-        tags=["Entertainment", "Forecasting"],
-        meta={},
-        status=ContentStatus.PUBLISHED,
+      tags=["Retail", "Pricing", "Enterprise"],
+      meta={},
+      status=ContentStatus.PUBLISHED,
+    ),
+    ContentItem(
+      id=str(uuid.uuid4()),
+      type=ContentType.CASE_STUDY,
+      title="Demand Forecasting & Inventory Optimization",
+      slug="demand-forecasting-wwe",
+      excerpt="Forecast-driven inventory and supply planning for a global entertainment brand.",
+      body_rich=(
+        "Challenge: Overstock on seasonal inventory and inconsistent demand prediction.\n"
+        "Solution: Hierarchical forecasting models feeding supply chain planning.\n"
+        "Result: 18% reduction in overstock and improved cash flow."
       ),
-      ContentItem(
-        id=str(uuid.uuid4()),
-        type=ContentType.JOB_POST,
-        title="Senior Backend Engineer (.NET / Python)",
-        slug="senior-backend-engineer",
-        excerpt="Work on applied AI systems: pricing engines, forecasting, and high-scale data pipelines.",
-        body_rich=(
-          "You will design and build backend services for pricing, forecasting, and data pipelines.\n"
-          "You should be comfortable owning architecture, code quality, and mentoring other engineers."
-        ),
-        tags=["Engineering"],
-        meta={
-          "location": "Remote / India",
-          "employment_type": "Full-time",
-          "experience_level": "Senior",
-          "apply_email": "careers@ameotech.com",
-        },
-        status=ContentStatus.PUBLISHED,
+      tags=["Entertainment", "Forecasting"],
+      meta={},
+      status=ContentStatus.PUBLISHED,
+    ),
+    ContentItem(
+      id=str(uuid.uuid4()),
+      type=ContentType.JOB_POST,
+      title="Senior Backend Engineer (.NET / Python)",
+      slug="senior-backend-engineer",
+      excerpt="Work on applied AI systems: pricing engines, forecasting, and high-scale data pipelines.",
+      body_rich=(
+        "You will design and build backend services for pricing, forecasting, and data pipelines.\n"
+        "You should be comfortable owning architecture, code quality, and mentoring other engineers."
       ),
-    ]
+      tags=["Engineering"],
+      meta={
+        "location": "Remote / India",
+        "employment_type": "Full-time",
+        "experience_level": "Senior",
+        "apply_email": "careers@ameotech.com",
+      },
+      status=ContentStatus.PUBLISHED,
+    ),
+  ]
+
+
+class _Snapshot:
+  """Immutable, fully indexed view of the store.
+
+  - (type, slug)   -> ids   (get_by_slug is O(1))
+  - (type, status) -> ids   (list pages are O(result))
+
+  Index buckets are dicts used as insertion-ordered sets; results are
+  returned in item creation order (`seq`). Writers never touch a published
+  snapshot: `with_items` copies what it changes and returns a new one.
+  """
+
+  __slots__ = ("items", "seq", "next_seq", "by_slug", "by_type_status", "generation")
+
+  def __init__(
+    self,
+    items: Dict[str, ContentItem],
+    seq: Dict[str, int],
+    next_seq: int,
+    by_slug: Dict[Tuple[str, str], Dict[str, None]],
+    by_type_status: Dict[Tuple[str, str], Dict[str, None]],
+    generation: int,
+  ) -> None:
+    self.items = items
+    self.seq = seq
+    self.next_seq = next_seq
+    self.by_slug = by_slug
+    self.by_type_status = by_type_status
+    self.generation = generation
+
+  @classmethod
+  def empty(cls) -> "_Snapshot":
+    return cls({}, {}, 0, {}, {}, 0)
+
+  def with_items(self, changes: Iterable[Tuple[ContentItem, Optional[int]]], generation: int) -> "_Snapshot":
+    """Copy-on-write: insert or replace items (keeping creation order unless a seq is given)."""
+    items = dict(self.items)
+    seq = dict(self.seq)
+    next_seq = self.next_seq
+    by_slug = dict(self.by_slug)
+    by_type_status = dict(self.by_type_status)
+    copied = set()
+
+    def bucket(index: Dict, name: str, key: Tuple[str, str]) -> Dict[str, None]:
+      current = index.get(key)
+      if (name, key) not in copied or current is None:
+        current = dict(current) if current else {}
+        index[key] = current
+        copied.add((name, key))
+      return current
+
+    def unindex(index: Dict, name: str, key: Tuple[str, str], item_id: str) -> None:
+      if key in index:
+        b = bucket(index, name, key)
+        b.pop(item_id, None)
+        if not b:
+          del index[key]
+
+    for item, item_seq in changes:
+      existing = items.get(item.id)
+      if existing is not None:
+        unindex(by_slug, "slug", (existing.type, existing.slug), item.id)
+        unindex(by_type_status, "status", (existing.type, existing.status), item.id)
+      if item_seq is not None:
+        seq[item.id] = item_seq
+        next_seq = max(next_seq, item_seq + 1)
+      elif existing is None:
+        seq[item.id] = next_seq
+        next_seq += 1
+      items[item.id] = item
+      bucket(by_slug, "slug", (item.type, item.slug))[item.id] = None
+      bucket(by_type_status, "status", (item.type, item.status))[item.id] = None
+
+    return _Snapshot(items, seq, next_seq, by_slug, by_type_status, generation)
 
-    for item in demo_items:
-      self._items[item.id] = item
+  def ordered(self, ids: Iterable[str]) -> List[ContentItem]:
+    return [self.items[i] for i in sorted(ids, key=self.seq.__getitem__)]
+
+
+class InMemoryContentStore(ContentStore):
+  """Content items with secondary indexes and a lock-free read path.
+
+  Readers grab the current `_Snapshot` (a single attribute read) and never
+  take a lock, so public reads neither serialize behind each other nor
+  behind admin writes. Writers serialize on `_write_lock`, build a new
+  snapshot and publish it by swapping the attribute.
+
+  `generation` is bumped by every write so callers can cache anything
+  derived from the store (see response_cache.ResponseCache).
+  """
+
+  def __init__(self) -> None:
+    self._write_lock = threading.RLock()
+    self._snapshot = _Snapshot.empty()
+    self._ensure_seed_data()
+
+  @property
+  def generation(self) -> int:
+    return self._snapshot.generation
+
+  # Backend hooks ------------------------------------------------------------
+
+  def _refresh(self, force: bool = False) -> None:
+    """Pull writes made elsewhere (other processes). Nothing to do in memory."""
+
+  def _commit(self, items: List[ContentItem]) -> None:
+    # Caller holds _write_lock. One new snapshot per call, so batch where possible:
+    # publishing copies the outer dicts (O(items)) and the touched buckets.
+    snapshot = self._snapshot
+    self._snapshot = snapshot.with_items([(item, None) for item in items], snapshot.generation + 1)
+
+  def _ensure_seed_data(self) -> None:
+    with self._write_lock:
+      if not self._snapshot.items:
+        self._commit(_demo_items())
+
+  # ContentStore --------------------------------------------------------------
 
   def list_items(
     self,
     type: Optional[str] = None,
     status: Optional[str] = None,
   ) -> List[ContentItem]:
-    with self._lock:
-      items = list(self._items.values())
-      if type:
-        items = [i for i in items if i.type == type]
-      if status:
-        items = [i for i in items if i.status == status]
-      return items
+    self._refresh()
+    snapshot = self._snapshot
+    if not type and not status:
+      return list(snapshot.items.values())
+    if type and status:
+      return snapshot.ordered(snapshot.by_type_status.get((type, status), ()))
+    ids: List[str] = []
+    for (t, st), bucket in snapshot.by_type_status.items():
+      if (not type or t == type) and (not status or st == status):
+        ids.extend(bucket)
+    return snapshot.ordered(ids)
 
   def get_by_slug(self, type: str, slug: str, status: Optional[str] = None) -> Optional[ContentItem]:
-    with self._lock:
-      for item in self._items.values():
-        if item.type == type and item.slug == slug:
-          if status and item.status != status:
-            continue
-          return item
+    self._refresh()
+    snapshot = self._snapshot
+    ids = snapshot.by_slug.get((type, slug))
+    if not ids:
       return None
+    for item in snapshot.ordered(ids):
+      if status and item.status != status:
+        continue
+      return item
+    return None
 
   def get(self, id: str) -> Optional[ContentItem]:
-    with self._lock:
-      return self._items.get(id)
+    self._refresh()
+    return self._snapshot.items.get(id)
 
   def create(self, data: ContentItemCreate) -> ContentItem:
-    with self._lock:
+    with self._write_lock:
+      self._refresh(force=True)
       new_item = ContentItem(
         id=str(uuid.uuid4()),
         type=data.type,
@@ -112,33 +264,156 @@ class InMemoryContentStore:
         meta=data.meta or {},
         status=data.status or ContentStatus.DRAFT,
       )
-      self._items[new_item.id] = new_item
+      self._commit([new_item])
       return new_item
 
   def update(self, id: str, data: ContentItemCreate) -> Optional[ContentItem]:
-    with self._lock:
-      existing = self._items.get(id)
+    with self._write_lock:
+      self._refresh(force=True)
+      existing = self._snapshot.items.get(id)
       if not existing:
         return None
-      existing.title = data.title
-      existing.slug = data.slug
-      existing.excerpt = data.excerpt or ""
-      existing.body_rich = data.body_rich
-      existing.tags = data.tags or []
-      existing.meta = data.meta or {}
-      if data.status:
-        existing.status = data.status
-      self._items[id] = existing
-      return existing
+      updated = existing.model_copy(update={
+        "title": data.title,
+        "slug": data.slug,
+        "excerpt": data.excerpt or "",
+        "body_rich": data.body_rich,
+        "tags": data.tags or [],
+        "meta": data.meta or {},
+        "status": data.status or existing.status,
+      })
+      self._commit([updated])
+      return updated
 
   def set_status(self, id: str, status: str) -> Optional[ContentItem]:
-    with self._lock:
-      existing = self._items.get(id)
+    with self._write_lock:
+      self._refresh(force=True)
+      existing = self._snapshot.items.get(id)
       if not existing:
         return None
-      existing.status = status
-      self._items[id] = existing
-      return existing
+      updated = existing.model_copy(update={"status": status})
+      self._commit([updated])
+      return updated
+
+
+class SQLiteContentStore(InMemoryContentStore):
+  """Durable content store: SQLite in WAL mode behind the in-memory indexes.
+
+  - Every write is one IMMEDIATE transaction that upserts the item row and
+    bumps a shared generation counter, so a crash leaves either the old or
+    the new state (WAL replays / discards on next open).
+  - Cold start loads all rows once into the in-memory indexes.
+  - Readers check the shared generation (at most every `refresh_interval`
+    seconds) and pull only rows written since into a new snapshot, so every
+    uvicorn worker on the box converges on the same content.
+  """
+
+  def __init__(self, path: str, refresh_interval: float = 0.2) -> None:
+    self.path = path
+    self.refresh_interval = refresh_interval
+    self._local = threading.local()
+    self._last_refresh = 0.0
+
+    directory = os.path.dirname(path)
+    if directory:
+      os.makedirs(directory, exist_ok=True)
+    conn = self._conn()
+    conn.execute(
+      "CREATE TABLE IF NOT EXISTS content_items ("
+      " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+      " id TEXT NOT NULL UNIQUE,"
+      " generation INTEGER NOT NULL,"
+      " data TEXT NOT NULL)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS content_items_generation ON content_items (generation)")
+    conn.execute("CREATE TABLE IF NOT EXISTS content_meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+    conn.execute("INSERT OR IGNORE INTO content_meta (key, value) VALUES ('generation', 0)")
+
+    super().__init__()
+
+  @property
+  def generation(self) -> int:
+    self._refresh()
+    return self._snapshot.generation
+
+  def _conn(self) -> sqlite3.Connection:
+    conn = getattr(self._local, "conn", None)
+    if conn is None:
+      # Autocommit mode; transactions are opened explicitly below
+      conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+      conn.execute("PRAGMA journal_mode=WAL")
+      conn.execute("PRAGMA synchronous=FULL")
+      self._local.conn = conn
+    return conn
+
+  @contextmanager
+  def _transaction(self, mode: str = "IMMEDIATE") -> Iterator[sqlite3.Connection]:
+    conn = self._conn()
+    conn.execute(f"BEGIN {mode}")
+    try:
+      yield conn
+    except BaseException:
+      conn.execute("ROLLBACK")
+      raise
+    conn.execute("COMMIT")
+
+  def _write_rows(self, conn: sqlite3.Connection, items: Iterable[ContentItem]) -> None:
+    generation = conn.execute("SELECT value FROM content_meta WHERE key = 'generation'").fetchone()[0] + 1
+    conn.executemany(
+      "INSERT INTO content_items (id, generation, data) VALUES (?, ?, ?)"
+      " ON CONFLICT(id) DO UPDATE SET generation = excluded.generation, data = excluded.data",
+      [(item.id, generation, item.model_dump_json()) for item in items],
+    )
+    conn.execute("UPDATE content_meta SET value = ? WHERE key = 'generation'", (generation,))
+
+  def _refresh(self, force: bool = False) -> None:
+    if not force and time.monotonic() - self._last_refresh < self.refresh_interval:
+      return
+    with self._write_lock:
+      now = time.monotonic()
+      if not force and now - self._last_refresh < self.refresh_interval:
+        return
+      self._last_refresh = now
+
+      # One read transaction so the generation and rows come from the same snapshot
+      current = self._snapshot.generation
+      with self._transaction("DEFERRED") as conn:
+        generation = conn.execute("SELECT value FROM content_meta WHERE key = 'generation'").fetchone()[0]
+        if generation == current:
+          return
+        rows = conn.execute(
+          "SELECT seq, data FROM content_items WHERE generation > ? ORDER BY seq",
+          (current,),
+        ).fetchall()
+      changes = [(ContentItem.model_validate_json(data), seq) for seq, data in rows]
+      self._snapshot = self._snapshot.with_items(changes, generation)
+
+  def _commit(self, items: List[ContentItem]) -> None:
+    with self._transaction() as conn:
+      self._write_rows(conn, items)
+    self._refresh(force=True)
+
+  def _ensure_seed_data(self) -> None:
+    # Seed once per database file, even with several workers starting together
+    with self._transaction() as conn:
+      empty = conn.execute("SELECT COUNT(*) FROM content_items").fetchone()[0] == 0
+      if empty:
+        self._write_rows(conn, _demo_items())
+    self._refresh(force=True)
+
+
+def create_content_store_from_env() -> ContentStore:
+  """
+  CONTENT_STORE_BACKEND   memory (default) | sqlite
+  CONTENT_STORE_PATH      SQLite file for the sqlite backend
+  """
+  backend = os.getenv("CONTENT_STORE_BACKEND", "memory").lower()
+  if backend == "sqlite":
+    return SQLiteContentStore(
+      path=os.getenv("CONTENT_STORE_PATH", "data/content.db"),
+      refresh_interval=float(os.getenv("CONTENT_STORE_REFRESH_SECONDS", 0.2)),
+    )
+  return InMemoryContentStore()
 
 
-STORE = InMemoryContentStore()
+STORE = create_content_store_from_env()
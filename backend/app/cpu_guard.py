@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, TypeVar
+
+from starlette.concurrency import run_in_threadpool
+
+T = TypeVar("T")
+
+
+class CpuBudgetGuard:
+  """Run cheap handlers on the event loop, offload expensive ones.
+
+  Reasoning / labs / chat handlers are pure CPU for a few hundred
+  microseconds; hopping to the anyio threadpool costs more than the work
+  and caps concurrency at the pool size. The guard keeps an EWMA of the
+  CPU time (thread_time) each endpoint spends and only sends an endpoint
+  to the threadpool while that average is above `budget_us`. Offloaded
+  calls keep feeding the average, so an endpoint comes back inline once
+  it gets cheap again.
+
+  `budget_us=0` offloads everything (the previous sync-handler behaviour).
+  """
+
+  def __init__(self, budget_us: float = 2_000, alpha: float = 0.2) -> None:
+    self.budget_us = budget_us
+    self.alpha = alpha
+    self._ewma_us: Dict[str, float] = {}
+    self._counts: Dict[str, Dict[str, int]] = {}
+    self._lock = threading.Lock()
+
+  def _record(self, name: str, cpu_us: float, offloaded: bool) -> None:
+    with self._lock:
+      previous = self._ewma_us.get(name)
+      self._ewma_us[name] = cpu_us if previous is None else previous + self.alpha * (cpu_us - previous)
+      counts = self._counts.setdefault(name, {"inline": 0, "offloaded": 0})
+      counts["offloaded" if offloaded else "inline"] += 1
+
+  def _timed(self, name: str, offloaded: bool, fn: Callable[..., T], args: tuple, kwargs: dict) -> T:
+    start = time.thread_time_ns()
+    try:
+      return fn(*args, **kwargs)
+    finally:
+      self._record(name, (time.thread_time_ns() - start) / 1_000, offloaded)
+
+  def should_offload(self, name: str) -> bool:
+    return self.budget_us <= 0 or self._ewma_us.get(name, 0.0) > self.budget_us
+
+  async def run(self, name: str, fn: Callable[..., T], *args: Any, blocking: bool = False, **kwargs: Any) -> T:
+    """Call fn(*args, **kwargs) inline or in the threadpool.
+
+    `blocking=True` always offloads: thread_time does not see time spent
+    waiting on I/O (e.g. the SQLite session store), which must never run
+    on the event loop.
+    """
+    if blocking or self.should_offload(name):
+      return await run_in_threadpool(self._timed, name, True, fn, args, kwargs)
+    return self._timed(name, False, fn, args, kwargs)
+
+  def stats(self) -> Dict[str, Dict[str, float]]:
+    with self._lock:
+      return {
+        name: {
+          "cpu_us_ewma": round(self._ewma_us[name], 1),
+          "offloading": self.should_offload(name),
+          **counts,
+        }
+        for name, counts in self._counts.items()
+      }
+
+
+def create_cpu_guard_from_env() -> CpuBudgetGuard:
+  """
+  INLINE_CPU_BUDGET_US   per-call CPU (µs, EWMA) above which an endpoint is
+                         offloaded to the threadpool; 0 = always offload
+  """
+  return CpuBudgetGuard(budget_us=float(os.getenv("INLINE_CPU_BUDGET_US", 2_000)))
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .batch_writer import BatchWriter
+
+# Columns summaries can group by
+GROUP_COLUMNS = ("intent", "state", "action", "event", "source")
+
+_UP = {"up", "thumbs_up", "positive", "helpful", "like", "yes", "true", "1", "+1"}
+_DOWN = {"down", "thumbs_down", "negative", "unhelpful", "dislike", "no", "false", "-1"}
+
+# (intent, state) of the session the feedback is about
+Labels = Optional[Tuple[Optional[str], Optional[str]]]
+# session_id -> Labels, for feedback that does not say
+Resolver = Callable[[str], Labels]
+# (arrival time, payload, labels) as queued by FeedbackLog
+Item = Tuple[float, Dict[str, Any], Labels]
+
+
+def _vote(value: Any) -> Optional[int]:
+  if isinstance(value, bool):
+    return 1 if value else -1
+  if isinstance(value, (int, float)):
+    # Only a thumbs vote; a 1-5 star rating is not one, so 1/5 is not "up"
+    return 1 if value == 1 else -1 if value == -1 else None
+  if isinstance(value, str):
+    v = value.strip().lower()
+    return 1 if v in _UP else -1 if v in _DOWN else None
+  return None
+
+
+def feedback_rating(payload: Dict[str, Any]) -> Optional[int]:
+  """
+  +1 / -1 from rating/thumbs/helpful/vote (1 / -1, true / false, "up" / "down"
+  and synonyms), or a thumbs_up/thumbs_down event; anything else is unrated.
+  """
+  for key in ("rating", "thumbs", "helpful", "vote"):
+    if key in payload:
+      return _vote(payload[key])
+  event = str(payload.get("event") or "").lower()
+  if event in ("thumbs_up", "thumbs_down"):
+    return _vote(event)
+  return None
+
+
+def _text(value: Any) -> Optional[str]:
+  return None if value is None else str(value)
+
+
+class FeedbackStore:
+  """Compact SQLite table of feedback events plus GROUP BY summaries.
+
+  Rows are written in batches by the FeedbackLog writer thread (one
+  transaction per batch); each item carries the session labels captured
+  when the feedback arrived. Summaries run as a single aggregate query, so
+  SQLite streams the table and only the groups come back to Python.
+  """
+
+  def __init__(self, path: str) -> None:
+    self.path = path
+    self._local = threading.local()
+    directory = os.path.dirname(path)
+    if directory:
+      os.makedirs(directory, exist_ok=True)
+    with self._conn() as conn:
+      conn.execute(
+        "CREATE TABLE IF NOT EXISTS feedback ("
+        " ts REAL NOT NULL,"
+        " session_id TEXT,"
+        " event TEXT,"
+        " action TEXT,"
+        " intent TEXT,"
+        " state TEXT,"
+        " rating INTEGER,"
+        " source TEXT,"
+        " payload TEXT NOT NULL)"
+      )
+      conn.execute("CREATE INDEX IF NOT EXISTS feedback_ts ON feedback (ts)")
+
+  def _conn(self) -> sqlite3.Connection:
+    conn = getattr(self._local, "conn", None)
+    if conn is None:
+      conn = sqlite3.connect(self.path, timeout=5.0)
+      conn.execute("PRAGMA journal_mode=WAL")
+      conn.execute("PRAGMA synchronous=NORMAL")
+      self._local.conn = conn
+    return conn
+
+  def _row(self, ts: float, payload: Dict[str, Any], labels: Labels) -> tuple:
+    session_id = _text(payload.get("session_id"))
+    intent, state = _text(payload.get("intent")), _text(payload.get("state"))
+    if labels is not None:
+      intent = intent or _text(labels[0])
+      state = state or _text(labels[1])
+    nested = payload.get("payload")
+    source = payload.get("source") or (nested.get("source") if isinstance(nested, dict) else None)
+    return (
+      ts,
+      session_id,
+      _text(payload.get("event")),
+      _text(payload.get("action")),
+      intent,
+      state,
+      feedback_rating(payload),
+      _text(source) or ("chat" if session_id else None),
+      json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str),
+    )
+
+  def write(self, items: Sequence[Item]) -> None:
+    rows = [self._row(ts, payload, labels) for ts, payload, labels in items]
+    with self._conn() as conn:
+      conn.executemany("INSERT INTO feedback VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+  def count(self) -> int:
+    return self._conn().execute("SELECT COUNT(*) FROM feedback").fetchone()[0]
+
+  def summary(
+    self,
+    by: Sequence[str] = ("intent",),
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    min_rated: int = 1,
+  ) -> List[Dict[str, Any]]:
+    """Thumbs-down rate per group, worst first. Raises ValueError for unknown columns."""
+    by = tuple(by)
+    unknown = [c for c in by if c not in GROUP_COLUMNS]
+    if not by or unknown:
+      raise ValueError(f"group by one or more of {GROUP_COLUMNS}; got {list(by)}")
+    where, params = [], []
+    if since is not None:
+      where.append("ts >= ?")
+      params.append(since)
+    if until is not None:
+      where.append("ts < ?")
+      params.append(until)
+    cols = ", ".join(by)
+    sql = (
+      f"SELECT {cols}, COUNT(*), COUNT(rating), COALESCE(SUM(rating < 0), 0) FROM feedback"
+      + (f" WHERE {' AND '.join(where)}" if where else "")
+      + f" GROUP BY {cols} HAVING COUNT(rating) >= ?"
+    )
+    params.append(min_rated)
+    results = []
+    for row in self._conn().execute(sql, params):
+      events, rated, down = row[-3:]
+      results.append({
+        **dict(zip(by, row)),
+        "events": events,
+        "rated": rated,
+        "thumbs_down": down,
+        "thumbs_down_rate": round(down / rated, 4) if rated else None,
+      })
+    results.sort(key=lambda r: (-(r["thumbs_down_rate"] or 0.0), -r["rated"]))
+    return results
+
+
+class FeedbackLog:
+  """/reason/feedback ingestion: record() buffers, a writer thread persists."""
+
+  def __init__(self, store: FeedbackStore, max_batch: int = 1_000, max_delay: float = 1.0,
+               capacity: int = 100_000, resolve: Optional[Resolver] = None) -> None:
+    self.store = store
+    self.resolve = resolve
+    self.writer: BatchWriter[Item] = BatchWriter(
+      store.write, capacity=capacity, max_batch=max_batch, max_delay=max_delay, name="feedback-writer",
+    )
+
+  def record(self, payload: Dict[str, Any]) -> None:
+    # Timestamp and session labels are taken on arrival, so they describe the
+    # turn the feedback is about; parsing happens on the writer thread
+    labels = None
+    session_id = payload.get("session_id")
+    if session_id and self.resolve is not None and (payload.get("intent") is None or payload.get("state") is None):
+      labels = self.resolve(str(session_id))
+    self.writer.submit((time.time(), payload, labels))
+
+  def start(self) -> None:
+    self.writer.start()
+
+  def stop(self) -> None:
+    self.writer.stop()
+
+  def stats(self) -> Dict[str, Any]:
+    return {"path": self.store.path, **self.writer.stats()}
+
+
+def create_feedback_log_from_env(resolve: Optional[Resolver] = None) -> FeedbackLog:
+  """
+  FEEDBACK_DB_PATH            SQLite file (default data/feedback.db)
+  FEEDBACK_FLUSH_ROWS         rows per write batch (default 1000)
+  FEEDBACK_FLUSH_SECONDS      max delay before buffered rows are written (default 1)
+  FEEDBACK_BUFFER_ROWS        ring buffer size; oldest rows are dropped beyond it (default 100000)
+  """
+  return FeedbackLog(
+    FeedbackStore(os.getenv("FEEDBACK_DB_PATH", "data/feedback.db")),
+    max_batch=int(os.getenv("FEEDBACK_FLUSH_ROWS", 1_000)),
+    max_delay=float(os.getenv("FEEDBACK_FLUSH_SECONDS", 1)),
+    capacity=int(os.getenv("FEEDBACK_BUFFER_ROWS", 100_000)),
+    resolve=resolve,
+  )
@@ -2,9 +2,8 @@
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
-from jose import jwt, JWTError
 
-from .auth import SECRET_KEY, ALGORITHM
+from .auth import require_admin
 
 router = APIRouter(prefix="/admin/jobs", tags=["jobs-admin"])
 
@@ -30,34 +29,13 @@ _jobs: List[Job] = [
   Job(id=2, title="Applied AI Engineer", location="Remote (India)", type="Full-time", summary="Build AI systems for pricing, forecasting and dev tools."),
 ]
 
-def require_admin(token: str = Depends(lambda: None)):
-  # very simple: expect Authorization: Bearer <token>
-  from fastapi import Request
-  from fastapi import Depends
-
-  async def inner(request: Request):
-    auth = request.headers.get("Authorization")
-    if not auth or not auth.lower().startswith("bearer "):
-      raise HTTPException(status_code=401, detail="Not authenticated")
-    token = auth.split(" ", 1)[1]
-    try:
-      payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-      if not payload.get("is_admin"):
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    except JWTError:
-      raise HTTPException(status_code=401, detail="Invalid token")
-    return True
-
-  return Depends(inner)
-
-
 @router.get("", response_model=List[Job])
-async def list_jobs(_: bool = Depends(require_admin())):
+async def list_jobs(_: dict = Depends(require_admin)):
   return _jobs
 
 
 @router.post("", response_model=Job)
-async def create_job(payload: JobCreate, _: bool = Depends(require_admin())):
+async def create_job(payload: JobCreate, _: dict = Depends(require_admin)):
   new_id = max([job.id for job in _jobs] or [0]) + 1
   job = Job(id=new_id, **payload.dict())
   _jobs.append(job)
@@ -65,7 +43,7 @@ async def create_job(payload: JobCreate, _: bool = Depends(require_admin())):
 
 
 @router.put("/{job_id}", response_model=Job)
-async def update_job(job_id: int, payload: JobCreate, _: bool = Depends(require_admin())):
+async def update_job(job_id: int, payload: JobCreate, _: dict = Depends(require_admin)):
   for idx, job in enumerate(_jobs):
     if job.id == job_id:
       updated = Job(id=job_id, **payload.dict())
@@ -75,7 +53,7 @@ async def update_job(job_id: int, payload: JobCreate, _: bool = Depends(require_
 
 
 @router.delete("/{job_id}")
-async def delete_job(job_id: int, _: bool = Depends(require_admin())):
+async def delete_job(job_id: int, _: dict = Depends(require_admin)):
   global _jobs
   _jobs = [j for j in _jobs if j.id != job_id]
   return {"ok": True}
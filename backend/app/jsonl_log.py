@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import Any, Iterable, Iterator, Optional
+
+
+class JsonlLog:
+  """Append-only JSON Lines file; `path=None` disables it.
+
+  Appends are serialized by a lock and write whole lines, so concurrent
+  writers in one process never interleave records. read() streams the file
+  back without loading it.
+  """
+
+  def __init__(self, path: Optional[str]) -> None:
+    self.path = path
+    self._lock = threading.Lock()
+    if path:
+      directory = os.path.dirname(path)
+      if directory:
+        os.makedirs(directory, exist_ok=True)
+
+  @property
+  def enabled(self) -> bool:
+    return bool(self.path)
+
+  def append(self, records: Iterable[dict]) -> None:
+    if not self.path:
+      return
+    lines = "".join(json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n" for r in records)
+    if not lines:
+      return
+    with self._lock:
+      with open(self.path, "a", encoding="utf-8") as fh:
+        fh.write(lines)
+
+  def read(self, **match: Any) -> Iterator[dict]:
+    """Stream records back, optionally only those whose fields equal `match`."""
+    if not self.path or not os.path.exists(self.path):
+      return
+    with open(self.path, encoding="utf-8") as fh:
+      for line in fh:
+        record = json.loads(line)
+        if all(record.get(key) == value for key, value in match.items()):
+          yield record
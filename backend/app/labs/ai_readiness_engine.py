@@ -1,39 +1,50 @@
 # backend/app/labs/ai_readiness_engine.py
 
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ..batch_scoring import clamp, lookup, membership, truncate
+from .scoring_model import SCORING_MODEL, ScoringModel
+
+
+# Signals ticked in the form and how much each moves its score
+DATA_SIGNALS: Dict[str, int] = {
+    "Centralized warehouse": 20,
+    "Historical data available": 15,
+    "ETL pipelines in place": 10,
+    "Data is scattered": -20,
+    "Mostly unstructured data": -10,
+    "Manual data cleaning required": -5,
+}
+
+WORKFLOW_SIGNALS: Dict[str, int] = {
+    "Repeatable process": 15,
+    "API-ready": 20,
+    "Event-driven": 15,
+    "Mostly manual": -20,
+    "Excel/Email driven": -10,
+    "Legacy systems in place": -10,
+}
+
+ORG_STAGE_BONUS: Dict[str, int] = {"startup": 0, "growth": 10, "mid": 15, "enterprise": 20}
+ORG_TEAM_BONUS: Dict[str, int] = {"none": -10, "small": 5, "strong": 15, "mature": 20}
+BUDGET_BONUS: Dict[str, int] = {"low": -15, "moderate": 0, "good": 10, "strong": 20}
+URGENCY_BONUS: Dict[str, int] = {"fast": -5, "medium": 0, "slow": 5}  # fast = more pressure
+
+
+def _bonus(table: Dict[str, int], value) -> int:
+    # Only exact string matches count (values come straight from the form)
+    return table.get(value, 0) if isinstance(value, str) else 0
 
 
 def _score_data(selected: List[str]) -> int:
-    score = 50
-    if "Centralized warehouse" in selected:
-        score += 20
-    if "Historical data available" in selected:
-        score += 15
-    if "ETL pipelines in place" in selected:
-        score += 10
-    if "Data is scattered" in selected:
-        score -= 20
-    if "Mostly unstructured data" in selected:
-        score -= 10
-    if "Manual data cleaning required" in selected:
-        score -= 5
+    score = 50 + sum(weight for signal, weight in DATA_SIGNALS.items() if signal in selected)
     return max(0, min(100, score))
 
 
 def _score_workflows(selected: List[str]) -> int:
-    score = 50
-    if "Repeatable process" in selected:
-        score += 15
-    if "API-ready" in selected:
-        score += 20
-    if "Event-driven" in selected:
-        score += 15
-    if "Mostly manual" in selected:
-        score -= 20
-    if "Excel/Email driven" in selected:
-        score -= 10
-    if "Legacy systems in place" in selected:
-        score -= 10
+    score = 50 + sum(weight for signal, weight in WORKFLOW_SIGNALS.items() if signal in selected)
     return max(0, min(100, score))
 
 
@@ -45,57 +56,49 @@ def _score_opportunities(selected: List[str]) -> int:
 
 
 def _score_org(stage: str, team: str) -> int:
-    score = 40
-    if stage == "startup":
-        score += 0
-    elif stage == "growth":
-        score += 10
-    elif stage == "mid":
-        score += 15
-    elif stage == "enterprise":
-        score += 20
-
-    if team == "none":
-        score -= 10
-    elif team == "small":
-        score += 5
-    elif team == "strong":
-        score += 15
-    elif team == "mature":
-        score += 20
-
+    score = 40 + _bonus(ORG_STAGE_BONUS, stage) + _bonus(ORG_TEAM_BONUS, team)
     return max(0, min(100, score))
 
 
 def _score_constraints(budget: str, urgency: str) -> int:
-    score = 50
-    if budget == "low":
-        score -= 15
-    elif budget == "moderate":
-        score += 0
-    elif budget == "good":
-        score += 10
-    elif budget == "strong":
-        score += 20
-
-    if urgency == "fast":
-        score -= 5  # more pressure
-    elif urgency == "medium":
-        score += 0
-    elif urgency == "slow":
-        score += 5
-
+    score = 50 + _bonus(BUDGET_BONUS, budget) + _bonus(URGENCY_BONUS, urgency)
     return max(0, min(100, score))
 
 
-def run_ai_readiness(form: Dict) -> Dict:
-    data_maturity = form.get("data_maturity") or []
-    workflow_maturity = form.get("workflow_maturity") or []
-    ai_opportunities = form.get("ai_opportunities") or []
-    org_stage = form.get("org_stage") or ""
-    team_strength = form.get("team_strength") or ""
-    budget = form.get("budget") or "moderate"
-    urgency = form.get("urgency") or "medium"
+def _readiness(w, data_score, workflow_score, opp_score, org_score):
+    # Works on ints and on NumPy arrays alike (same operation order);
+    # w is ScoringModel.readiness
+    return (
+        w[0] * data_score
+        + w[1] * workflow_score
+        + w[2] * opp_score
+        + w[3] * org_score
+    )
+
+
+def _form_fields(form: Dict) -> tuple:
+    return (
+        form.get("data_maturity") or [],
+        form.get("workflow_maturity") or [],
+        form.get("ai_opportunities") or [],
+        form.get("org_stage") or "",
+        form.get("team_strength") or "",
+        form.get("budget") or "moderate",
+        form.get("urgency") or "medium",
+    )
+
+
+def run_ai_readiness(form: Dict, model: Optional[ScoringModel] = None) -> Dict:
+    model = model or SCORING_MODEL.current
+    (
+        data_maturity,
+        workflow_maturity,
+        ai_opportunities,
+        org_stage,
+        team_strength,
+        budget,
+        urgency,
+    ) = _form_fields(form)
 
     data_score = _score_data(data_maturity)
     workflow_score = _score_workflows(workflow_maturity)
@@ -103,13 +106,19 @@ def run_ai_readiness(form: Dict) -> Dict:
     org_score = _score_org(org_stage, team_strength)
     constraints_score = _score_constraints(budget, urgency)
 
-    readiness = int(
-        0.30 * data_score
-        + 0.25 * workflow_score
-        + 0.25 * opp_score
-        + 0.20 * org_score
-    )
+    readiness = int(_readiness(model.readiness, data_score, workflow_score, opp_score, org_score))
+
+    return _readiness_report(data_score, workflow_score, opp_score, org_score, constraints_score, readiness)
 
+
+def _readiness_report(
+    data_score: int,
+    workflow_score: int,
+    opp_score: int,
+    org_score: int,
+    constraints_score: int,
+    readiness: int,
+) -> Dict:
     quick_wins: List[str] = []
     recommendations: List[Dict] = []
 
@@ -225,3 +234,34 @@ def run_ai_readiness(form: Dict) -> Dict:
         "next_step": next_step_text,
         "next_actions": next_actions,
     }
+
+
+def score_ai_readiness_batch(forms: List[Dict], model: Optional[ScoringModel] = None) -> Dict[str, np.ndarray]:
+    """Readiness sub-scores and overall score for many forms as NumPy columns."""
+    model = model or SCORING_MODEL.current
+    fields = [_form_fields(form) for form in forms]
+
+    def column(i):
+        return [row[i] for row in fields]
+
+    data = clamp(50 + membership(column(0), DATA_SIGNALS) @ np.array(list(DATA_SIGNALS.values())))
+    workflows = clamp(50 + membership(column(1), WORKFLOW_SIGNALS) @ np.array(list(WORKFLOW_SIGNALS.values())))
+    opportunities = clamp(40 + np.fromiter(map(len, column(2)), dtype=np.int64, count=len(fields)) * 10)
+    org = clamp(40 + lookup(column(3), ORG_STAGE_BONUS, 0) + lookup(column(4), ORG_TEAM_BONUS, 0))
+    constraints = clamp(50 + lookup(column(5), BUDGET_BONUS, 0) + lookup(column(6), URGENCY_BONUS, 0))
+    readiness = truncate(_readiness(model.readiness, data, workflows, opportunities, org))
+    return {
+        "data": data,
+        "workflows": workflows,
+        "opportunities": opportunities,
+        "org": org,
+        "constraints": constraints,
+        "score": readiness,
+    }
+
+
+def run_ai_readiness_batch(forms: List[Dict], model: Optional[ScoringModel] = None) -> List[Dict]:
+    """run_ai_readiness over many forms, identical results; scores come from score_ai_readiness_batch."""
+    columns = score_ai_readiness_batch(forms, model)
+    names = ("data", "workflows", "opportunities", "org", "constraints", "score")
+    return [_readiness_report(*row) for row in zip(*(columns[name].tolist() for name in names))]
@@ -7,7 +7,16 @@ Deterministic rule-based engine to recommend an architecture tier, stack and roa
 No ML, no external services. Pure functions for easy testing.
 """
 
-from typing import Dict, List, Any, Optional
+import os
+import threading
+from collections import OrderedDict
+from itertools import repeat
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+from ..batch_scoring import clamp, lookup, truncate
+from .scoring_model import SCORING_MODEL, ScoringModel
 
 
 # --------------------------------------------------------------------
@@ -30,131 +39,153 @@ def _norm_str(value: Optional[str]) -> str:
 # --------------------------------------------------------------------
 
 
+EXPECTED_USERS_SCORES: Dict[str, int] = {
+    "<1k": 20,
+    "1k-10k": 35,
+    "10k-100k": 55,
+    "100k-1m": 75,
+    "1m+": 90,
+}
+
+
+CONCURRENCY_SCORES: Dict[str, int] = {
+    "<10": 15,
+    "10-100": 30,
+    "100-500": 55,
+    "500-2000": 75,
+    "2000+": 90,
+}
+
+
+TRAFFIC_PATTERN_SCORES: Dict[str, int] = {
+    "steady": 30,
+    "seasonal": 45,
+    "bursty": 65,
+    "unpredictable": 75,
+}
+
+
+DATA_SIZE_SCORES: Dict[str, int] = {
+    "<5gb": 20,
+    "5-50gb": 35,
+    "50-500gb": 55,
+    "500gb-5tb": 75,
+    "5tb+": 90,
+}
+
+
+DATA_TYPE_SCORES: Dict[str, int] = {
+    "transactional": 40,
+    "analytics-heavy": 55,
+    "logs & telemetry": 65,
+    "media files": 70,
+}
+
+
+REALTIME_SCORES: Dict[str, int] = {
+    "none": 10,
+    "basic_realtime": 45,
+    "basic-realtime": 45,
+    "heavy_realtime": 75,
+    "heavy-realtime": 75,
+}
+
+
+MULTI_TENANCY_SCORES: Dict[str, int] = {
+    "no": 10,
+    "soft_multi_tenant": 40,
+    "soft-multi-tenant": 40,
+    "hard_multi_tenant": 70,
+    "hard-multi-tenant": 70,
+}
+
+
+INTEGRATIONS_SCORES: Dict[str, int] = {
+    "few": 20,
+    "many": 45,
+    "mission_critical": 70,
+    "mission-critical": 70,
+}
+
+
+COMPLIANCE_SCORES: Dict[str, int] = {
+    "none": 10,
+    "gdpr": 40,
+    "hipaa": 65,
+    "soc2": 55,
+    "fintech": 70,
+}
+
+
+UPTIME_SCORES: Dict[str, int] = {
+    "99%": 20,
+    "99.5%": 35,
+    "99.9%": 60,
+    "99.99%": 80,
+}
+
+
+DEPLOYMENT_SCORES: Dict[str, int] = {
+    "cloud": 40,
+    "on_prem": 60,
+    "on-prem": 60,
+    "hybrid": 70,
+}
+
+
 def score_expected_users(expected_users: str) -> int:
     v = _norm_str(expected_users)
-    mapping = {
-        "<1k": 20,
-        "1k-10k": 35,
-        "10k-100k": 55,
-        "100k-1m": 75,
-        "1m+": 90,
-    }
-    return mapping.get(v, 35)
+    return EXPECTED_USERS_SCORES.get(v, 35)
 
 
 def score_concurrency(concurrency: str) -> int:
     v = _norm_str(concurrency)
-    mapping = {
-        "<10": 15,
-        "10-100": 30,
-        "100-500": 55,
-        "500-2000": 75,
-        "2000+": 90,
-    }
-    return mapping.get(v, 30)
+    return CONCURRENCY_SCORES.get(v, 30)
 
 
 def score_traffic_pattern(traffic_pattern: str) -> int:
     v = _norm_str(traffic_pattern)
-    mapping = {
-        "steady": 30,
-        "seasonal": 45,
-        "bursty": 65,
-        "unpredictable": 75,
-    }
-    return mapping.get(v, 30)
+    return TRAFFIC_PATTERN_SCORES.get(v, 30)
 
 
 def score_data_size(data_size: str) -> int:
     v = _norm_str(data_size)
-    mapping = {
-        "<5gb": 20,
-        "5-50gb": 35,
-        "50-500gb": 55,
-        "500gb-5tb": 75,
-        "5tb+": 90,
-    }
-    return mapping.get(v, 35)
+    return DATA_SIZE_SCORES.get(v, 35)
 
 
 def score_data_type(data_type: str) -> int:
     v = _norm_str(data_type)
-    mapping = {
-        "transactional": 40,
-        "analytics-heavy": 55,
-        "logs & telemetry": 65,
-        "media files": 70,
-    }
-    return mapping.get(v, 40)
+    return DATA_TYPE_SCORES.get(v, 40)
 
 
 def score_realtime(realtime: str) -> int:
     v = _norm_str(realtime)
-    mapping = {
-        "none": 10,
-        "basic_realtime": 45,
-        "basic-realtime": 45,
-        "heavy_realtime": 75,
-        "heavy-realtime": 75,
-    }
-    return mapping.get(v, 10)
+    return REALTIME_SCORES.get(v, 10)
 
 
 def score_multi_tenancy(multi_tenancy: str) -> int:
     v = _norm_str(multi_tenancy)
-    mapping = {
-        "no": 10,
-        "soft_multi_tenant": 40,
-        "soft-multi-tenant": 40,
-        "hard_multi_tenant": 70,
-        "hard-multi-tenant": 70,
-    }
-    return mapping.get(v, 10)
+    return MULTI_TENANCY_SCORES.get(v, 10)
 
 
 def score_integrations(integrations: str) -> int:
     v = _norm_str(integrations)
-    mapping = {
-        "few": 20,
-        "many": 45,
-        "mission_critical": 70,
-        "mission-critical": 70,
-    }
-    return mapping.get(v, 20)
+    return INTEGRATIONS_SCORES.get(v, 20)
 
 
 def score_compliance(compliance: str) -> int:
     v = _norm_str(compliance)
-    mapping = {
-        "none": 10,
-        "gdpr": 40,
-        "hipaa": 65,
-        "soc2": 55,
-        "fintech": 70,
-    }
-    return mapping.get(v, 10)
+    return COMPLIANCE_SCORES.get(v, 10)
 
 
 def score_uptime(uptime: str) -> int:
     v = _norm_str(uptime)
-    mapping = {
-        "99%": 20,
-        "99.5%": 35,
-        "99.9%": 60,
-        "99.99%": 80,
-    }
-    return mapping.get(v, 35)
+    return UPTIME_SCORES.get(v, 35)
 
 
 def score_deployment(deployment: str) -> int:
     v = _norm_str(deployment)
-    mapping = {
-        "cloud": 40,
-        "on_prem": 60,
-        "on-prem": 60,
-        "hybrid": 70,
-    }
-    return mapping.get(v, 40)
+    return DEPLOYMENT_SCORES.get(v, 40)
 
 
 # --------------------------------------------------------------------
@@ -202,7 +233,32 @@ def infer_from_description(description: str) -> Dict[str, Any]:
 # --------------------------------------------------------------------
 
 
-def aggregate_scores(payload: dict) -> Dict[str, int]:
+# The weighted formulas work on ints and on NumPy arrays alike (same
+# operation order), so the batch path reproduces the scalar results exactly.
+# Weights come from the active ScoringModel (see scoring_model.py).
+
+
+def _load_formula(w, expected_users, concurrency, traffic):
+    return w[0] * expected_users + w[1] * concurrency + w[2] * traffic
+
+
+def _data_formula(w, volume, kind):
+    return w[0] * volume + w[1] * kind
+
+
+def _features_formula(w, realtime, multi_tenancy, integrations):
+    return w[0] * realtime + w[1] * multi_tenancy + w[2] * integrations
+
+
+def _risk_formula(w, compliance, uptime, deployment):
+    return w[0] * compliance + w[1] * uptime + w[2] * deployment
+
+
+def _overall_formula(w, load, data, features, risk):
+    return w[0] * load + w[1] * data + w[2] * features + w[3] * risk
+
+
+def aggregate_scores(payload: dict, model: Optional[ScoringModel] = None) -> Dict[str, int]:
     """
     Compute category scores (0–100) for:
     - load
@@ -210,29 +266,30 @@ def aggregate_scores(payload: dict) -> Dict[str, int]:
     - features
     - risk
     """
+    model = model or SCORING_MODEL.current
 
     # Load
     load_expected = score_expected_users(payload.get("expected_users", "1k-10k"))
     load_conc = score_concurrency(payload.get("concurrency", "10-100"))
     load_traffic = score_traffic_pattern(payload.get("traffic_pattern", "steady"))
-    load_score = int(0.5 * load_expected + 0.3 * load_conc + 0.2 * load_traffic)
+    load_score = int(_load_formula(model.load, load_expected, load_conc, load_traffic))
 
     # Data
     data_volume = score_data_size(payload.get("data_size", "5-50GB"))
     data_kind = score_data_type(payload.get("data_type", "transactional"))
-    data_score = int(0.6 * data_volume + 0.4 * data_kind)
+    data_score = int(_data_formula(model.data, data_volume, data_kind))
 
     # Features
     feat_realtime = score_realtime(payload.get("realtime", "none"))
     feat_multi = score_multi_tenancy(payload.get("multi_tenancy", "no"))
     feat_integrations = score_integrations(payload.get("integrations", "few"))
-    features_score = int(0.4 * feat_realtime + 0.3 * feat_multi + 0.3 * feat_integrations)
+    features_score = int(_features_formula(model.features, feat_realtime, feat_multi, feat_integrations))
 
     # Risk (compliance + uptime + deployment complexity)
     compliance_score = score_compliance(payload.get("compliance", "none"))
     uptime_score = score_uptime(payload.get("uptime", "99.5%"))
     deploy_score = score_deployment(payload.get("deployment", "cloud"))
-    risk_score = int(0.4 * compliance_score + 0.4 * uptime_score + 0.2 * deploy_score)
+    risk_score = int(_risk_formula(model.risk, compliance_score, uptime_score, deploy_score))
 
     return {
         "load": _clamp(load_score),
@@ -242,19 +299,17 @@ def aggregate_scores(payload: dict) -> Dict[str, int]:
     }
 
 
-def decide_tier(scores: Dict[str, int]) -> Dict[str, Any]:
+def decide_tier(scores: Dict[str, int], model: Optional[ScoringModel] = None) -> Dict[str, Any]:
     """
     Decide the architecture tier based on weighted average of sub-scores.
     """
-    weighted = (
-        0.35 * scores["load"]
-        + 0.25 * scores["data"]
-        + 0.2 * scores["features"]
-        + 0.2 * scores["risk"]
-    )
-    overall = _clamp(int(weighted))
+    model = model or SCORING_MODEL.current
+    weighted = _overall_formula(model.overall, scores["load"], scores["data"], scores["features"], scores["risk"])
+    return _tier_overview(_clamp(int(weighted)), model.tier_cutoffs)
+
 
-    if overall < 40:
+def _tier_overview(overall: int, cutoffs: Tuple[int, int, int]) -> Dict[str, Any]:
+    if overall < cutoffs[0]:
         tier = "A"
         label = "Lightweight / Early-stage"
         description = (
@@ -262,7 +317,7 @@ def decide_tier(scores: Dict[str, int]) -> Dict[str, Any]:
             "You can start with a well-structured monolith or modular backend and keep "
             "infrastructure simple while validating the product."
         )
-    elif overall < 60:
+    elif overall < cutoffs[1]:
         tier = "B"
         label = "Standard SaaS / Scale-up"
         description = (
@@ -270,7 +325,7 @@ def decide_tier(scores: Dict[str, int]) -> Dict[str, Any]:
             "clear layering, background jobs, caching and observability, with room to "
             "scale as usage grows."
         )
-    elif overall < 80:
+    elif overall < cutoffs[2]:
         tier = "C"
         label = "Enterprise / High-scale"
         description = (
@@ -528,7 +583,7 @@ def build_roadmap(tier: str) -> List[str]:
 # --------------------------------------------------------------------
 
 
-def run_architecture_blueprint(payload: dict) -> dict:
+def run_architecture_blueprint(payload: dict, model: Optional[ScoringModel] = None) -> dict:
     """
     Main entrypoint for the Architecture Blueprint Tool.
 
@@ -555,8 +610,12 @@ def run_architecture_blueprint(payload: dict) -> dict:
     # inferred overrides nothing critical, just gives defaults where missing
     merged = {**payload, **inferred}
 
-    scores = aggregate_scores(merged)
-    overview = decide_tier(scores)
+    model = model or SCORING_MODEL.current
+    scores = aggregate_scores(merged, model)
+    return _build_blueprint(merged, scores, decide_tier(scores, model))
+
+
+def _build_blueprint(merged: dict, scores: Dict[str, int], overview: Dict[str, Any]) -> dict:
 
     backend_stack = recommend_backend_stack(
         product_type=merged.get("product_type", "saas"),
@@ -589,3 +648,286 @@ def run_architecture_blueprint(payload: dict) -> dict:
         "roadmap": roadmap,
         "cost_band": cost_band,
     }
+
+
+# --------------------------------------------------------------------
+# Batch entrypoint
+# --------------------------------------------------------------------
+
+
+def _merge_hints(payloads: List[dict]) -> List[dict]:
+    merged_rows = []
+    for payload in payloads:
+        description = payload.get("description") or payload.get("free_text") or ""
+        merged_rows.append({**payload, **infer_from_description(description)})
+    return merged_rows
+
+
+def score_architecture_blueprint_batch(
+    payloads: List[dict],
+    model: Optional[ScoringModel] = None,
+    merged_rows: Optional[List[dict]] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Category scores and overall score for many payloads as NumPy columns.
+    Enum fields are encoded to integer codes and looked up in the score tables.
+    """
+    model = model or SCORING_MODEL.current
+    if merged_rows is None:
+        merged_rows = _merge_hints(payloads)
+
+    def column(name: str, default: str, table: Dict[str, int], unknown: int) -> np.ndarray:
+        return lookup((_norm_str(m.get(name, default)) for m in merged_rows), table, unknown)
+
+    load = clamp(truncate(_load_formula(
+        model.load,
+        column("expected_users", "1k-10k", EXPECTED_USERS_SCORES, 35),
+        column("concurrency", "10-100", CONCURRENCY_SCORES, 30),
+        column("traffic_pattern", "steady", TRAFFIC_PATTERN_SCORES, 30),
+    )))
+    data = clamp(truncate(_data_formula(
+        model.data,
+        column("data_size", "5-50GB", DATA_SIZE_SCORES, 35),
+        column("data_type", "transactional", DATA_TYPE_SCORES, 40),
+    )))
+    features = clamp(truncate(_features_formula(
+        model.features,
+        column("realtime", "none", REALTIME_SCORES, 10),
+        column("multi_tenancy", "no", MULTI_TENANCY_SCORES, 10),
+        column("integrations", "few", INTEGRATIONS_SCORES, 20),
+    )))
+    risk = clamp(truncate(_risk_formula(
+        model.risk,
+        column("compliance", "none", COMPLIANCE_SCORES, 10),
+        column("uptime", "99.5%", UPTIME_SCORES, 35),
+        column("deployment", "cloud", DEPLOYMENT_SCORES, 40),
+    )))
+    overall = clamp(truncate(_overall_formula(model.overall, load, data, features, risk)))
+    return {"load": load, "data": data, "features": features, "risk": risk, "overall": overall}
+
+
+def run_architecture_blueprint_batch(payloads: List[dict], model: Optional[ScoringModel] = None) -> List[dict]:
+    """run_architecture_blueprint over many payloads, identical results; scores come from score_architecture_blueprint_batch."""
+    model = model or SCORING_MODEL.current
+    merged_rows = _merge_hints(payloads)
+    columns = score_architecture_blueprint_batch(payloads, model, merged_rows)
+    names = ("load", "data", "features", "risk", "overall")
+    results = []
+    rows = zip(merged_rows, *(columns[name].tolist() for name in names))
+    for merged, l, d, f, r, o in rows:
+        scores = {"load": l, "data": d, "features": f, "risk": r}
+        results.append(_build_blueprint(merged, scores, _tier_overview(o, model.tier_cutoffs)))
+    return results
+
+
+# --------------------------------------------------------------------
+# Memoized engine
+# --------------------------------------------------------------------
+
+
+# Every input field as (name, default when missing, values that change the
+# result, fallback). A value outside `values` behaves exactly like
+# `fallback`: it gets the scoring default and matches none of the
+# tier / stack / risk checks. Hyphenated aliases score like their
+# underscore forms but skip those checks, so they stay distinct.
+_FIELDS: Tuple[Tuple[str, str, Tuple[str, ...], str], ...] = (
+    ("product_type", "saas", ("saas", "mobile_app", "ecommerce", "internal_tool", "marketplace", "marketing_site", ""), ""),
+    ("expected_users", "1k-10k", tuple(EXPECTED_USERS_SCORES), "1k-10k"),
+    ("concurrency", "10-100", tuple(CONCURRENCY_SCORES), "10-100"),
+    ("traffic_pattern", "steady", tuple(TRAFFIC_PATTERN_SCORES), "steady"),
+    ("data_size", "5-50GB", tuple(DATA_SIZE_SCORES), "5-50gb"),
+    ("data_type", "transactional", tuple(DATA_TYPE_SCORES), "transactional"),
+    ("realtime", "none", tuple(REALTIME_SCORES), "none"),
+    ("multi_tenancy", "no", tuple(MULTI_TENANCY_SCORES), "no"),
+    ("integrations", "few", tuple(INTEGRATIONS_SCORES), "few"),
+    ("compliance", "none", tuple(COMPLIANCE_SCORES), "none"),
+    ("uptime", "99.5%", tuple(UPTIME_SCORES), "99.5%"),
+    ("deployment", "cloud", tuple(DEPLOYMENT_SCORES), "cloud"),
+)
+
+# Score categories and the fields each one reads (see aggregate_scores)
+_CATEGORIES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("load", ("expected_users", "concurrency", "traffic_pattern")),
+    ("data", ("data_size", "data_type")),
+    ("features", ("realtime", "multi_tenancy", "integrations")),
+    ("risk", ("compliance", "uptime", "deployment")),
+)
+
+
+_MISSING = object()
+
+
+def _copy_result(result: dict) -> dict:
+    # Cheaper than deepcopy; the result shape is fixed
+    return {
+        **result,
+        "overview": dict(result["overview"]),
+        "scores": dict(result["scores"]),
+        "backend_stack": list(result["backend_stack"]),
+        "frontend_stack": list(result["frontend_stack"]),
+        "infra": dict(result["infra"]),
+        "risks": [dict(r) for r in result["risks"]],
+        "roadmap": list(result["roadmap"]),
+    }
+
+
+class BlueprintEngine:
+    """
+    Memoized run_architecture_blueprint.
+
+    The input space is a finite product of enum values: each payload is
+    canonicalized into one int (mixed-radix over the per-field value
+    indices, plus an SEO bit). The description only enters through
+    infer_from_description's hints. Full results are kept in a bounded LRU
+    keyed by that int.
+
+    precompute() packs the category scores for every combination of their
+    input fields into byte tables (load / data / features / risk, at most
+    100 entries each), so a cache miss only assembles lists. The full
+    cross-product (~2e8 results) is not worth materializing.
+
+    Results and tables belong to one ScoringModel; a reload of the model
+    drops them (and rebuilds the tables if they were precomputed).
+    """
+
+    def __init__(self, max_entries: int = 4096, precompute: bool = False) -> None:
+        self.max_entries = max_entries
+        self._index: Dict[str, Dict[str, int]] = {}
+        self._strides: Dict[str, int] = {}
+        # normalized value -> its contribution to the key
+        self._weights: List[Tuple[str, str, Dict[str, int], int]] = []
+        stride = 2  # bit 0 = seo_needed
+        for name, default, values, fallback in reversed(_FIELDS):
+            index = {v: i for i, v in enumerate(values)}
+            self._index[name] = index
+            self._strides[name] = stride
+            self._weights.append((name, default, {v: stride * i for v, i in index.items()}, stride * index[fallback]))
+            stride *= len(values)
+        self.key_space = stride
+
+        # Raw inputs seen recently -> canonical key, so repeats skip normalization
+        self._raw_fields = ("description", "free_text", "seo_needed") + tuple(name for name, _, _, _ in _FIELDS)
+        self._raw_keys: Dict[tuple, int] = {}
+
+        self._model = SCORING_MODEL.current
+        self._tables: Optional[Dict[str, bytes]] = None
+        self._cache: "OrderedDict[int, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        if precompute:
+            self.precompute()
+
+    def canonical_key(self, payload: dict) -> int:
+        description = payload.get("description") or payload.get("free_text") or ""
+        merged = {**payload, **infer_from_description(description)} if description else payload
+
+        key = 1 if _norm_str(merged.get("seo_needed", "")) in ("yes", "true", "1") else 0
+        for name, default, weights, fallback in self._weights:
+            key += weights.get(_norm_str(merged.get(name, default)), fallback)
+        return key
+
+    def _key(self, payload: dict) -> int:
+        # A missing field (default applies) and an explicit None differ
+        raw = tuple(map(payload.get, self._raw_fields, repeat(_MISSING)))
+        try:
+            key = self._raw_keys.get(raw)
+        except TypeError:  # unhashable values: just canonicalize
+            return self.canonical_key(payload)
+        if key is None:
+            key = self.canonical_key(payload)
+            if len(self._raw_keys) >= self.max_entries * 4:
+                self._raw_keys.clear()
+            self._raw_keys[raw] = key
+        return key
+
+    def decode(self, key: int) -> dict:
+        """Canonical payload for a key; run_architecture_blueprint(decode(k)) is the result."""
+        merged = {"seo_needed": "true" if key & 1 else ""}
+        for name, _, values, _ in _FIELDS:
+            merged[name] = values[(key // self._strides[name]) % len(values)]
+        return merged
+
+    def precompute(self) -> None:
+        model = self._model
+        tables: Dict[str, bytes] = {}
+        for category, fields in _CATEGORIES:
+            combos: List[dict] = [{}]
+            for name in fields:
+                values = self._index[name]
+                combos = [{**combo, name: v} for combo in combos for v in values]
+            tables[category] = bytes(aggregate_scores(combo, model)[category] for combo in combos)
+        self._tables = tables
+
+    def _sync_model(self) -> ScoringModel:
+        model = SCORING_MODEL.current
+        if model is not self._model:
+            with self._lock:
+                if model is not self._model:
+                    precomputed = self._tables is not None
+                    self._model = model
+                    self._tables = None
+                    self._cache.clear()
+                    if precomputed:
+                        self.precompute()
+        return model
+
+    def _scores(self, merged: dict, model: ScoringModel) -> Dict[str, int]:
+        tables = self._tables
+        if tables is None or model is not self._model:
+            return aggregate_scores(merged, model)
+        scores: Dict[str, int] = {}
+        for category, fields in _CATEGORIES:
+            offset = 0
+            for name in fields:
+                index = self._index[name]
+                offset = offset * len(index) + index[merged[name]]
+            scores[category] = tables[category][offset]
+        return scores
+
+    def run(self, payload: dict) -> dict:
+        model = self._sync_model()
+        key = self._key(payload)
+        with self._lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return _copy_result(result)
+            self._misses += 1
+
+        merged = self.decode(key)
+        scores = self._scores(merged, model)
+        result = _build_blueprint(merged, scores, decide_tier(scores, model))
+        with self._lock:
+            if model is not self._model:  # reloaded meanwhile: don't cache a stale result
+                return _copy_result(result)
+            self._cache[key] = result
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return _copy_result(result)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._cache),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "precomputed": self._tables is not None,
+                "model_version": self._model.version,
+            }
+
+
+def create_blueprint_engine_from_env() -> BlueprintEngine:
+    """
+    ARCH_BLUEPRINT_CACHE_SIZE   memoized results (default 4096)
+    ARCH_BLUEPRINT_PRECOMPUTE   1 to build the score tables at startup (default 1)
+    """
+    return BlueprintEngine(
+        max_entries=int(os.getenv("ARCH_BLUEPRINT_CACHE_SIZE", 4096)),
+        precompute=os.getenv("ARCH_BLUEPRINT_PRECOMPUTE", "1") == "1",
+    )
+
+
+BLUEPRINT_ENGINE = create_blueprint_engine_from_env()
@@ -0,0 +1,168 @@
+"""
+Labs scoring model
+
+Weights and tier cutoffs used by the Architecture Blueprint and AI
+Readiness engines. The defaults are the values the engines were tuned
+with; a JSON file (LABS_SCORING_CONFIG) can override any subset of them:
+
+    {
+      "blueprint": {
+        "overall": {"load": 0.4, "data": 0.2, "features": 0.2, "risk": 0.2},
+        "tier_cutoffs": [40, 60, 80]
+      },
+      "ai_readiness": {"weights": {"data": 0.3, "workflows": 0.25, "opportunities": 0.25, "org": 0.2}}
+    }
+
+ScoringModelStore.reload() re-reads the file and swaps the model in one
+assignment; engines read `SCORING_MODEL.current` once per call, so a call
+never mixes two configurations. A file that fails validation is rejected
+and the previous model stays active.
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+
+DEFAULTS: Dict[str, Any] = {
+    "blueprint": {
+        "load": {"expected_users": 0.5, "concurrency": 0.3, "traffic_pattern": 0.2},
+        "data": {"data_size": 0.6, "data_type": 0.4},
+        "features": {"realtime": 0.4, "multi_tenancy": 0.3, "integrations": 0.3},
+        "risk": {"compliance": 0.4, "uptime": 0.4, "deployment": 0.2},
+        "overall": {"load": 0.35, "data": 0.25, "features": 0.2, "risk": 0.2},
+        "tier_cutoffs": [40, 60, 80],
+    },
+    "ai_readiness": {
+        "weights": {"data": 0.30, "workflows": 0.25, "opportunities": 0.25, "org": 0.20},
+    },
+}
+
+# Weight groups in formula order (the order terms are summed in)
+BLUEPRINT_GROUPS = ("load", "data", "features", "risk", "overall")
+
+
+def _section(name: str, value: Any) -> Dict[str, Any]:
+    """A config object that may be left out; anything but an object is rejected."""
+    if value is None:
+        return {}
+    if not isinstance(value, dict):
+        raise ValueError(f"{name}: expected an object, got {type(value).__name__}")
+    return value
+
+
+def _weights(group: str, values: Any, defaults: Dict[str, float]) -> Tuple[float, ...]:
+    values = _section(group, values)
+    unknown = set(values) - set(defaults)
+    if unknown:
+        raise ValueError(f"{group}: unknown weights {sorted(unknown)}")
+    merged = {**defaults, **values}
+    for name, weight in merged.items():
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)) or weight < 0:
+            raise ValueError(f"{group}.{name}: weight must be a non-negative number")
+    return tuple(float(merged[name]) for name in defaults)
+
+
+class ScoringModel:
+    """One immutable set of weights / cutoffs. `version` increases on every reload."""
+
+    __slots__ = ("load", "data", "features", "risk", "overall", "tier_cutoffs", "readiness", "version")
+
+    def __init__(
+        self,
+        load: Tuple[float, ...],
+        data: Tuple[float, ...],
+        features: Tuple[float, ...],
+        risk: Tuple[float, ...],
+        overall: Tuple[float, ...],
+        tier_cutoffs: Tuple[int, int, int],
+        readiness: Tuple[float, ...],
+        version: int = 0,
+    ) -> None:
+        self.load = load
+        self.data = data
+        self.features = features
+        self.risk = risk
+        self.overall = overall
+        self.tier_cutoffs = tier_cutoffs
+        self.readiness = readiness
+        self.version = version
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any], version: int = 0) -> "ScoringModel":
+        unknown = set(config) - set(DEFAULTS)
+        if unknown:
+            raise ValueError(f"unknown sections {sorted(unknown)}")
+        blueprint = _section("blueprint", config.get("blueprint"))
+        readiness = _section("ai_readiness", config.get("ai_readiness"))
+
+        groups = {
+            group: _weights(f"blueprint.{group}", blueprint.get(group), DEFAULTS["blueprint"][group])
+            for group in BLUEPRINT_GROUPS
+        }
+        cutoffs = blueprint.get("tier_cutoffs", DEFAULTS["blueprint"]["tier_cutoffs"])
+        if (
+            not isinstance(cutoffs, list)
+            or len(cutoffs) != 3
+            or not all(isinstance(c, (int, float)) and not isinstance(c, bool) for c in cutoffs)
+            or not cutoffs[0] <= cutoffs[1] <= cutoffs[2]
+        ):
+            raise ValueError("blueprint.tier_cutoffs: expected three ascending numbers")
+
+        return cls(
+            tier_cutoffs=tuple(cutoffs),
+            readiness=_weights("ai_readiness.weights", readiness.get("weights"), DEFAULTS["ai_readiness"]["weights"]),
+            version=version,
+            **groups,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        blueprint: Dict[str, Any] = {
+            group: dict(zip(DEFAULTS["blueprint"][group], getattr(self, group)))
+            for group in BLUEPRINT_GROUPS
+        }
+        blueprint["tier_cutoffs"] = list(self.tier_cutoffs)
+        return {
+            "version": self.version,
+            "blueprint": blueprint,
+            "ai_readiness": {"weights": dict(zip(DEFAULTS["ai_readiness"]["weights"], self.readiness))},
+        }
+
+
+class ScoringModelStore:
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._current = ScoringModel.from_dict({})
+        if path and os.path.exists(path):
+            self.reload()
+
+    @property
+    def current(self) -> ScoringModel:
+        return self._current
+
+    def reload(self) -> ScoringModel:
+        """Re-read the config file. Raises ValueError (old model kept) if it is invalid."""
+        with self._lock:
+            config: Dict[str, Any] = {}
+            if self.path and os.path.exists(self.path):
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        config = json.load(f)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{self.path}: {e}") from e
+                if not isinstance(config, dict):
+                    raise ValueError(f"{self.path}: expected a JSON object")
+            self._current = ScoringModel.from_dict(config, version=self._current.version + 1)
+            return self._current
+
+
+def create_scoring_model_store_from_env() -> ScoringModelStore:
+    """
+    LABS_SCORING_CONFIG   JSON file with weight / cutoff overrides (optional)
+    """
+    return ScoringModelStore(os.getenv("LABS_SCORING_CONFIG", "data/labs_scoring.json"))
+
+
+SCORING_MODEL = create_scoring_model_store_from_env()
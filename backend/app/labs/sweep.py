@@ -0,0 +1,162 @@
+"""
+Weight sweeps for the labs scoring model.
+
+Given the score columns of many submissions (score_architecture_blueprint_batch /
+score_ai_readiness_batch), evaluate the overall formula for every point of a
+weight grid in one vectorized pass and report the resulting distributions:
+
+    sweep_blueprint_tiers   tier counts (A/B/C/D) per grid point
+    sweep_ai_readiness      score histogram, mean and next-step split per grid point
+
+Only the final weighted sum is swept; category scores are taken as given (they
+were computed with the category weights of the model passed to the batch
+scorer). Submissions with identical sub-scores are collapsed into one
+weighted row first, and the grid is processed in chunks so the (grid, rows)
+intermediates stay under `max_elements`.
+
+The weighted sums are built term by term in the engines' operation order, so
+the default grid point reproduces the production scores exactly.
+"""
+
+import math
+from itertools import product
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .scoring_model import SCORING_MODEL
+
+TIERS = ("A", "B", "C", "D")
+NEXT_STEPS = ("blocked", "ready", "mixed")
+READINESS_BUCKETS = 10  # 0-9, 10-19, ..., 90-100
+
+DEFAULT_MAX_ELEMENTS = 1 << 16  # per chunk; keeps the float buffers cache-sized
+
+
+def weight_grid(axes: Sequence[Sequence[float]]) -> np.ndarray:
+    """Cartesian product of per-weight values, as a (points, len(axes)) float array."""
+    return np.array(list(product(*axes)), dtype=np.float64).reshape(-1, len(axes))
+
+
+def _unique_rows(*columns: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rows = np.stack(columns, axis=1)
+    if not len(rows):
+        return rows, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.intp)
+    rows, inverse, counts = np.unique(rows, axis=0, return_inverse=True, return_counts=True)
+    return rows, counts, inverse.reshape(-1)
+
+
+class _WeightedSums:
+    """
+    (points, rows) weighted sums of integer score rows, one grid chunk at a time.
+
+    Summed term by term into reused buffers (not a matmul), so float rounding
+    matches the scalar formulas: w[0] * a + w[1] * b + ...
+    """
+
+    def __init__(self, rows: np.ndarray, max_elements: int) -> None:
+        self.columns = [np.ascontiguousarray(rows[:, k], dtype=np.float64) for k in range(rows.shape[1])]
+        self.step = max(1, max_elements // max(len(rows), 1))
+        self._total = np.empty((self.step, len(rows)))
+        self._term = np.empty((self.step, len(rows)))
+
+    def chunks(self, weights: np.ndarray):
+        for start in range(0, len(weights), self.step):
+            part = slice(start, min(start + self.step, len(weights)))
+            w = weights[part]
+            total, term = self._total[:len(w)], self._term[:len(w)]
+            np.multiply(w[:, 0, None], self.columns[0], out=total)
+            for k in range(1, len(self.columns)):
+                np.multiply(w[:, k, None], self.columns[k], out=term)
+                total += term
+            yield part, total
+
+
+def _threshold(cutoff: float) -> float:
+    # clamp(int(x)) >= cutoff, rewritten as a plain float comparison on x
+    at_least = math.ceil(cutoff)
+    if at_least <= 0:
+        return -math.inf
+    if at_least > 100:
+        return math.inf
+    return float(at_least)
+
+
+def sweep_blueprint_tiers(
+    columns: Dict[str, np.ndarray],
+    weights: np.ndarray,
+    cutoffs: Optional[np.ndarray] = None,
+    max_elements: int = DEFAULT_MAX_ELEMENTS,
+) -> Dict[str, np.ndarray]:
+    """
+    Tier distribution for every (load, data, features, risk) weight row.
+
+    cutoffs: one (3,) row shared by all points, or (points, 3); defaults to the
+    active model's tier cutoffs.
+    """
+    weights = np.asarray(weights, dtype=np.float64).reshape(-1, 4)
+    if cutoffs is None:
+        cutoffs = SCORING_MODEL.current.tier_cutoffs
+    cutoffs = np.broadcast_to(np.asarray(cutoffs, dtype=np.float64), (len(weights), 3))
+    thresholds = np.vectorize(_threshold, otypes=[np.float64])(cutoffs)
+
+    rows, counts, _ = _unique_rows(columns["load"], columns["data"], columns["features"], columns["risk"])
+    counts_f = counts.astype(np.float64)
+    at_least = np.zeros((len(weights), 3))
+    for part, overall in _WeightedSums(rows, max_elements).chunks(weights):
+        for k in range(3):
+            at_least[part, k] = (overall >= thresholds[part, k, None]) @ counts_f
+    at_least = at_least.astype(np.int64)
+
+    total = int(counts.sum())
+    tiers = np.empty((len(weights), 4), dtype=np.int64)
+    tiers[:, 0] = total - at_least[:, 0]
+    tiers[:, 1] = at_least[:, 0] - at_least[:, 1]
+    tiers[:, 2] = at_least[:, 1] - at_least[:, 2]
+    tiers[:, 3] = at_least[:, 2]
+    return {"weights": weights, "cutoffs": np.array(cutoffs), "tiers": tiers, "total": total}
+
+
+def sweep_ai_readiness(
+    columns: Dict[str, np.ndarray],
+    weights: np.ndarray,
+    max_elements: int = DEFAULT_MAX_ELEMENTS,
+) -> Dict[str, np.ndarray]:
+    """
+    Readiness distribution for every (data, workflows, opportunities, org) weight row:
+    histogram over READINESS_BUCKETS, mean score and next-step counts (NEXT_STEPS order).
+    """
+    weights = np.asarray(weights, dtype=np.float64).reshape(-1, 4)
+    rows, counts, inverse = _unique_rows(columns["data"], columns["workflows"], columns["opportunities"], columns["org"])
+    total = int(counts.sum())
+
+    # Same branches as _readiness_report; "blocked" does not depend on the weights,
+    # "ready" also needs constraints >= 60 (folded into per-row counts)
+    blocked = (rows[:, 0] < 60) | (rows[:, 1] < 60) | (rows[:, 3] < 60)
+    constrained_ok = np.bincount(inverse, weights=columns["constraints"] >= 60, minlength=len(rows))
+    eligible = np.where(blocked, 0.0, constrained_ok)
+    counts_f = counts.astype(np.float64)
+
+    histogram = np.zeros((len(weights), READINESS_BUCKETS), dtype=np.int64)
+    score_sum = np.zeros(len(weights))
+    ready = np.zeros(len(weights))
+    for part, readiness in _WeightedSums(rows, max_elements).chunks(weights):
+        np.trunc(readiness, out=readiness)  # int(), not clamped, like run_ai_readiness
+        points = readiness.shape[0]
+        score_sum[part] = readiness @ counts_f
+        ready[part] = (readiness >= 70) @ eligible
+        buckets = np.minimum(readiness // 10, READINESS_BUCKETS - 1).astype(np.intp)
+        buckets += (np.arange(points) * READINESS_BUCKETS)[:, None]
+        histogram[part] = np.bincount(
+            buckets.ravel(),
+            weights=np.broadcast_to(counts_f, readiness.shape).ravel(),
+            minlength=points * READINESS_BUCKETS,
+        ).reshape(points, READINESS_BUCKETS)
+
+    blocked_count = int(counts[blocked].sum())
+    ready = ready.astype(np.int64)
+    next_steps = np.stack(
+        [np.full(len(weights), blocked_count), ready, total - blocked_count - ready], axis=1,
+    )
+    mean = score_sum / total if total else np.zeros(len(weights))
+    return {"weights": weights, "histogram": histogram, "mean": mean, "next_steps": next_steps, "total": total}
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+from contextlib import asynccontextmanager
 from typing import Optional, List, Dict, Any
 
-from fastapi import FastAPI, HTTPException, Depends, Header,BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, Header, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from .schemas import (
   ChatSessionCreateResponse,
@@ -19,25 +21,70 @@ from .schemas import (
   AuditResponse,
   EstimatorRequest,
   EstimatorResponse,
+  AuditBatchRequest,
+  AuditBatchResponse,
+  EstimatorBatchRequest,
+  EstimatorBatchResponse,
+  LabsBatchRequest,
+  MAX_BATCH_ITEMS,
+  ReasonChatRequest,
+  ReasonChatResponse,
+  ReasonLabNextRequest,
+  ReasonLabNextResponse,
 )
+from .analytics import create_analytics_log_from_env
 from .chat_engine import chat_engine
 from .content_store import STORE
-from .audit_engine import run_audit
-from .build_estimator_engine import run_estimator
+from .cpu_guard import create_cpu_guard_from_env
+from .feedback import create_feedback_log_from_env
+from .notifications import create_webhook_dispatcher_from_env
+from .request_budget import BodySizeLimitMiddleware, MessageTooLarge, create_request_budget_from_env
+from .response_cache import ResponseCache, etag_matches
+from .audit_engine import run_audit, run_audit_batch
+from .build_estimator_engine import run_estimator, run_estimator_batch
 
 # NEW: Architecture Blueprint Tool
-from .labs.architecture_blueprint_engine import run_architecture_blueprint
+from .labs.architecture_blueprint_engine import BLUEPRINT_ENGINE, run_architecture_blueprint_batch
+from .labs.scoring_model import SCORING_MODEL
 
 # NEW: ARE-3.5 reasoning engine imports
 from .reasoning.engine import ReasoningEngine
+from .reasoning.events import ESCALATIONS
 from .reasoning.memory import SessionMemory
-from .labs.ai_readiness_engine import run_ai_readiness
+from .reasoning.registry import INTENT_REGISTRY
+from .reasoning.router import ROUTER
+from .reasoning.timing import STAGE_TIMINGS
+from .reasoning.session_store import create_session_store_from_env
+from .labs.ai_readiness_engine import run_ai_readiness, run_ai_readiness_batch
+
+from .auth import TOKEN_VERIFIER, router as AuthRouter, require_admin, require_content_editor
+from .jobs_admin import router as JobsAdminRouter
+# Sales webhook: queued + coalesced + retried by a task that lives as long as the app
+SALES_NOTIFIER = create_webhook_dispatcher_from_env()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+  await SALES_NOTIFIER.start()
+  # Escalations published by the reasoning engine go straight to the notifier
+  ESCALATIONS.start_consumer(SALES_NOTIFIER.submit)
+  FEEDBACK.start()
+  ANALYTICS.start()
+  try:
+    yield
+  finally:
+    await asyncio.to_thread(ANALYTICS.stop)
+    await asyncio.to_thread(FEEDBACK.stop)
+    await asyncio.to_thread(ESCALATIONS.stop)
+    await SALES_NOTIFIER.stop()
+
 
-import os
-import httpx
+app = FastAPI(title="Ameotech Website Backend", version="0.2.0", lifespan=lifespan)
 
-from .auth import router as AuthRouter
-app = FastAPI(title="Ameotech Website Backend", version="0.2.0")
+# Body / message size caps; oversize bodies get a 413 before they are
+# buffered or JSON-decoded (added before CORS so CORS stays outermost)
+REQUEST_BUDGET = create_request_budget_from_env()
+app.add_middleware(BodySizeLimitMiddleware, budget=REQUEST_BUDGET)
 
 # CORS: allow local dev by default
 origins = [
@@ -54,50 +101,114 @@ app.add_middleware(
 )
 
 # ----------------------
-# In-memory store for reasoning sessions (ARE-3.5)
+# Session store for reasoning sessions (ARE-3.5)
 # ----------------------
 app.include_router(AuthRouter)
-REASON_SESSIONS: Dict[str, SessionMemory] = {}
+app.include_router(JobsAdminRouter)
+# Bounded LRU+TTL in-process by default; REASON_SESSION_BACKEND=sqlite to
+# persist across restarts and share between workers.
+REASON_SESSIONS = create_session_store_from_env()
 reason_engine = ReasoningEngine()
 
-def get_reason_session(session_id: str) -> SessionMemory:
-  session = REASON_SESSIONS.get(session_id)
-  if not session:
-    session = SessionMemory(session_id=session_id)
-    REASON_SESSIONS[session_id] = session
-  return session
 
-SALES_WEBHOOK_URL = os.getenv("SALES_WEBHOOK_URL")
+def _session_labels(session_id: str):
+  # peek(): reading labels must not refresh the session or count as a hit
+  session = REASON_SESSIONS.peek(session_id)
+  return (session.last_intent, session.state) if session is not None else None
 
 
-async def _post_sales_webhook(payload: dict):
-  if not SALES_WEBHOOK_URL:
-    print("[SALES-NOTIFY]", payload)
-    return
-  async with httpx.AsyncClient(timeout=5) as client:
-    try:
-      await client.post(SALES_WEBHOOK_URL, json={"text": str(payload)})
-    except Exception as exc:
-      print("[SALES-NOTIFY-ERROR]", exc)
+# /reason/feedback: ring buffer + writer thread into SQLite (FEEDBACK_DB_PATH)
+FEEDBACK = create_feedback_log_from_env(resolve=_session_labels)
 
+# Per-turn / per-lab-run analytics with hourly funnel rollups (ANALYTICS_DB_PATH);
+# lab runs are joined to chat sessions through the X-Session-Id header
+ANALYTICS = create_analytics_log_from_env()
+
+# Reasoning / labs / chat handlers are async and run on the event loop;
+# endpoints whose CPU time exceeds INLINE_CPU_BUDGET_US go to the threadpool.
+CPU_GUARD = create_cpu_guard_from_env()
+
+def get_reason_session(session_id: str) -> SessionMemory:
+  return REASON_SESSIONS.get_or_create(session_id)
+
+
+def _within_budget(message: str) -> str:
+  """User text trimmed to the request budget, or 413 under the reject policy."""
+  try:
+    return REQUEST_BUDGET.apply(message)
+  except MessageTooLarge as e:
+    raise HTTPException(status_code=413, detail=str(e))
 
 @app.post("/internal/notify-sales")
-async def notify_sales(payload: dict, background: BackgroundTasks):
+async def notify_sales(payload: dict):
   """
   Lightweight hook to notify sales (Slack/email/etc) when a chat or lab
-  result escalates to "talk to human".
+  result escalates to "talk to human". Chat escalations decided by the
+  reasoning engine are sent automatically (reasoning/events.py).
   """
   # You can enrich the payload here if needed.
-  background.add_task(_post_sales_webhook, payload)
+  SALES_NOTIFIER.submit(payload)
   return {"ok": True}
 
+
+@app.get("/internal/escalations/stats")
+def escalations_stats():
+  """Escalation event bus: queued, published, deduplicated and dropped events."""
+  return ESCALATIONS.stats()
+
+
+@app.get("/internal/notify-sales/stats")
+def notify_sales_stats():
+  """Webhook queue depth plus delivery / retry / outbox counters."""
+  return SALES_NOTIFIER.stats()
+
+
+@app.get("/internal/auth/stats")
+def auth_stats(_: Dict[str, Any] = Depends(require_admin)):
+  """Token verifier key ids and cache hit / miss counters (admin only)."""
+  return TOKEN_VERIFIER.stats()
+
+
+@app.get("/internal/cpu-guard/stats")
+def cpu_guard_stats():
+  return CPU_GUARD.stats()
+
+
+@app.get("/internal/request-budget/stats")
+def request_budget_stats():
+  """Configured size caps plus rejected / truncated counters."""
+  return REQUEST_BUDGET.stats()
+
+
+@app.get("/internal/reason-sessions/stats")
+def reason_sessions_stats():
+  """Session store size and eviction counters."""
+  return REASON_SESSIONS.stats()
+
+
+@app.get("/internal/metrics")
+def internal_metrics() -> Response:
+  """Prometheus text format: sampled per-stage reasoning latency histograms."""
+  return Response(content=STAGE_TIMINGS.prometheus(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/internal/intent-registry/stats")
+def intent_registry_stats():
+  """Active registry version plus reload and match latency."""
+  return INTENT_REGISTRY.stats()
+
+
+@app.get("/internal/router/rules")
+def router_rules():
+  """Compiled routing decision tables: predicates, rules and bitmasks per state."""
+  return ROUTER.describe()
+
 # ----------------------
 # Chat endpoints (existing chat_engine – unchanged)
 # ----------------------
 
 
-@app.post("/chat/session", response_model=ChatSessionCreateResponse)
-def create_chat_session() -> ChatSessionCreateResponse:
+def _create_chat_session() -> ChatSessionCreateResponse:
   session = chat_engine.create_session()
   welcome = chat_engine.initial_welcome(session)
   return ChatSessionCreateResponse(
@@ -107,10 +218,24 @@ def create_chat_session() -> ChatSessionCreateResponse:
   )
 
 
+# With a transcript log, messages and idle-session sweeps append to it
+# synchronously; thread_time misses that disk wait, so always offload.
+@app.post("/chat/session", response_model=ChatSessionCreateResponse)
+async def create_chat_session() -> ChatSessionCreateResponse:
+  return await CPU_GUARD.run("chat.session", _create_chat_session, blocking=chat_engine.transcript.enabled)
+
+
 @app.post("/chat/message", response_model=ChatMessageResponse)
-def chat_message(payload: ChatMessageRequest) -> ChatMessageResponse:
+async def chat_message(payload: ChatMessageRequest) -> ChatMessageResponse:
+  message = _within_budget(payload.message)
   try:
-    return chat_engine.handle_message(payload.session_id, payload.message)
+    return await CPU_GUARD.run(
+      "chat.message",
+      chat_engine.handle_message,
+      payload.session_id,
+      message,
+      blocking=chat_engine.transcript.enabled,
+    )
   except KeyError:
     raise HTTPException(status_code=404, detail="Session not found")
 
@@ -122,22 +247,38 @@ def chat_message(payload: ChatMessageRequest) -> ChatMessageResponse:
 
 
 @app.post("/labs/audit/run", response_model=AuditResponse)
-def labs_run_audit(payload: AuditRequest) -> AuditResponse:
-  result = run_audit(payload.dict())
+async def labs_run_audit(payload: AuditRequest, x_session_id: Optional[str] = Header(default=None)) -> AuditResponse:
+  result = await CPU_GUARD.run("labs.audit", run_audit, payload.dict())
+  ANALYTICS.record_lab_run("audit", x_session_id, result)
   return AuditResponse(**result)
 
 
+# Batch runs are plain `def` handlers: FastAPI runs them (and the response
+# serialization) in the threadpool, off the event loop.
+@app.post("/labs/audit/run-batch", response_model=AuditBatchResponse)
+def labs_run_audit_batch(payload: AuditBatchRequest) -> dict:
+  return {"results": run_audit_batch([p.dict() for p in payload.payloads])}
+
+
 # ----------------------
 # Labs: Build Cost & Delivery Model Estimator
 # ----------------------
 
 
 @app.post("/labs/build-estimator/run", response_model=EstimatorResponse)
-def labs_run_build_estimator(payload: EstimatorRequest) -> EstimatorResponse:
-  result = run_estimator(payload.dict())
+async def labs_run_build_estimator(
+  payload: EstimatorRequest, x_session_id: Optional[str] = Header(default=None)
+) -> EstimatorResponse:
+  result = await CPU_GUARD.run("labs.build_estimator", run_estimator, payload.dict())
+  ANALYTICS.record_lab_run("build_estimator", x_session_id, result)
   return EstimatorResponse(**result)
 
 
+@app.post("/labs/build-estimator/run-batch", response_model=EstimatorBatchResponse)
+def labs_run_build_estimator_batch(payload: EstimatorBatchRequest) -> dict:
+  return {"results": run_estimator_batch([p.dict() for p in payload.payloads])}
+
+
 # ----------------------
 # Labs: Architecture Blueprint Tool
 # ----------------------
@@ -203,46 +344,98 @@ class ArchitectureBlueprintResponse(BaseModel):
   cost_band: str
 
 
+class ArchitectureBlueprintBatchRequest(BaseModel):
+  payloads: List[ArchitectureBlueprintRequest] = Field(max_length=MAX_BATCH_ITEMS)
+
+
+class ArchitectureBlueprintBatchResponse(BaseModel):
+  results: List[ArchitectureBlueprintResponse]
+
+
 @app.post("/labs/architecture-blueprint/run", response_model=ArchitectureBlueprintResponse)
-def labs_run_architecture_blueprint(payload: ArchitectureBlueprintRequest) -> ArchitectureBlueprintResponse:
+async def labs_run_architecture_blueprint(
+  payload: ArchitectureBlueprintRequest, x_session_id: Optional[str] = Header(default=None)
+) -> ArchitectureBlueprintResponse:
   """
   Run the Architecture Blueprint engine and return a structured recommendation.
   """
-  result = run_architecture_blueprint(payload.dict())
+  result = await CPU_GUARD.run("labs.architecture_blueprint", BLUEPRINT_ENGINE.run, payload.dict())
+  ANALYTICS.record_lab_run("architecture_blueprint", x_session_id, result)
   return ArchitectureBlueprintResponse(**result)
 
 
+@app.post("/labs/architecture-blueprint/run-batch", response_model=ArchitectureBlueprintBatchResponse)
+def labs_run_architecture_blueprint_batch(payload: ArchitectureBlueprintBatchRequest) -> dict:
+  return {"results": run_architecture_blueprint_batch([p.dict() for p in payload.payloads])}
+
+
 # ----------------------
 # Content endpoints (public)
 # ----------------------
 
 
+# Pre-encoded JSON for public content, invalidated by STORE.generation
+CONTENT_CACHE = ResponseCache()
+
+
+def _cached_json(request: Request, key: tuple, build) -> Response:
+  cached = CONTENT_CACHE.get_or_build(key, STORE.generation, build)
+  headers = {
+    "ETag": cached.etag,
+    # Let browsers / CDNs store it, but always revalidate (cheap 304s)
+    "Cache-Control": "public, max-age=0, must-revalidate",
+  }
+  if etag_matches(request.headers.get("if-none-match"), cached.etag):
+    return Response(status_code=304, headers=headers)
+  return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+def _list_json(type: str) -> bytes:
+  items = STORE.list_items(type=type, status=ContentStatus.PUBLISHED)
+  return ContentListResponse(items=items).model_dump_json().encode()
+
+
+def _item_json(type: str, slug: str, not_found: str) -> bytes:
+  item = STORE.get_by_slug(type, slug, status=ContentStatus.PUBLISHED)
+  if not item:
+    raise HTTPException(status_code=404, detail=not_found)
+  return item.model_dump_json().encode()
+
+
 @app.get("/content/case-studies", response_model=ContentListResponse)
-def list_case_studies() -> ContentListResponse:
-  items = STORE.list_items(type=ContentType.CASE_STUDY, status=ContentStatus.PUBLISHED)
-  return ContentListResponse(items=items)
+def list_case_studies(request: Request) -> Response:
+  return _cached_json(
+    request,
+    ("list", ContentType.CASE_STUDY),
+    lambda: _list_json(ContentType.CASE_STUDY),
+  )
 
 
 @app.get("/content/case-studies/{slug}", response_model=ContentItem)
-def get_case_study(slug: str) -> ContentItem:
-  item = STORE.get_by_slug(ContentType.CASE_STUDY, slug, status=ContentStatus.PUBLISHED)
-  if not item:
-    raise HTTPException(status_code=404, detail="Case study not found")
-  return item
+def get_case_study(slug: str, request: Request) -> Response:
+  return _cached_json(
+    request,
+    ("item", ContentType.CASE_STUDY, slug),
+    lambda: _item_json(ContentType.CASE_STUDY, slug, "Case study not found"),
+  )
 
 
 @app.get("/content/jobs", response_model=ContentListResponse)
-def list_jobs() -> ContentListResponse:
-  items = STORE.list_items(type=ContentType.JOB_POST, status=ContentStatus.PUBLISHED)
-  return ContentListResponse(items=items)
+def list_jobs(request: Request) -> Response:
+  return _cached_json(
+    request,
+    ("list", ContentType.JOB_POST),
+    lambda: _list_json(ContentType.JOB_POST),
+  )
 
 
 @app.get("/content/jobs/{slug}", response_model=ContentItem)
-def get_job(slug: str) -> ContentItem:
-  item = STORE.get_by_slug(ContentType.JOB_POST, slug, status=ContentStatus.PUBLISHED)
-  if not item:
-    raise HTTPException(status_code=404, detail="Job not found")
-  return item
+def get_job(slug: str, request: Request) -> Response:
+  return _cached_json(
+    request,
+    ("item", ContentType.JOB_POST, slug),
+    lambda: _item_json(ContentType.JOB_POST, slug, "Job not found"),
+  )
 
 
 # ----------------------
@@ -250,25 +443,31 @@ def get_job(slug: str) -> ContentItem:
 # ----------------------
 
 
-@app.post("/reason/chat-route")
-def reason_chat_route(payload: dict):
+def _json(model) -> Response:
+  # Serialized by pydantic-core in one call, bypassing jsonable_encoder
+  return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def _reason_chat_route(payload: ReasonChatRequest) -> Response:
   """
   Route a chat message through the new ARE-3.5 reasoning engine (no LLM).
-  Expected payload from frontend:
+  Expected payload from frontend (ReasonChatRequest):
     {
       "session_id": str,
       "message": str,
       "page": str,
       "context": {...},
-      "history": [...]
+      "history": [...],
+      "timings": bool   # optional: per-stage timings in meta["timings_us"]
     }
   """
-  session_id = payload.get("session_id")
+  session_id = payload.session_id
   if not session_id:
     raise HTTPException(status_code=400, detail="session_id is required")
 
-  message = payload.get("message") or ""
-  page = payload.get("page") or "/"
+  # Budget first: an oversize message never reaches the pipeline
+  message = _within_budget(payload.message or "")
+  page = payload.page or "/"
 
   session = get_reason_session(session_id)
 
@@ -276,27 +475,46 @@ def reason_chat_route(payload: dict):
     session=session,
     user_raw_message=message,
     page=page,
+    include_timings=payload.timings,
+  )
+  REASON_SESSIONS.save(session)
+  ANALYTICS.record_turn(
+    session_id,
+    session.state,
+    result.intent,
+    result.intent_confidence,
+    result.action,
+    (result.action_payload or {}).get("lab_tool"),
   )
 
-  # SystemResponse → plain dict
-  return {
-    "session_id": result.session_id,
-    "intent": result.intent,
-    "intent_confidence": result.intent_confidence,
-    "action": result.action,
-    "action_payload": result.action_payload,
-    "bot_reply": result.bot_reply,
-    "meta": result.meta,
-  }
+  # SystemResponse → ReasonChatResponse; engine output is trusted, so no re-validation
+  return _json(ReasonChatResponse.model_construct(
+    session_id=result.session_id,
+    intent=result.intent,
+    intent_confidence=result.intent_confidence,
+    action=result.action,
+    action_payload=result.action_payload,
+    bot_reply=result.bot_reply,
+    meta=result.meta,
+  ))
+
+
+@app.post("/reason/chat-route", response_model=ReasonChatResponse)
+async def reason_chat_route(payload: ReasonChatRequest) -> Response:
+  return await CPU_GUARD.run(
+    "reason.chat_route",
+    _reason_chat_route,
+    payload,
+    blocking=REASON_SESSIONS.blocking_io,
+  )
 
 
-@app.post("/reason/lab-next")
-def reason_lab_next(payload: dict):
+def _reason_lab_next(payload: ReasonLabNextRequest) -> Response:
     """
     Deterministic “what next?” logic for Labs results.
     """
-    lab_tool = payload.get("lab_tool") or payload.get("lab")
-    lab_result = payload.get("lab_result") or payload.get("result") or {}
+    lab_tool = payload.lab_tool or payload.lab
+    lab_result = payload.lab_result or payload.result or {}
 
     next_actions = []
     reply_lines = []
@@ -445,55 +663,66 @@ def reason_lab_next(payload: dict):
         "You can share these lab results with the Ameotech team, or start a conversation via the contact form."
     )
 
-    return {
-        "action": "show_next_actions",
-        "action_payload": {"next_actions": next_actions},
-        "bot_reply": bot_reply,
-        "next_actions": next_actions,
-    }
+    return _json(ReasonLabNextResponse(
+        action="show_next_actions",
+        action_payload={"next_actions": next_actions},
+        bot_reply=bot_reply,
+        next_actions=next_actions,
+    ))
+
 
+@app.post("/reason/lab-next", response_model=ReasonLabNextResponse)
+async def reason_lab_next(payload: ReasonLabNextRequest) -> Response:
+  return await CPU_GUARD.run("reason.lab_next", _reason_lab_next, payload)
 
 
 @app.post("/reason/feedback")
-def reason_feedback(payload: dict):
+async def reason_feedback(payload: dict):
   """
-  Feedback stub (thumbs up/down, action_clicked, etc.).
-  Kept for compatibility; extend to log into DB or analytics later.
+  Feedback events (thumbs up/down, action_clicked, etc.).
+  Buffered in memory and written to the feedback table in batches by a
+  background thread. Session labels are read now; with a disk-backed
+  session store that read happens off the event loop.
   """
-  # For now, just acknowledge.
+  if REASON_SESSIONS.blocking_io:
+    await asyncio.to_thread(FEEDBACK.record, payload)
+  else:
+    FEEDBACK.record(payload)
   return {"ok": True}
 
 
+@app.get("/internal/feedback/stats")
+def feedback_stats():
+  """Feedback buffer depth plus written / dropped counters."""
+  return FEEDBACK.stats()
+
+
+@app.get("/internal/analytics/stats")
+def analytics_stats():
+  """Analytics buffer depth plus written / dropped counters."""
+  return ANALYTICS.stats()
+
+
 
 # ----------------------
 # Admin content endpoints
 # ----------------------
-
-
-def get_role(x_role: Optional[str] = Header(default=None)) -> str:
-  # Very simple role header for demo; replace with real auth in production
-  return x_role or "guest"
+# Authorization: Bearer <jwt from /auth/login>, verified by app.auth.TOKEN_VERIFIER
 
 
 @app.get("/admin/content", response_model=ContentListResponse)
-def admin_list_content(role: str = Depends(get_role)) -> ContentListResponse:
-  if role not in ("admin", "content_editor"):
-    raise HTTPException(status_code=403, detail="Forbidden")
+def admin_list_content(_: Dict[str, Any] = Depends(require_content_editor)) -> ContentListResponse:
   items = STORE.list_items()
   return ContentListResponse(items=items)
 
 
 @app.post("/admin/content", response_model=ContentItem)
-def admin_create_content(payload: ContentItemCreate, role: str = Depends(get_role)) -> ContentItem:
-  if role not in ("admin", "content_editor"):
-    raise HTTPException(status_code=403, detail="Forbidden")
+def admin_create_content(payload: ContentItemCreate, _: Dict[str, Any] = Depends(require_content_editor)) -> ContentItem:
   return STORE.create(payload)
 
 
 @app.get("/admin/content/{item_id}", response_model=ContentItem)
-def admin_get_content(item_id: str, role: str = Depends(get_role)) -> ContentItem:
-  if role not in ("admin", "content_editor"):
-    raise HTTPException(status_code=403, detail="Forbidden")
+def admin_get_content(item_id: str, _: Dict[str, Any] = Depends(require_content_editor)) -> ContentItem:
   item = STORE.get(item_id)
   if not item:
     raise HTTPException(status_code=404, detail="Content item not found")
@@ -501,9 +730,7 @@ def admin_get_content(item_id: str, role: str = Depends(get_role)) -> ContentIte
 
 
 @app.put("/admin/content/{item_id}", response_model=ContentItem)
-def admin_update_content(item_id: str, payload: ContentItemCreate, role: str = Depends(get_role)) -> ContentItem:
-  if role not in ("admin", "content_editor"):
-    raise HTTPException(status_code=403, detail="Forbidden")
+def admin_update_content(item_id: str, payload: ContentItemCreate, _: Dict[str, Any] = Depends(require_content_editor)) -> ContentItem:
   updated = STORE.update(item_id, payload)
   if not updated:
     raise HTTPException(status_code=404, detail="Content item not found")
@@ -511,9 +738,7 @@ def admin_update_content(item_id: str, payload: ContentItemCreate, role: str = D
 
 
 @app.post("/admin/content/{item_id}/publish", response_model=ContentItem)
-def admin_publish_content(item_id: str, role: str = Depends(get_role)) -> ContentItem:
-  if role not in ("admin", "content_editor"):
-    raise HTTPException(status_code=403, detail="Forbidden")
+def admin_publish_content(item_id: str, _: Dict[str, Any] = Depends(require_content_editor)) -> ContentItem:
   updated = STORE.set_status(item_id, ContentStatus.PUBLISHED)
   if not updated:
     raise HTTPException(status_code=404, detail="Content item not found")
@@ -521,19 +746,79 @@ def admin_publish_content(item_id: str, role: str = Depends(get_role)) -> Conten
 
 
 @app.post("/admin/content/{item_id}/archive", response_model=ContentItem)
-def admin_archive_content(item_id: str, role: str = Depends(get_role)) -> ContentItem:
-  if role not in ("admin", "content_editor"):
-    raise HTTPException(status_code=403, detail="Forbidden")
+def admin_archive_content(item_id: str, _: Dict[str, Any] = Depends(require_content_editor)) -> ContentItem:
   updated = STORE.set_status(item_id, ContentStatus.ARCHIVED)
   if not updated:
     raise HTTPException(status_code=404, detail="Content item not found")
   return updated
 
+
+@app.post("/admin/intent-registry/reload")
+def admin_reload_intent_registry(_: Dict[str, Any] = Depends(require_admin)) -> Dict[str, Any]:
+  """Rebuild the intent matcher from INTENT_REGISTRY_PATH; a bad file is rejected and the active one kept."""
+  try:
+    INTENT_REGISTRY.reload()
+  except (OSError, ValueError) as e:
+    raise HTTPException(status_code=400, detail=f"Intent registry not reloaded: {e}")
+  return INTENT_REGISTRY.stats()
+
+
+@app.get("/admin/labs/scoring-model")
+def admin_get_scoring_model(_: Dict[str, Any] = Depends(require_admin)) -> Dict[str, Any]:
+  return SCORING_MODEL.current.to_dict()
+
+
+@app.post("/admin/labs/scoring-model/reload")
+def admin_reload_scoring_model(_: Dict[str, Any] = Depends(require_admin)) -> Dict[str, Any]:
+  """Re-read LABS_SCORING_CONFIG; an invalid file is rejected and the active model kept."""
+  try:
+    model = SCORING_MODEL.reload()
+  except (OSError, ValueError) as e:
+    raise HTTPException(status_code=400, detail=f"Scoring model not reloaded: {e}")
+  return model.to_dict()
+
+@app.get("/admin/feedback/summary")
+def admin_feedback_summary(
+  by: str = "intent",
+  since: Optional[float] = None,
+  until: Optional[float] = None,
+  min_rated: int = 1,
+  _: Dict[str, Any] = Depends(require_admin),
+) -> List[Dict[str, Any]]:
+  """Thumbs-down rate per group; `by` is a comma list of intent, state, action, event, source."""
+  try:
+    return FEEDBACK.store.summary([c.strip() for c in by.split(",") if c.strip()], since, until, min_rated)
+  except ValueError as e:
+    raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.get("/admin/analytics/funnel")
+def admin_analytics_funnel(
+  since: Optional[float] = None,
+  until: Optional[float] = None,
+  bucket: Optional[str] = None,
+  tool: Optional[str] = None,
+  _: Dict[str, Any] = Depends(require_admin),
+) -> Dict[str, Any]:
+  """Chat → lab → escalation funnel from the hourly rollups; `bucket` is hour, day or week."""
+  try:
+    return ANALYTICS.store.funnel(since, until, bucket, tool)
+  except ValueError as e:
+    raise HTTPException(status_code=400, detail=str(e))
+
+
 @app.post("/labs/ai-readiness/run")
-def run_ai_readiness_route(payload: dict):
+async def run_ai_readiness_route(payload: dict, x_session_id: Optional[str] = Header(default=None)):
     """
     AI Readiness Scan – deterministic scoring based on data, workflows, AI opportunities,
     organisation readiness and constraints.
     """
-    return run_ai_readiness(payload)
+    result = await CPU_GUARD.run("labs.ai_readiness", run_ai_readiness, payload)
+    ANALYTICS.record_lab_run("ai_readiness", x_session_id, result)
+    return result
+
+
+@app.post("/labs/ai-readiness/run-batch")
+def run_ai_readiness_batch_route(payload: LabsBatchRequest):
+    return {"results": run_ai_readiness_batch(payload.payloads)}
 
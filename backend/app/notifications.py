@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set
+
+import httpx
+
+from .jsonl_log import JsonlLog
+
+# Retryable HTTP statuses besides 5xx
+RETRY_STATUSES = {408, 425, 429}
+
+
+class WebhookDispatcher:
+  """Queued, coalescing, retrying delivery for the sales webhook.
+
+  `submit()` only enqueues; a background task (started from the app
+  lifespan) drains the queue:
+
+  - payloads arriving within `batch_window` of the first one (up to
+    `max_batch`) go out as one POST: {"text": ..., "count": n, "items": [...]},
+    where "text" joins the items for Slack-style receivers;
+  - one process-wide httpx.AsyncClient keeps connections alive, capped at
+    `max_connections`;
+  - network errors, 5xx, 408/425/429 are retried up to `max_attempts` with
+    exponential backoff and jitter (Retry-After is honoured, capped);
+  - batches that still fail, or that arrive while the queue is full or the
+    app is shutting down, are appended to the JSONL outbox. The outbox is
+    queued again on the next start;
+  - batches the receiver rejects outright (a 4xx that is not retryable) are
+    dead-lettered: kept in the outbox with their status for inspection,
+    never queued again.
+
+  `url=None` keeps the old behaviour of printing the payload.
+  """
+
+  def __init__(
+    self,
+    url: Optional[str],
+    outbox_path: Optional[str] = None,
+    batch_window: float = 0.25,
+    max_batch: int = 50,
+    max_queue: int = 10_000,
+    max_attempts: int = 5,
+    backoff_base: float = 0.5,
+    backoff_max: float = 30.0,
+    timeout: float = 5.0,
+    max_connections: int = 4,
+    drain_timeout: float = 5.0,
+  ) -> None:
+    self.url = url
+    self.outbox = JsonlLog(outbox_path)
+    self.batch_window = batch_window
+    self.max_batch = max_batch
+    self.max_queue = max_queue
+    self.max_attempts = max_attempts
+    self.backoff_base = backoff_base
+    self.backoff_max = backoff_max
+    self.timeout = timeout
+    self.max_connections = max_connections
+    self.drain_timeout = drain_timeout
+
+    self._client: Optional[httpx.AsyncClient] = None
+    self._queue: Optional[asyncio.Queue] = None
+    self._task: Optional[asyncio.Task] = None
+    self._loop: Optional[asyncio.AbstractEventLoop] = None
+    self._loop_thread: Optional[int] = None
+    self._inflight: List[Dict[str, Any]] = []
+    self._spills: Set[asyncio.Task] = set()
+    self._counts: Dict[str, int] = {
+      "submitted": 0, "delivered": 0, "posts": 0, "retries": 0,
+      "failed_posts": 0, "spilled": 0, "dead_lettered": 0, "requeued_from_outbox": 0,
+      "worker_errors": 0,
+    }
+    self._lock = threading.Lock()
+
+  def _count(self, name: str, n: int = 1) -> None:
+    with self._lock:
+      self._counts[name] += n
+
+  @property
+  def running(self) -> bool:
+    return self._task is not None and not self._task.done()
+
+  async def start(self) -> None:
+    if not self.url or self.running:
+      return
+    self._loop = asyncio.get_running_loop()
+    self._loop_thread = threading.get_ident()
+    self._queue = asyncio.Queue(maxsize=self.max_queue)
+    self._client = httpx.AsyncClient(
+      timeout=httpx.Timeout(self.timeout),
+      limits=httpx.Limits(
+        max_connections=self.max_connections,
+        max_keepalive_connections=self.max_connections,
+        keepalive_expiry=60.0,
+      ),
+    )
+    await self._requeue_outbox()
+    self._task = asyncio.create_task(self._run(), name="sales-webhook-dispatcher")
+
+  async def stop(self) -> None:
+    """Deliver what is queued (bounded by drain_timeout), spill the rest, close the client."""
+    if self._task is None:
+      return
+    task, self._task = self._task, None
+    try:
+      self._queue.put_nowait(None)  # sentinel: the worker exits once everything before it is sent
+      await asyncio.wait_for(asyncio.shield(task), self.drain_timeout)
+    except (asyncio.QueueFull, asyncio.TimeoutError):
+      task.cancel()
+      try:
+        await task
+      except asyncio.CancelledError:
+        pass
+      except Exception as exc:
+        print("[SALES-NOTIFY-ERROR] dispatcher failed:", repr(exc))
+    except Exception as exc:
+      # The worker died earlier; still spill what is queued and close the client
+      print("[SALES-NOTIFY-ERROR] dispatcher failed:", repr(exc))
+    try:
+      leftover = [self._queue.get_nowait() for _ in range(self._queue.qsize())]
+      await self._spill([p for p in leftover if p is not None], "shutdown")
+      if self._spills:
+        await asyncio.gather(*self._spills, return_exceptions=True)
+    except Exception as exc:
+      print("[SALES-NOTIFY-ERROR] outbox write failed on shutdown:", repr(exc))
+    finally:
+      await self._client.aclose()
+      self._client = None
+
+  # ---------------- producer side ----------------
+
+  def submit(self, payload: Dict[str, Any]) -> None:
+    """Enqueue a notification. Never blocks; safe to call from worker threads."""
+    self._count("submitted")
+    if not self.url:
+      print("[SALES-NOTIFY]", payload)
+      return
+    if self._loop is None or not self.running:
+      # Not started, stopped, or the worker died: keep it for the next start
+      self._spill_soon(payload, "not_running")
+      return
+    if threading.get_ident() == self._loop_thread:
+      self._put(payload)
+    else:
+      self._loop.call_soon_threadsafe(self._put, payload)
+
+  def _put(self, payload: Dict[str, Any]) -> None:
+    try:
+      self._queue.put_nowait(payload)
+    except asyncio.QueueFull:
+      self._spill_soon(payload, "queue_full")
+
+  def _spill_soon(self, payload: Dict[str, Any], reason: str) -> None:
+    """Spill from sync code: the outbox write never runs on an event loop thread."""
+    try:
+      loop = asyncio.get_running_loop()
+    except RuntimeError:
+      loop = None
+    if loop is None:
+      # A worker thread: writing here blocks nobody
+      self.outbox.append([{"payload": payload, "reason": reason, "ts": time.time()}])
+      self._count("spilled")
+      return
+    task = loop.create_task(self._spill([payload], reason))
+    self._spills.add(task)
+    task.add_done_callback(self._spills.discard)
+
+  # ---------------- consumer side ----------------
+
+  async def _run(self) -> None:
+    loop = asyncio.get_running_loop()
+    try:
+      while True:
+        first = await self._queue.get()
+        if first is None:
+          return
+        batch = self._inflight = [first]
+        deadline = loop.time() + self.batch_window
+        stop = False
+        while len(batch) < self.max_batch:
+          remaining = deadline - loop.time()
+          if remaining <= 0:
+            break
+          try:
+            item = await asyncio.wait_for(self._queue.get(), remaining)
+          except asyncio.TimeoutError:
+            break
+          if item is None:
+            stop = True
+            break
+          batch.append(item)
+        try:
+          await self._deliver(batch)
+        except Exception as exc:
+          # One bad batch (malformed URL, failing outbox write, ...) must not
+          # kill the worker and strand everything queued behind it
+          self._count("worker_errors")
+          print("[SALES-NOTIFY-ERROR]", repr(exc), f"({len(batch)} item(s) moved to outbox)")
+          try:
+            await self._spill(batch, f"{type(exc).__name__}: {exc}")
+          except Exception as spill_exc:
+            print("[SALES-NOTIFY-ERROR] outbox write failed, batch lost:", repr(spill_exc))
+        self._inflight = []
+        if stop:
+          return
+    except asyncio.CancelledError:
+      await self._spill(self._inflight, "shutdown")
+      self._inflight = []
+      raise
+
+  @staticmethod
+  def _body(batch: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"text": "\n".join(str(p) for p in batch), "count": len(batch), "items": batch}
+
+  def _backoff(self, attempt: int, response: Optional[httpx.Response]) -> float:
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after and retry_after.isdigit():
+      return min(float(retry_after), self.backoff_max)
+    delay = min(self.backoff_base * (2 ** attempt), self.backoff_max)
+    return delay * random.uniform(0.5, 1.0)
+
+  async def _deliver(self, batch: List[Dict[str, Any]]) -> bool:
+    body = self._body(batch)
+    error = ""
+    rejected: Optional[int] = None
+    for attempt in range(self.max_attempts):
+      if attempt:
+        self._count("retries")
+      response = None
+      try:
+        response = await self._client.post(self.url, json=body)
+        self._count("posts")
+        if response.status_code < 300:
+          self._count("delivered", len(batch))
+          return True
+        error = f"HTTP {response.status_code}"
+        self._count("failed_posts")
+        if response.status_code < 500 and response.status_code not in RETRY_STATUSES:
+          rejected = response.status_code  # retrying (now or on restart) will not help
+          break
+      except httpx.HTTPError as exc:
+        error = f"{type(exc).__name__}: {exc}"
+        self._count("failed_posts")
+      if attempt + 1 < self.max_attempts:
+        await asyncio.sleep(self._backoff(attempt, response))
+    if rejected is not None:
+      print("[SALES-NOTIFY-ERROR]", error, f"({len(batch)} item(s) dead-lettered)")
+      await self._spill(batch, error, status=rejected)
+      return False
+    print("[SALES-NOTIFY-ERROR]", error, f"({len(batch)} item(s) moved to outbox)")
+    await self._spill(batch, error)
+    return False
+
+  # ---------------- outbox ----------------
+
+  async def _spill(self, payloads: List[Dict[str, Any]], reason: str, status: Optional[int] = None) -> None:
+    """Append to the outbox; with `status` (a non-retryable rejection) as dead letters."""
+    if not payloads:
+      return
+    now = time.time()
+    records = [{"payload": p, "reason": reason, "ts": now} for p in payloads]
+    if status is not None:
+      for record in records:
+        record["status"] = status
+        record["dead_letter"] = True
+    await asyncio.to_thread(self.outbox.append, records)
+    self._count("dead_lettered" if status is not None else "spilled", len(records))
+
+  def _take_outbox(self) -> List[Dict[str, Any]]:
+    """Move the outbox aside; dead letters go back in, the other payloads are returned."""
+    path = self.outbox.path
+    if not path or not os.path.exists(path):
+      return []
+    replay_path = f"{path}.replay"
+    os.replace(path, replay_path)
+    payloads, dead = [], []
+    for record in JsonlLog(replay_path).read():
+      (dead if record.get("dead_letter") else payloads).append(record)
+    self.outbox.append(dead)
+    os.remove(replay_path)
+    return [r["payload"] for r in payloads]
+
+  async def _requeue_outbox(self) -> None:
+    """Queue outbox payloads again (they re-spill if they fail); dead letters stay put."""
+    payloads = await asyncio.to_thread(self._take_outbox)
+    for payload in payloads:
+      self._put(payload)
+    self._count("requeued_from_outbox", len(payloads))
+
+  def stats(self) -> Dict[str, Any]:
+    with self._lock:
+      counts = dict(self._counts)
+    return {
+      "enabled": bool(self.url),
+      "running": self.running,
+      "queued": self._queue.qsize() if self._queue is not None else 0,
+      "inflight": len(self._inflight),
+      "outbox_path": self.outbox.path,
+      **counts,
+    }
+
+
+def create_webhook_dispatcher_from_env() -> WebhookDispatcher:
+  """
+  SALES_WEBHOOK_URL                 webhook endpoint; unset = print notifications instead
+  SALES_WEBHOOK_OUTBOX_PATH         JSONL file for undeliverable items (default data/sales_outbox.jsonl)
+  SALES_WEBHOOK_BATCH_WINDOW_MS     coalescing window after the first queued item (default 250)
+  SALES_WEBHOOK_MAX_BATCH           items per POST (default 50)
+  SALES_WEBHOOK_MAX_ATTEMPTS        tries per POST before spilling to the outbox (default 5)
+  SALES_WEBHOOK_TIMEOUT_SECONDS     per-request timeout (default 5)
+  SALES_WEBHOOK_MAX_CONNECTIONS     pooled connections (default 4)
+  """
+  return WebhookDispatcher(
+    url=os.getenv("SALES_WEBHOOK_URL") or None,
+    outbox_path=os.getenv("SALES_WEBHOOK_OUTBOX_PATH", "data/sales_outbox.jsonl"),
+    batch_window=float(os.getenv("SALES_WEBHOOK_BATCH_WINDOW_MS", 250)) / 1000,
+    max_batch=int(os.getenv("SALES_WEBHOOK_MAX_BATCH", 50)),
+    max_attempts=int(os.getenv("SALES_WEBHOOK_MAX_ATTEMPTS", 5)),
+    timeout=float(os.getenv("SALES_WEBHOOK_TIMEOUT_SECONDS", 5)),
+    max_connections=int(os.getenv("SALES_WEBHOOK_MAX_CONNECTIONS", 4)),
+  )
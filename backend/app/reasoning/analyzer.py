@@ -1,12 +1,13 @@
 # backend/app/reasoning/analyzer.py
 
-from typing import Dict
-import re
+from typing import Dict, Optional
 
+from .markers import scan_markers
+from .text import NormalizedText, is_rejection as has_rejection
 from .utils import normalize
 
 
-def analyze_message(message: str) -> Dict:
+def analyze_message(message: str, text: Optional[NormalizedText] = None) -> Dict:
     """
     Light-weight, deterministic analyzer.
     No ML, simple pattern-based classification.
@@ -17,78 +18,45 @@ def analyze_message(message: str) -> Dict:
       - tone
       - is_rejection
       - is_meta
+      - markers (hit-flags from the shared marker table)
+      - tokens (normalized token stream)
+
+    `text` is the engine's NormalizedText for `message`; when given, its
+    clean form, rejection flag and tokens are reused instead of recomputed.
     """
 
     original = message or ""
-    clean = normalize(original)
+    clean = text.clean if text is not None else normalize(original)
+    markers = scan_markers(clean)
 
     msg_type = "normal"
     tone = "neutral"
-    is_rejection = False
     is_meta = False
 
     # ---------------------------
     # Confusion / clarification
     # ---------------------------
-    confusion_markers = [
-        "what do you mean",
-        "not clear",
-        "don't understand",
-        "do not understand",
-        "explain again",
-        "say again",
-        "come again",
-        "you mean what",
-    ]
-    if any(phrase in clean for phrase in confusion_markers):
+    if "confusion" in markers:
         msg_type = "confused"
         tone = "uncertain"
 
     # ---------------------------
     # Rejection of suggestion / tool
     # ---------------------------
-    rejection_patterns = [
-        r"\bno\b",
-        r"\bno thanks\b",
-        r"\bnot now\b",
-        r"\bdon't want\b",
-        r"\bdo not want\b",
-        r"\bstop\b",
-        r"\bskip\b",
-        r"\bleave it\b",
-    ]
-    if any(re.search(pat, clean) for pat in rejection_patterns):
-        is_rejection = True
+    # One precompiled alternation (text.REJECTION_PHRASES), already run by normalize_text
+    is_rejection = text.is_rejection if text is not None else has_rejection(clean)
 
     # ---------------------------
     # Insults / strong negative
     # ---------------------------
-    insult_markers = [
-        "dumb", "stupid", "idiot", "useless", "scam", "fraud",
-        "you suck", "terrible bot", "worst bot", "you are still dummy",
-    ]
-    if any(word in clean for word in insult_markers):
+    if "insult" in markers:
         msg_type = "insult"
         tone = "frustrated"
 
     # ---------------------------
     # Trust / legitimacy questions
     # ---------------------------
-    trust_markers = [
-        "can i trust",
-        "can we trust",
-        "are you legit",
-        "are you real",
-        "is this real",
-        "is this a scam",
-        "are you a scam",
-        "are you fraud",
-        "is ameotech legit",
-        "is ameotech real",
-        "are you guys real",
-        "you guys real",
-    ]
-    if any(phrase in clean for phrase in trust_markers):
+    if "trust" in markers:
         msg_type = "trust"
         tone = "cautious"
         is_meta = True
@@ -96,11 +64,7 @@ def analyze_message(message: str) -> Dict:
     # ---------------------------
     # Bot / AI meta talk
     # ---------------------------
-    bot_markers = [
-        "chatgpt", "gpt", "ai bot", "are you ai", "are you a bot",
-        "you a bot", "you are bot", "llm", "large language model",
-    ]
-    if any(word in clean for word in bot_markers):
+    if "bot" in markers:
         is_meta = True
         if msg_type == "normal":
             msg_type = "meta"
@@ -118,4 +82,6 @@ def analyze_message(message: str) -> Dict:
         "tone": tone,
         "is_rejection": is_rejection,
         "is_meta": is_meta,
+        "markers": markers,
+        "tokens": text.tokens if text is not None else tuple(clean.split()),
     }
@@ -14,47 +14,23 @@ Deterministic scoring:
 
 from typing import Dict, Tuple
 
+from .markers import markers_of
 from .registry import INTENT_REGISTRY
-from .utils import normalize, fuzzy_ratio
+from .utils import normalize
 
 
-def _score_intents(message: str, page: str, session) -> Dict[str, float]:
-    clean = normalize(message)
+def _score_intents(clean: str, page: str, session) -> Dict[str, float]:
+    """
+    Per-intent scores:
+    - keyword hit +1.0 (fuzzy partial +0.6 for longer keywords)
+    - synonym hit +0.5
+    - page prefix +0.4
+    - last_intent +0.2 / goal +0.5
+    then multiplied by the intent weight.
+    """
     page = page or "/"
-    scores: Dict[str, float] = {}
-
-    for intent, cfg in INTENT_REGISTRY.items():
-        score = 0.0
-
-        # Keyword hits
-        for kw in cfg["keywords"]:
-            if kw in clean:
-                score += 1.0
-            else:
-                # fuzzy partial for longer words
-                if len(kw) > 4 and fuzzy_ratio(clean, kw) > 0.8:
-                    score += 0.6
-
-        # Synonym hits
-        for syn in cfg["synonyms"]:
-            if syn in clean:
-                score += 0.5
-
-        # Page boosts
-        for p in cfg["pages"]:
-            if page.startswith(p):
-                score += 0.4
-
-        # Context reinforcement (light)
-        if session.last_intent == intent:
-            score += 0.2
-        if session.goal == intent:
-            score += 0.5
-
-        score *= cfg.get("weight", 1.0)
-        scores[intent] = score
-
-    return scores
+    # Compiled matcher: one automaton pass + bounded fuzzy lookups per message
+    return INTENT_REGISTRY.score(clean, page, session)
 
 
 def detect_intent(
@@ -70,8 +46,11 @@ def detect_intent(
         meta: dict (currently all_scores; analysis is also mutated to include topic_hint)
     """
 
-    clean = normalize(message)
-    scores = _score_intents(message, page, session)
+    # The analyzer already normalized this message
+    clean = analysis.get("clean")
+    if clean is None:
+        clean = normalize(message)
+    scores = _score_intents(clean, page, session)
     top_intent = max(scores, key=lambda k: scores[k])
     top_score = scores[top_intent]
 
@@ -83,28 +62,14 @@ def detect_intent(
     # Topic hint detection
     # -----------------------------
     # These hints are softer than full intent but guide the router.
-    careers_hint_terms = [
-        "job", "jobs", "opening", "openning", "career", "careers",
-        "hiring", "vacancy", "internship", "intern", "position", "role",
-    ]
-    existing_hint_terms = [
-        "existing system", "existing app", "legacy",
-        "website", "web site", "site",
-        "bug", "bugs", "issue", "issues", "error", "errors",
-        "crash", "crashing", "down", "slow", "performance",
-        "maintenance", "maintain", "support",
-    ]
-    project_hint_terms = [
-        "project", "product", "app", "application", "platform",
-        "saas", "tool", "solution", "idea", "mvp", "prototype",
-    ]
+    markers = markers_of(analysis, clean)
 
     topic_hint = None
-    if any(t in clean for t in careers_hint_terms):
+    if "careers" in markers:
         topic_hint = "careers_like"
-    elif any(t in clean for t in existing_hint_terms):
+    elif "existing" in markers:
         topic_hint = "existing_like"
-    elif any(t in clean for t in project_hint_terms):
+    elif "project_hint" in markers:
         topic_hint = "project_like"
 
     # Push topic_hint into analysis so router can see it
@@ -141,44 +106,19 @@ def detect_intent(
     # -----------------------------
     # 4. Direct "talk to human"
     # -----------------------------
-    human_triggers = [
-        "talk to human",
-        "talk to someone",
-        "speak to someone",
-        "someone real",
-        "real person",
-        "call me",
-        "can you call",
-    ]
-    if any(k in clean for k in human_triggers):
+    if "human" in markers:
         return "contact_human", 0.9, scores
 
     # -----------------------------
     # 5. Domain override rules
     # -----------------------------
     # Use stronger markers for hard routing; topic_hint is softer.
-    careers_markers = careers_hint_terms
-
-    project_markers = [
-        "new project", "start a project", "start project",
-        "build a project", "build product", "new product",
-        "new saas", "new app", "mvp", "prototype", "launch an app",
-    ]
-
-    existing_markers = [
-        "existing system", "existing app", "legacy",
-        "website", "web site", "site",
-        "bug", "bugs", "issue", "issues", "error", "errors",
-        "crash", "crashing", "down", "slow", "performance",
-        "maintenance", "maintain", "support",
-    ]
-
-    has_careers = any(m in clean for m in careers_markers)
-    has_project_strong = any(m in clean for m in project_markers)
-    has_existing = any(m in clean for m in existing_markers)
+    has_careers = "careers" in markers
+    has_project_strong = "project_strong" in markers
+    has_existing = "existing" in markers
 
     # Generic "project" as a strong hint if not clearly careers
-    generic_project = "project" in clean
+    generic_project = "project_word" in markers
     has_project = has_project_strong or (generic_project and not has_careers)
 
     # If message clearly looks like a system/website/app issue,
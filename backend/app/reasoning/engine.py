@@ -6,6 +6,9 @@ Deterministic multi-stage conversational pipeline.
 No ML, no embeddings, no GPT at runtime.
 """
 
+from time import perf_counter_ns
+from typing import List, Optional
+
 from .memory import SessionMemory
 from .analyzer import analyze_message
 from .classifier import detect_intent
@@ -13,25 +16,49 @@ from .state_machine import StateMachine
 from .router import route_message
 from .humanize import humanize
 from .templates import SystemResponse
-from .safety import sanitize_input
+from .events import ESCALATIONS, EscalationEvent, EventBus
+from .text import normalize_text
+from .timing import STAGE_TIMINGS, StageTimings
 
 
 class ReasoningEngine:
 
-    def __init__(self):
+    def __init__(self, timings: Optional[StageTimings] = None, events: Optional[EventBus] = None):
         self.sm = StateMachine()
+        self.timings = timings or STAGE_TIMINGS
+        self.events = events or ESCALATIONS
 
-    def process(self, session: SessionMemory, user_raw_message: str, page: str):
+    def process(self, session: SessionMemory, user_raw_message: str, page: str, include_timings: bool = False):
         """
         Main entrypoint for every message.
         Returns SystemResponse.
+
+        Sampled requests (and any with include_timings) record per-stage
+        timings; include_timings also puts them in meta["timings_us"].
         """
+        if not (self.timings.should_sample() or include_timings):
+            return self._process(session, user_raw_message, page, None)
+
+        marks = [perf_counter_ns()]
+        response = self._process(session, user_raw_message, page, marks)
+        self.timings.record(marks)
+        if include_timings:
+            response.meta["timings_us"] = self.timings.breakdown(marks)
+        return response
 
-        # 1. Clean + sanity check message
-        user_message = sanitize_input(user_raw_message)
+    def _process(self, session: SessionMemory, user_raw_message: str, page: str, marks: Optional[List[int]]):
+        # marks: when timing, perf_counter_ns() is appended after each stage (timing.STAGES)
+
+        # 1. Clean + sanity check message (whitespace, profanity, rejection, tokens)
+        text = normalize_text(user_raw_message)
+        user_message = text.text
+        if marks is not None:
+            marks.append(perf_counter_ns())
 
         # 2. Analyzer → extract structure & tone
-        analysis = analyze_message(user_message)
+        analysis = analyze_message(user_message, text)
+        if marks is not None:
+            marks.append(perf_counter_ns())
 
         # 3. Determine intent with multi-scorer
         intent, confidence, meta_intents = detect_intent(
@@ -40,11 +67,15 @@ class ReasoningEngine:
             session=session,
             page=page,
         )
+        if marks is not None:
+            marks.append(perf_counter_ns())
 
         # 4. Update memory with analysis + intent
         session.update_from_analysis(analysis)
         session.last_intent = intent
         session.last_confidence = confidence
+        if marks is not None:
+            marks.append(perf_counter_ns())
 
         # 5. State Machine: resolve current_state -> next_state
         next_state = self.sm.transition(
@@ -54,6 +85,8 @@ class ReasoningEngine:
             session=session,
         )
         session.state = next_state
+        if marks is not None:
+            marks.append(perf_counter_ns())
 
         # 6. Router decides: action + bot message template
         action_obj = route_message(
@@ -66,6 +99,8 @@ class ReasoningEngine:
 
         # Track last action to avoid repetition
         session.last_action = action_obj.action
+        if marks is not None:
+            marks.append(perf_counter_ns())
 
         # 7. Humanize final output
         final_reply = humanize(
@@ -73,9 +108,11 @@ class ReasoningEngine:
             session=session,
             analysis=analysis,
         )
+        if marks is not None:
+            marks.append(perf_counter_ns())
 
         # 8. Build output payload
-        return SystemResponse(
+        response = SystemResponse(
             session_id=session.session_id,
             intent=intent,
             intent_confidence=confidence,
@@ -83,3 +120,17 @@ class ReasoningEngine:
             action_payload=action_obj.action_payload,
             bot_reply=final_reply,
         )
+
+        # Escalations notify sales from here (deduplicated per session by the bus)
+        if action_obj.action == "escalate_human" and self.events.wants(session.session_id):
+            self.events.publish(EscalationEvent(
+                session_id=session.session_id,
+                intent=intent,
+                confidence=confidence,
+                page=page,
+                message=user_message,
+                snapshot=session.memory_snapshot(),
+            ))
+        if marks is not None:
+            marks.append(perf_counter_ns())
+        return response
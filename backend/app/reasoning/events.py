@@ -0,0 +1,183 @@
+"""
+ARE-3.5 Escalation events
+
+ReasoningEngine.process publishes an EscalationEvent whenever the router
+answers with action="escalate_human" (contact_human / handoff_ready). The
+EventBus is a bounded, thread-safe in-process queue between the engine
+(event loop or threadpool) and one consumer thread that hands events to a
+sink -- in the app, the sales webhook dispatcher.
+
+Back-pressure:
+- per-session dedup: a session publishes at most one event per
+  `dedup_seconds`, so a user repeating "talk to a human" (or insulting the
+  bot every turn) produces one notification, not one per message;
+- overflow: when `max_events` are waiting, "drop_oldest" evicts the oldest
+  queued event and "drop_newest" rejects the new one. publish() never blocks
+  the request path.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest")
+
+# Sessions remembered for dedup; older ones are forgotten first
+DEDUP_MAX_SESSIONS = 50_000
+
+
+class EscalationEvent:
+    __slots__ = ("session_id", "intent", "confidence", "page", "message", "snapshot", "ts")
+
+    def __init__(self, session_id: str, intent: str, confidence: float, page: str,
+                 message: str, snapshot: Dict[str, Any], ts: Optional[float] = None) -> None:
+        self.session_id = session_id
+        self.intent = intent
+        self.confidence = confidence
+        self.page = page
+        self.message = message
+        self.snapshot = snapshot
+        self.ts = time.time() if ts is None else ts
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Notification body for the sales webhook."""
+        return {
+            "source": "chat",
+            "event": "escalation",
+            "session_id": self.session_id,
+            "intent": self.intent,
+            "confidence": self.confidence,
+            "page": self.page,
+            "last_message": self.message,
+            "session": self.snapshot,
+            "ts": self.ts,
+        }
+
+
+class EventBus:
+    def __init__(self, max_events: int = 1_000, overflow: str = "drop_oldest", dedup_seconds: float = 600.0) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got {overflow!r}")
+        self.max_events = max_events
+        self.overflow = overflow
+        self.dedup_seconds = dedup_seconds
+        self._events: Deque[EscalationEvent] = deque()
+        self._last_published: "OrderedDict[str, float]" = OrderedDict()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._consumer: Optional[threading.Thread] = None
+        self._counts: Dict[str, int] = {
+            "published": 0, "deduplicated": 0, "dropped": 0, "consumed": 0, "sink_errors": 0,
+        }
+
+    def _duplicate(self, session_id: str, now: float) -> bool:
+        last = self._last_published.get(session_id)
+        return last is not None and now - last < self.dedup_seconds
+
+    def wants(self, session_id: str) -> bool:
+        """Cheap pre-check so callers can skip building an event that would be deduplicated."""
+        with self._cond:
+            if self._duplicate(session_id, time.monotonic()):
+                self._counts["deduplicated"] += 1
+                return False
+            return True
+
+    def publish(self, event: EscalationEvent) -> bool:
+        """Queue an event; False if it was deduplicated or dropped (never blocks)."""
+        now = time.monotonic()
+        with self._cond:
+            if self._closed:
+                self._counts["dropped"] += 1
+                return False
+            if self._duplicate(event.session_id, now):
+                self._counts["deduplicated"] += 1
+                return False
+            if len(self._events) >= self.max_events:
+                self._counts["dropped"] += 1
+                if self.overflow == "drop_newest":
+                    return False
+                self._events.popleft()
+            self._events.append(event)
+            self._last_published[event.session_id] = now
+            self._last_published.move_to_end(event.session_id)
+            if len(self._last_published) > DEDUP_MAX_SESSIONS:
+                self._last_published.popitem(last=False)
+            self._counts["published"] += 1
+            self._cond.notify()
+            return True
+
+    def drain(self, max_items: int = 100, timeout: Optional[float] = None) -> List[EscalationEvent]:
+        """Wait up to `timeout` for events, then take up to max_items of them ([] on timeout/close)."""
+        with self._cond:
+            if not self._events and not self._closed:
+                self._cond.wait(timeout)
+            batch = []
+            while self._events and len(batch) < max_items:
+                batch.append(self._events.popleft())
+            return batch
+
+    # ---------------- consumer ----------------
+
+    def start_consumer(self, sink: Callable[[Dict[str, Any]], None]) -> None:
+        """Forward every event's payload to `sink` from a daemon thread."""
+        if self._consumer is not None and self._consumer.is_alive():
+            return
+        with self._cond:
+            self._closed = False
+        self._consumer = threading.Thread(target=self._consume, args=(sink,), name="escalation-consumer", daemon=True)
+        self._consumer.start()
+
+    def _consume(self, sink: Callable[[Dict[str, Any]], None]) -> None:
+        while True:
+            batch = self.drain(timeout=1.0)
+            for event in batch:
+                try:
+                    sink(event.to_payload())
+                except Exception as exc:  # a broken sink must not kill the consumer
+                    with self._cond:
+                        self._counts["sink_errors"] += 1
+                    print("[ESCALATION-SINK-ERROR]", exc)
+            if batch:
+                with self._cond:
+                    self._counts["consumed"] += len(batch)
+            elif self._closed:
+                return
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop accepting events; the consumer forwards what is queued, then exits."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._consumer is not None:
+            self._consumer.join(timeout)
+            self._consumer = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "queued": len(self._events),
+                "max_events": self.max_events,
+                "overflow": self.overflow,
+                "dedup_seconds": self.dedup_seconds,
+                "consumer_running": self._consumer is not None and self._consumer.is_alive(),
+                **self._counts,
+            }
+
+
+def create_event_bus_from_env() -> EventBus:
+    """
+    ESCALATION_BUS_MAX_EVENTS      events waiting for the consumer before overflow (default 1000)
+    ESCALATION_BUS_OVERFLOW        "drop_oldest" (default) or "drop_newest"
+    ESCALATION_DEDUP_SECONDS       at most one escalation per session in this window (default 600)
+    """
+    return EventBus(
+        max_events=int(os.getenv("ESCALATION_BUS_MAX_EVENTS", "1000")),
+        overflow=os.getenv("ESCALATION_BUS_OVERFLOW", "drop_oldest"),
+        dedup_seconds=float(os.getenv("ESCALATION_DEDUP_SECONDS", "600")),
+    )
+
+
+ESCALATIONS = create_event_bus_from_env()
@@ -0,0 +1,172 @@
+"""
+ARE-3.5 Marker table
+
+All phrase markers used by the analyzer, classifier and router live here.
+They are compiled into one KeywordAutomaton, so each turn scans the
+normalized message once and every stage reads hit-flags from the result
+(`analysis["markers"]`) instead of re-running `any(m in clean ...)`.
+"""
+
+from typing import Dict, FrozenSet, Tuple
+
+from .matcher import KeywordAutomaton
+
+
+MARKER_TABLE: Dict[str, Tuple[str, ...]] = {
+    # ---------------- analyzer ----------------
+    "confusion": (
+        "what do you mean",
+        "not clear",
+        "don't understand",
+        "do not understand",
+        "explain again",
+        "say again",
+        "come again",
+        "you mean what",
+    ),
+    "insult": (
+        "dumb", "stupid", "idiot", "useless", "scam", "fraud",
+        "you suck", "terrible bot", "worst bot", "you are still dummy",
+    ),
+    "trust": (
+        "can i trust",
+        "can we trust",
+        "are you legit",
+        "are you real",
+        "is this real",
+        "is this a scam",
+        "are you a scam",
+        "are you fraud",
+        "is ameotech legit",
+        "is ameotech real",
+        "are you guys real",
+        "you guys real",
+    ),
+    "bot": (
+        "chatgpt", "gpt", "ai bot", "are you ai", "are you a bot",
+        "you a bot", "you are bot", "llm", "large language model",
+    ),
+
+    # ---------------- classifier ----------------
+    # Careers terms double as the hard careers markers.
+    "careers": (
+        "job", "jobs", "opening", "openning", "career", "careers",
+        "hiring", "vacancy", "internship", "intern", "position", "role",
+    ),
+    # Existing-system terms double as the hard existing markers.
+    "existing": (
+        "existing system", "existing app", "legacy",
+        "website", "web site", "site",
+        "bug", "bugs", "issue", "issues", "error", "errors",
+        "crash", "crashing", "down", "slow", "performance",
+        "maintenance", "maintain", "support",
+    ),
+    "project_hint": (
+        "project", "product", "app", "application", "platform",
+        "saas", "tool", "solution", "idea", "mvp", "prototype",
+    ),
+    "project_strong": (
+        "new project", "start a project", "start project",
+        "build a project", "build product", "new product",
+        "new saas", "new app", "mvp", "prototype", "launch an app",
+    ),
+    "project_word": ("project",),
+    "human": (
+        "talk to human",
+        "talk to someone",
+        "speak to someone",
+        "someone real",
+        "real person",
+        "call me",
+        "can you call",
+    ),
+
+    # ---------------- router ----------------
+    "company": (
+        "about ameotech",
+        "more about ameotech",
+        "tell me more about ameotech",
+        "tell me more about you",
+        "what is ameotech",
+        "who are you",
+        "what do you do",
+        "what does ameotech do",
+        "what does your company do",
+        "about your company",
+        "your services",
+        "what services you offer",
+        "what kind of work you do",
+        "what kind of work do you do",
+    ),
+    "cost": (
+        "budget", "how much", "cost", "price", "pricing",
+        "estimate", "rough idea", "ballpark", "money",
+    ),
+    "suggest": (
+        "what you suggest",
+        "what do you suggest",
+        "what would you suggest",
+        "what do you recommend",
+        "what would you recommend",
+        "what stack do you suggest",
+        "what stack do you recommend",
+    ),
+    "tech": (
+        # generic tech words
+        "stack", "framework", "language", "frontend", "front-end",
+        "backend", "back-end", "architecture", "tech stack", "technology",
+        # common stacks / tools we often see
+        ".net", "dotnet", "react", "vite", "typescript", "javascript",
+        "node", "next.js", "nextjs", "django", "python", "java",
+        "spring", "angular", "vue", "svelte", "rust", "go ", "golang",
+        "flutter", "react native", "react-native", "kotlin", "swift",
+        "laravel", "rails", "ruby on rails", "wordpress", "drupal",
+        "nuxt", "remix", "sveltekit", "capacitor", "ionic", "strapi",
+    ),
+    "comparison": (
+        "why not", "my tech stack", "instead of", "vs ", "versus", "better than",
+    ),
+    "mentions_next": ("next.js", "nextjs"),
+    "mentions_react": ("react",),
+    "trust_word": ("trust", "scam", "fraud", "legit", "real company", "you guys real"),
+}
+
+
+class MarkerTable:
+    """Precompiled marker groups → single-pass scan returning hit-flags."""
+
+    __slots__ = ("groups", "automaton", "_flags")
+
+    def __init__(self, table: Dict[str, Tuple[str, ...]]):
+        self.groups = tuple(table)
+        flags: Dict[str, set] = {}
+        for group, phrases in table.items():
+            for phrase in phrases:
+                flags.setdefault(phrase, set()).add(group)
+        self._flags = {phrase: frozenset(groups) for phrase, groups in flags.items()}
+        self.automaton = KeywordAutomaton(self._flags)
+
+    def scan(self, clean: str) -> FrozenSet[str]:
+        hits = self.automaton.find(clean)
+        if not hits:
+            return frozenset()
+        flags = set()
+        for phrase in hits:
+            flags.update(self._flags[phrase])
+        return frozenset(flags)
+
+
+MARKERS = MarkerTable(MARKER_TABLE)
+
+
+def scan_markers(clean: str) -> FrozenSet[str]:
+    return MARKERS.scan(clean)
+
+
+def markers_of(analysis: Dict, clean: str) -> FrozenSet[str]:
+    """Hit-flags for this turn; scans only if the analyzer has not already."""
+    markers = analysis.get("markers")
+    if markers is None:
+        markers = scan_markers(clean)
+        analysis["markers"] = markers
+    return markers
@@ -0,0 +1,246 @@
+"""
+ARE-3.5 Keyword matching primitives
+
+Precompiled structures used by the classifier so a message is scanned once,
+no matter how many intents / keywords the registry holds:
+- KeywordAutomaton: Aho-Corasick multi-pattern substring matcher
+- FuzzyIndex: length-bucketed candidate index for fuzzy_ratio() checks
+- IntentMatcher: the intent registry compiled into the two structures above
+  plus a page-prefix trie; never mutated after __init__, so a reload can
+  swap in a new instance while other threads keep scoring with the old one
+"""
+
+from collections import Counter
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .utils import fuzzy_ratio
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton.
+
+    `find(text)` returns every pattern that occurs as a substring of `text`
+    (same answer as `{p for p in patterns if p in text}`) in a single pass.
+    """
+
+    __slots__ = ("patterns", "_goto", "_fail", "_out", "_always")
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: Tuple[str, ...] = tuple(dict.fromkeys(patterns))
+
+        goto: List[Dict[str, int]] = [{}]
+        out: List[FrozenSet[str]] = [frozenset()]
+        always = set()
+
+        # Trie
+        for pattern in self.patterns:
+            if not pattern:
+                # "" is a substring of everything
+                always.add(pattern)
+                continue
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    out.append(frozenset())
+                node = nxt
+            out[node] = out[node] | {pattern}
+
+        # Failure links (BFS), merging outputs along the fail chain
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for ch, child in goto[node].items():
+                queue.append(child)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fallback = goto[f].get(ch, 0)
+                fail[child] = fallback if fallback != child else 0
+                if out[fail[child]]:
+                    out[child] = out[child] | out[fail[child]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+        self._always = frozenset(always)
+
+    def find(self, text: str) -> FrozenSet[str]:
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+
+        hits = set(self._always)
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                hits.update(out[state])
+        return frozenset(hits)
+
+
+class FuzzyIndex:
+    """
+    Candidate index for `fuzzy_ratio(text, term) > threshold`.
+
+    difflib's ratio is 2*M / (len(a) + len(b)) where M is bounded by both the
+    shorter length and the character-multiset overlap. Terms are bucketed by
+    length so a message only pays for SequenceMatcher on terms whose upper
+    bound can actually exceed the threshold — long messages pay nothing.
+    The final check is still fuzzy_ratio(), so results are unchanged.
+    """
+
+    __slots__ = ("threshold", "_by_length", "_counts")
+
+    def __init__(self, terms: Iterable[str], threshold: float):
+        self.threshold = threshold
+        self._by_length: Dict[int, Tuple[str, ...]] = {}
+        self._counts: Dict[str, Counter] = {}
+
+        buckets: Dict[int, List[str]] = {}
+        for term in dict.fromkeys(terms):
+            buckets.setdefault(len(term), []).append(term)
+            self._counts[term] = Counter(term)
+        self._by_length = {length: tuple(items) for length, items in sorted(buckets.items())}
+
+    def matches(self, text: str, skip: FrozenSet[str] = frozenset()) -> FrozenSet[str]:
+        la = len(text)
+        threshold = self.threshold
+        text_counts: Optional[Counter] = None
+        hits = set()
+
+        for lb, terms in self._by_length.items():
+            # Length bound: M <= min(len(a), len(b))
+            if 2.0 * min(la, lb) / (la + lb) <= threshold:
+                continue
+            for term in terms:
+                if term in skip:
+                    continue
+                # Multiset bound (difflib's quick_ratio)
+                if text_counts is None:
+                    text_counts = Counter(text)
+                overlap = sum(min(n, text_counts[ch]) for ch, n in self._counts[term].items())
+                if 2.0 * overlap / (la + lb) <= threshold:
+                    continue
+                if fuzzy_ratio(text, term) > threshold:
+                    hits.add(term)
+
+        return frozenset(hits)
+
+
+class IntentMatcher:
+    """
+    The intent registry compiled once into an automaton + fuzzy index.
+
+    `score(clean, page, session)` returns the same floats as the original
+    per-intent loop: contributions are summed per intent in registry order.
+    """
+
+    KEYWORD_HIT = 1.0
+    KEYWORD_FUZZY = 0.6
+    SYNONYM_HIT = 0.5
+    PAGE_HIT = 0.4
+    LAST_INTENT_BOOST = 0.2
+    GOAL_BOOST = 0.5
+
+    FUZZY_MIN_LENGTH = 4
+    FUZZY_THRESHOLD = 0.8
+
+    def __init__(self, registry: Dict[str, Dict], version: Any = None):
+        self.version = version
+        self.intents: Tuple[str, ...] = tuple(registry)
+        self.weights: Dict[str, float] = {
+            intent: cfg.get("weight", 1.0) for intent, cfg in registry.items()
+        }
+
+        # term -> [(intent, slot, exact_value, fuzzy_value)]
+        slots: Dict[str, List[Tuple[str, int, float, float]]] = {}
+        fuzzy_terms: List[str] = []
+        # page-prefix trie: node = (children by char, intents ending here);
+        # one intent entry per page rule, so duplicate rules count twice
+        pages: Tuple[Dict[str, tuple], List[str]] = ({}, [])
+
+        for intent, cfg in registry.items():
+            slot = 0
+            for kw in cfg["keywords"]:
+                fuzzy = len(kw) > self.FUZZY_MIN_LENGTH
+                slots.setdefault(kw, []).append(
+                    (intent, slot, self.KEYWORD_HIT, self.KEYWORD_FUZZY if fuzzy else 0.0)
+                )
+                if fuzzy:
+                    fuzzy_terms.append(kw)
+                slot += 1
+            for syn in cfg["synonyms"]:
+                slots.setdefault(syn, []).append((intent, slot, self.SYNONYM_HIT, 0.0))
+                slot += 1
+            for p in cfg["pages"]:
+                node = pages
+                for ch in p:
+                    node = node[0].setdefault(ch, ({}, []))
+                node[1].append(intent)
+
+        self._slots = {term: tuple(entries) for term, entries in slots.items()}
+        self._pages = _freeze_trie(pages)
+        self.automaton = KeywordAutomaton(self._slots)
+        self.fuzzy = FuzzyIndex(fuzzy_terms, self.FUZZY_THRESHOLD)
+
+    def score(self, clean: str, page: str, session) -> Dict[str, float]:
+        exact = self.automaton.find(clean)
+        fuzzy = self.fuzzy.matches(clean, skip=exact)
+
+        contributions: Dict[str, List[Tuple[int, float]]] = {}
+        for term in exact:
+            for intent, slot, value, _ in self._slots[term]:
+                contributions.setdefault(intent, []).append((slot, value))
+        for term in fuzzy:
+            for intent, slot, _, value in self._slots[term]:
+                if value:
+                    contributions.setdefault(intent, []).append((slot, value))
+
+        page_hits: Dict[str, int] = {}
+        node = self._pages
+        for intent in node[1]:
+            page_hits[intent] = page_hits.get(intent, 0) + 1
+        for ch in page:
+            node = node[0].get(ch)
+            if node is None:
+                break
+            for intent in node[1]:
+                page_hits[intent] = page_hits.get(intent, 0) + 1
+
+        last_intent = session.last_intent
+        goal = session.goal
+        scores: Dict[str, float] = {}
+
+        for intent in self.intents:
+            score = 0.0
+            hits = contributions.get(intent)
+            if hits:
+                # Same summation order as walking keywords, then synonyms
+                hits.sort()
+                for _, value in hits:
+                    score += value
+            for _ in range(page_hits.get(intent, 0)):
+                score += self.PAGE_HIT
+            if last_intent == intent:
+                score += self.LAST_INTENT_BOOST
+            if goal == intent:
+                score += self.GOAL_BOOST
+            score *= self.weights[intent]
+            scores[intent] = score
+
+        return scores
+
+
+def _freeze_trie(node: tuple) -> tuple:
+    children, intents = node
+    return {ch: _freeze_trie(child) for ch, child in children.items()}, tuple(intents)
@@ -1,3 +1,4 @@
+import sys
 import uuid
 import time
 from typing import Optional, Dict
@@ -9,6 +10,38 @@ class SessionMemory:
     Tracks conversational state, user tone, frustration, topic, and last actions.
     """
 
+    # Fields persisted by session stores (see to_dict / from_dict)
+    FIELDS = (
+        "session_id",
+        "state",
+        "last_intent",
+        "last_confidence",
+        "goal",
+        "frustration_level",
+        "rejection_count",
+        "clarifier_loops",
+        "tone",
+        "last_action",
+        "mode",
+        "new_project_stage",
+        "created_at",
+        "last_updated",
+    )
+
+    # No per-instance __dict__: tens of thousands of live sessions add up
+    __slots__ = FIELDS
+
+    # Enum-like string fields; interned so every session shares one copy
+    INTERNED_FIELDS = (
+        "state",
+        "last_intent",
+        "goal",
+        "tone",
+        "last_action",
+        "mode",
+        "new_project_stage",
+    )
+
     def __init__(self, session_id: Optional[str] = None):
         self.session_id = session_id or str(uuid.uuid4())
 
@@ -107,3 +140,18 @@ class SessionMemory:
             "mode": self.mode,
             "new_project_stage": self.new_project_stage,
         }
+
+    def to_dict(self) -> dict:
+        """Full state for persistence (unlike memory_snapshot, includes counters/timestamps)."""
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SessionMemory":
+        session = cls(session_id=data.get("session_id"))
+        for name in cls.FIELDS:
+            if name in data:
+                value = data[name]
+                if name in cls.INTERNED_FIELDS and isinstance(value, str):
+                    value = sys.intern(value)
+                setattr(session, name, value)
+        return session
@@ -1,76 +1,207 @@
 """
 Intent registry for ARE-3.5
 Central place to manage intents and their keyword patterns.
+
+The intents live in a versioned JSON file (intent_registry.json next to this
+module unless INTENT_REGISTRY_PATH points elsewhere):
+
+    {"version": 3, "intents": {"careers": {"keywords": [...], "synonyms": [...],
+                                           "pages": ["/careers"], "weight": 1.2}, ...}}
+
+IntentRegistry compiles the file into an IntentMatcher and swaps it in with a
+single assignment once it is fully built, so a message is always scored by
+one complete matcher -- the old one or the new one. Reloads happen when the
+file's mtime/size changes (checked at most every poll interval, on the
+scoring path) or on demand via reload(). A file that fails to load or
+validate is rejected and the active matcher stays.
 """
 
-INTENT_REGISTRY = {
-    "new_project": {
-        "keywords": [
-            "start a project", "new app", "new build", "build project",
-            "create a system", "new idea", "startup idea",
-            "build software", "new website", "new platform",
-            "i want to build", "i have an idea", "new product",
-            "mvp", "prototype"
-        ],
-        "synonyms": ["build", "create", "develop", "launch"],
-        "pages": ["/services", "/ai", "/automation"],
-        "weight": 1.0,
-    },
-    "existing_system": {
-        "keywords": [
-            "fix", "modify", "update", "upgrade", "enhance",
-            "existing system", "existing app", "bug", "issue",
-            "problem", "stuck", "broke", "maintenance",
-            "legacy", "refactor"
-        ],
-        "synonyms": ["repair", "improve", "stabilise"],
-        "pages": ["/services"],
-        "weight": 1.0,
-    },
-    "careers": {
-        "keywords": [
-            "job", "jobs", "career", "hiring", "opening", "vacancy",
-            "opning", "internship", "intern", "opportunity", "role",
-            "position"
-        ],
-        "synonyms": ["resume", "cv", "apply"],
-        "pages": ["/careers"],
-        "weight": 1.2,
-    },
-    "pricing_engine": {
-        "keywords": [
-            "pricing", "elasticity", "optimizer", "skus", "price change",
-            "forecast", "margin", "pricing engine", "discount",
-            "promotion", "yield management"
-        ],
-        "synonyms": ["price", "demand", "skus"],
-        "pages": ["/pricing", "/labs/pricing"],
-        "weight": 1.1,
-    },
-    "data_platform": {
-        "keywords": [
-            "data", "analytics", "pipeline", "etl", "warehouse",
-            "dashboard", "redshift", "snowflake", "bigquery",
-            "data engineering", "lakehouse"
-        ],
-        "synonyms": ["analytics", "bi", "reporting"],
-        "pages": ["/data"],
-        "weight": 1.0,
-    },
-    "contact_human": {
-        "keywords": [
-            "talk to human", "talk to someone", "speak to someone",
-            "book a call", "contact", "reach out", "call me",
-            "someone real"
-        ],
-        "synonyms": ["human", "agent"],
-        "pages": [],
-        "weight": 1.5,
-    },
-    "unknown": {
-        "keywords": [],
-        "synonyms": [],
-        "pages": [],
-        "weight": 0.1,
-    },
-}
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .matcher import IntentMatcher
+from .utils import normalize
+
+
+DEFAULT_REGISTRY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "intent_registry.json")
+
+
+def _strings(intent: str, field: str, values: Any, clean) -> List[str]:
+    if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+        raise ValueError(f"{intent}.{field}: expected a list of strings")
+    return [clean(v) for v in values]
+
+
+def parse_registry(doc: Any) -> Tuple[Any, Dict[str, Dict]]:
+    """Validate a registry document; returns (version, intents) with keywords normalized."""
+    if not isinstance(doc, dict) or not isinstance(doc.get("intents"), dict) or not doc["intents"]:
+        raise ValueError('expected {"version": ..., "intents": {name: {...}, ...}}')
+    version = doc.get("version")
+    if not isinstance(version, (int, str)) or isinstance(version, bool):
+        raise ValueError("version: expected an int or a string")
+
+    intents: Dict[str, Dict] = {}
+    for intent, cfg in doc["intents"].items():
+        if not isinstance(cfg, dict):
+            raise ValueError(f"{intent}: expected an object")
+        unknown = set(cfg) - {"keywords", "synonyms", "pages", "weight"}
+        if unknown:
+            raise ValueError(f"{intent}: unknown fields {sorted(unknown)}")
+        weight = cfg.get("weight", 1.0)
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)) or weight < 0:
+            raise ValueError(f"{intent}.weight: expected a non-negative number")
+        intents[intent] = {
+            "keywords": _strings(intent, "keywords", cfg.get("keywords", []), normalize),
+            "synonyms": _strings(intent, "synonyms", cfg.get("synonyms", []), normalize),
+            "pages": _strings(intent, "pages", cfg.get("pages", []), str),
+            "weight": weight,
+        }
+    return version, intents
+
+
+def load_registry(path: str) -> Tuple[Any, Dict[str, Dict]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            doc = json.load(f)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"{path}: {e}") from e
+    return parse_registry(doc)
+
+
+class _Latency:
+    """Count / mean / max of one timed operation, in microseconds."""
+
+    __slots__ = ("count", "total_us", "max_us", "last_us")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_us = 0.0
+        self.max_us = 0.0
+        self.last_us = 0.0
+
+    def record(self, us: float) -> None:
+        self.count += 1
+        self.total_us += us
+        self.last_us = us
+        if us > self.max_us:
+            self.max_us = us
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_us": round(self.total_us / self.count, 2) if self.count else 0.0,
+            "max_us": round(self.max_us, 2),
+            "last_us": round(self.last_us, 2),
+        }
+
+
+class IntentRegistry:
+    """The active IntentMatcher, rebuilt from the registry file on change."""
+
+    def __init__(self, path: str = DEFAULT_REGISTRY_PATH, poll_seconds: float = 2.0) -> None:
+        self.path = path
+        self.poll_seconds = poll_seconds
+        self._reload_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._match = _Latency()
+        self._reload = _Latency()
+        self._reloads = 0
+        self._errors = 0
+        self._last_error: Optional[str] = None
+        self._next_check = 0.0
+        self._seen: Optional[Tuple[int, int]] = None  # file stamp of the last reload attempt
+        self._matcher: Optional[IntentMatcher] = None
+        self.reload()
+
+    @property
+    def current(self) -> IntentMatcher:
+        return self._matcher
+
+    def _file_stamp(self) -> Tuple[int, int]:
+        st = os.stat(self.path)
+        return st.st_mtime_ns, st.st_size
+
+    def reload(self) -> IntentMatcher:
+        """Rebuild from the file and swap. Raises OSError / ValueError (old matcher kept)."""
+        with self._reload_lock:
+            start = time.perf_counter()
+            try:
+                self._seen = self._file_stamp()
+                version, intents = load_registry(self.path)
+                matcher = IntentMatcher(intents, version=version)
+            except (OSError, ValueError) as e:
+                with self._stats_lock:
+                    self._errors += 1
+                    self._last_error = str(e)
+                raise
+            self._matcher = matcher
+            with self._stats_lock:
+                self._reloads += 1
+                self._last_error = None
+                self._reload.record((time.perf_counter() - start) * 1e6)
+            return matcher
+
+    def maybe_reload(self) -> None:
+        """
+        Reload if the file changed since the last attempt; at most one stat()
+        per poll interval, and never waits on a reload already in progress.
+        """
+        if self.poll_seconds <= 0:
+            return
+        now = time.monotonic()
+        if now < self._next_check or not self._reload_lock.acquire(blocking=False):
+            return
+        try:
+            self._next_check = now + self.poll_seconds
+            try:
+                changed = self._file_stamp() != self._seen
+            except OSError:
+                changed = False  # file briefly missing (e.g. mid-replace): keep the current matcher
+        finally:
+            self._reload_lock.release()
+        if changed:
+            try:
+                self.reload()
+            except (OSError, ValueError):
+                pass  # counted in stats(); the current matcher stays
+
+    def score(self, clean: str, page: str, session) -> Dict[str, float]:
+        self.maybe_reload()
+        matcher = self._matcher
+        start = time.perf_counter()
+        scores = matcher.score(clean, page, session)
+        elapsed_us = (time.perf_counter() - start) * 1e6
+        with self._stats_lock:
+            self._match.record(elapsed_us)
+        return scores
+
+    def stats(self) -> Dict[str, Any]:
+        matcher = self._matcher
+        with self._stats_lock:
+            return {
+                "path": self.path,
+                "version": matcher.version,
+                "intents": len(matcher.intents),
+                "reloads": self._reloads,
+                "reload_errors": self._errors,
+                "last_error": self._last_error,
+                "reload_latency": self._reload.snapshot(),
+                "match_latency": self._match.snapshot(),
+            }
+
+
+def create_intent_registry_from_env() -> IntentRegistry:
+    """
+    INTENT_REGISTRY_PATH           registry JSON file (default: the bundled intent_registry.json)
+    INTENT_REGISTRY_POLL_SECONDS   how often to check the file for changes; 0 disables (default 2)
+    """
+    return IntentRegistry(
+        path=os.getenv("INTENT_REGISTRY_PATH") or DEFAULT_REGISTRY_PATH,
+        poll_seconds=float(os.getenv("INTENT_REGISTRY_POLL_SECONDS", "2")),
+    )
+
+
+INTENT_REGISTRY = create_intent_registry_from_env()
@@ -0,0 +1,370 @@
+"""
+ARE-3.5 Routing rules
+
+The router's replies and the rules that pick them, as data. router.py
+compiles ROUTE_RULES into one decision table per state at import time.
+
+Each state lists its rules in priority order; the first rule whose `when`
+holds picks the reply template. A rule is
+
+    (when, template_id)  or  (when, template_id, {session_attr: value, ...})
+
+where the optional dict is written onto the session when the rule fires.
+
+`when` is a space-separated conjunction of terms. A term is one predicate,
+several predicates joined by `|` (any of them), or a `!`-negated predicate;
+`*` always holds. Predicates:
+
+    rejection        analysis["is_rejection"]
+    msg:<type>       analysis["message_type"] == <type>
+    marker:<group>   <group> in the turn's marker flags (markers.py)
+    hint:<topic>     analysis["topic_hint"] == <topic>
+    has_goal         session.goal is set
+    stage:<stage>    session.new_project_stage == <stage> (default "intro")
+    last:<action>    session.last_action == <action>
+    loops<=N         session.clarifier_loops <= N
+    loops==N         session.clarifier_loops == N
+
+State "*" is used for any state without rules of its own.
+"""
+
+from typing import Any, Dict, Tuple
+
+
+MAILTO = {"link": "mailto:hello@ameotech.com"}
+
+# template id -> (action, bot_reply, action_payload)
+REPLY_TEMPLATES: Dict[str, Tuple[str, str, Dict[str, Any]]] = {
+    # ---------------- escalation ----------------
+    "contact_human": (
+        "escalate_human",
+        "I can connect you with someone from Ameotech. "
+        "Would you prefer to send a short note or book a quick call?",
+        MAILTO,
+    ),
+    "handoff_ready": (
+        "escalate_human",
+        "This looks easier to handle in a direct conversation. "
+        "I can connect you with someone from the engineering team.",
+        MAILTO,
+    ),
+
+    # ---------------- careers ----------------
+    "careers_options": (
+        "show_options",
+        "I can help with jobs at Ameotech, or with projects and existing systems.\n"
+        "Which of these fits better with what you need right now?",
+        {
+            "options": [
+                {"id": "careers", "label": "Careers / jobs"},
+                {"id": "new_project", "label": "Start a new project"},
+                {"id": "existing_system", "label": "Fix an existing system"},
+            ]
+        },
+    ),
+    "careers_page": (
+        "show_message",
+        "You can explore open roles on the Careers page. "
+        "If you don’t see a match, you can still share your profile.",
+        {"link": "/careers"},
+    ),
+
+    # ---------------- new project ----------------
+    "project_rejection": (
+        "show_message",
+        "No problem. Tell me a little about what you want to build. "
+        "A one-line description of the idea or main workflow is enough.",
+        {},
+    ),
+    "project_company": (
+        "show_message",
+        "Ameotech is an applied engineering partner. We build pricing engines, forecasting models, "
+        "data platforms and automation for SaaS, retail, fintech and enterprise teams.\n\n"
+        "Most engagements start either as a discovery sprint to de-risk architecture and scope, "
+        "or as a focused build around a pricing engine, data platform or AI feature.\n\n"
+        "For your project specifically, we can first lock a sensible tech stack, then sketch a "
+        "budget band and delivery model that fits your timelines.",
+        {"link": "/case-studies"},
+    ),
+    "project_cost": (
+        "open_lab_tool",
+        "We can sketch a budget band, timeline and delivery model "
+        "based on a few quick questions. "
+        "Do you want to run the Build Estimator?",
+        {"lab_tool": "build_estimator"},
+    ),
+    "project_suggest": (
+        "show_message",
+        "For most B2B and SaaS-style products, we usually recommend:\n"
+        "- .NET 8 Web API for the backend\n"
+        "- PostgreSQL or SQL Server as the primary database\n"
+        "- React with Vite or Next.js and TypeScript on the frontend\n"
+        "- Tailwind CSS for the UI layer\n\n"
+        "This gives a strong ecosystem, good performance and fast iteration. "
+        "If you already have a preferred stack, we can work with that too — the main thing is matching it "
+        "to your team and roadmap.\n\n"
+        "If you’d like, share the stack you have in mind and your rough timelines, and we can confirm "
+        "whether to keep it as-is or adjust parts of it.",
+        {},
+    ),
+    "project_tech_comparison": (
+        "show_message",
+        "The stack you mentioned can also work — the choice usually depends on a few things:\n"
+        "- how quickly you need to ship\n"
+        "- your team’s experience\n"
+        "- performance and scale expectations\n"
+        "- SEO / SSR needs and integrations\n\n"
+        "At Ameotech we often use .NET for the backend with a React-based frontend "
+        "(Vite or Next.js) because it gives fast iteration and a strong ecosystem, "
+        "but we’re comfortable working with your preferred stack as long as it fits the problem.\n\n"
+        "If you share a bit more about expected scale, SEO needs and integrations, "
+        "we can suggest whether to stick with your current choice or adjust parts of it.",
+        {},
+    ),
+    "project_tech_react": (
+        "show_message",
+        "React with either Vite or Next.js is a solid base for modern web/SaaS products.\n\n"
+        "A typical setup we use is:\n"
+        "- .NET 8 Web API for the backend\n"
+        "- PostgreSQL or SQL Server as the main database\n"
+        "- React + Vite or Next.js with TypeScript on the frontend\n"
+        "- Tailwind CSS for UI components\n\n"
+        "We can fine-tune this once we know more about scale, SEO requirements, "
+        "and any AI features you have in mind.",
+        {},
+    ),
+    "project_tech_generic": (
+        "show_message",
+        "The stack you’re considering can work — the key is matching it to your team and roadmap.\n\n"
+        "When we help choose a stack, we look at:\n"
+        "- what your team is comfortable with today\n"
+        "- how quickly you need to ship the first version\n"
+        "- expected traffic and performance constraints\n"
+        "- ecosystem and library support for your use-cases\n\n"
+        "If you share the stack you have in mind and your rough timelines, "
+        "we can suggest whether to keep it as-is or adjust parts of it.",
+        {},
+    ),
+    "project_trust": (
+        "show_message",
+        "Ameotech focuses on applied AI engineering, pricing engines, forecasting, "
+        "data platforms and automation for SaaS, retail, fintech and enterprise teams.\n\n"
+        "We usually start with a small, scoped engagement like a discovery sprint or pilot "
+        "so you can evaluate us on real delivery before committing to anything larger. "
+        "You can also review case studies on the site to see examples of previous work.",
+        {"link": "/case-studies"},
+    ),
+    "project_meta": (
+        "show_message",
+        "I may miss some of the nuance here, but I can help with new projects, "
+        "existing systems, pricing engines and data platforms.\n\n"
+        "For your project, we can talk through the idea, the tech stack, and then "
+        "rough timelines and budget if you’d like.",
+        {},
+    ),
+    "project_ask_idea": (
+        "show_message",
+        "Great — we can help with new builds. "
+        "What’s the idea or the main workflow you’re thinking about?",
+        {},
+    ),
+    "project_ask_priority": (
+        "show_message",
+        "Got it. For the first version, what matters most for you right now — "
+        "getting the tech stack right, hitting a specific timeline, or staying within a budget range?",
+        {},
+    ),
+    "project_offer_concrete": (
+        "show_message",
+        "We can either stay high-level here or move into something concrete like a "
+        "rough budget range and timeline. Which would you prefer?",
+        {},
+    ),
+    "project_ask_timelines": (
+        "show_message",
+        "If you share your rough timelines and budget range, "
+        "we can suggest how to structure the engagement and what to build first.",
+        {},
+    ),
+
+    # ---------------- existing system ----------------
+    "existing_rejection": (
+        "show_message",
+        "Alright — just tell me what’s happening with the current system. "
+        "Is it bugs, performance issues, missing features, or something else?",
+        {},
+    ),
+    "existing_ask_issue": (
+        "show_message",
+        "We often help teams fix, stabilise or extend existing systems. "
+        "What seems to be the main issue right now?",
+        {},
+    ),
+    "existing_ask_stack": (
+        "show_message",
+        "Got it. A short description of the stack or the main bottleneck "
+        "will help us point you to next steps.",
+        {},
+    ),
+
+    # ---------------- pricing / data ----------------
+    "pricing_engine": (
+        "show_message",
+        "We build pricing engines, elasticity models and demand forecasters "
+        "for teams with large SKU catalogs or complex pricing rules. "
+        "What pricing challenge are you facing?",
+        {},
+    ),
+    "data_platform": (
+        "show_message",
+        "We help teams with data engineering, ETL pipelines, warehouses "
+        "and analytics platforms. "
+        "What kind of data problem are you looking to solve?",
+        {},
+    ),
+
+    # ---------------- unknown → clarifiers ----------------
+    "clarify_project": (
+        "show_options",
+        "It sounds like you want to talk about a project.\n"
+        "Are you looking to start a new project with us, fix an existing system, "
+        "or is this more about roles and jobs?",
+        {
+            "options": [
+                {"id": "new_project", "label": "Start a new project"},
+                {"id": "existing_system", "label": "Fix an existing system"},
+                {"id": "careers", "label": "Careers / jobs"},
+            ]
+        },
+    ),
+    "clarify_existing": (
+        "show_options",
+        "It sounds like this might be about an existing system or website.\n"
+        "Do you mainly want to stabilise or fix an existing system, start something new, "
+        "or talk about roles and jobs?",
+        {
+            "options": [
+                {"id": "existing_system", "label": "Fix an existing system"},
+                {"id": "new_project", "label": "Start a new project"},
+                {"id": "careers", "label": "Careers / jobs"},
+            ]
+        },
+    ),
+    "clarify_careers": (
+        "show_options",
+        "It sounds like you might be asking about roles or jobs at Ameotech.\n"
+        "Is this mainly about careers, or are you looking to discuss a project or an existing system?",
+        {
+            "options": [
+                {"id": "careers", "label": "Careers / jobs"},
+                {"id": "new_project", "label": "Start a new project"},
+                {"id": "existing_system", "label": "Fix an existing system"},
+            ]
+        },
+    ),
+    "clarify_generic": (
+        "show_options",
+        "To point you in the right direction — are you looking to:\n"
+        "- start a new project,\n"
+        "- fix an existing system,\n"
+        "- explore careers,\n"
+        "or something else related to Ameotech?",
+        {
+            "options": [
+                {"id": "new_project", "label": "Start a new project"},
+                {"id": "existing_system", "label": "Fix an existing system"},
+                {"id": "careers", "label": "Careers / jobs"},
+                {"id": "contact", "label": "Talk to someone"},
+            ]
+        },
+    ),
+    "clarify_narrow": (
+        "show_options",
+        "Got it — just to avoid guessing:\n"
+        "Is this mainly about a project, an existing system, or jobs?",
+        {
+            "options": [
+                {"id": "new_project", "label": "Project"},
+                {"id": "existing_system", "label": "Existing system"},
+                {"id": "careers", "label": "Jobs"},
+            ]
+        },
+    ),
+    "clarify_escalate": (
+        "escalate_human",
+        "Let me connect you with someone directly — "
+        "they can understand the situation faster.",
+        MAILTO,
+    ),
+
+    # ---------------- safety fallback ----------------
+    "fallback": (
+        "show_message",
+        "I can help with new projects, existing systems, pricing, data platforms or careers at Ameotech.",
+        {},
+    ),
+}
+
+
+ROUTE_RULES: Dict[str, Tuple[tuple, ...]] = {
+    # Hard escalation
+    "contact_human": (
+        ("*", "contact_human"),
+    ),
+    "handoff_ready": (
+        ("*", "handoff_ready"),
+    ),
+
+    # Confused, annoyed or rejecting users get options instead of the careers text again
+    "careers": (
+        ("msg:confused|msg:meta|msg:insult|rejection", "careers_options"),
+        ("*", "careers_page"),
+    ),
+
+    "new_project": (
+        ("rejection", "project_rejection"),
+        ("marker:company", "project_company"),
+        ("marker:cost", "project_cost"),
+        ("marker:suggest", "project_suggest"),
+        # Tech guidance instead of looping; generic for stacks we don't list
+        ("marker:tech marker:comparison", "project_tech_comparison"),
+        ("marker:tech marker:mentions_react|marker:mentions_next", "project_tech_react"),
+        ("marker:tech", "project_tech_generic"),
+        ("msg:trust|marker:trust_word", "project_trust"),
+        # Light teasing / meta comments → gently steer back
+        ("msg:meta|msg:insult !marker:cost", "project_meta"),
+        # Stage-based behaviour: ask for the idea, then for priorities
+        ("stage:intro", "project_ask_idea", {"new_project_stage": "idea"}),
+        ("stage:idea", "project_ask_priority", {"new_project_stage": "shaping"}),
+        # Shaping stage or beyond: avoid repeating the same line endlessly
+        ("last:show_message", "project_offer_concrete"),
+        ("*", "project_ask_timelines"),
+    ),
+
+    "existing_system": (
+        ("rejection", "existing_rejection"),
+        ("!has_goal", "existing_ask_issue"),
+        ("*", "existing_ask_stack"),
+    ),
+
+    "pricing_engine": (
+        ("*", "pricing_engine"),
+    ),
+    "data_platform": (
+        ("*", "data_platform"),
+    ),
+
+    # Targeted clarifier from the topic hint first, then generic ones, then escalate
+    "unknown": (
+        ("hint:project_like loops<=2", "clarify_project"),
+        ("hint:existing_like loops<=2", "clarify_existing"),
+        ("hint:careers_like loops<=2", "clarify_careers"),
+        ("loops<=1", "clarify_generic"),
+        ("loops==2", "clarify_narrow"),
+        ("*", "clarify_escalate"),
+    ),
+
+    "*": (
+        ("*", "fallback"),
+    ),
+}
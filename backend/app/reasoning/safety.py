@@ -1,25 +1,12 @@
 """
 Safety utilities: input normalisation & basic profanity filtering.
-"""
-
-import re
 
+The patterns live in text.py, which the engine calls directly so the later
+stages can reuse the normalized text; sanitize_input is the string-only view.
+"""
 
-PROFANITY = [
-    "fuck", "shit", "bastard", "asshole",
-]
+from .text import PROFANITY, normalize_text  # noqa: F401  (PROFANITY re-exported)
 
 
 def sanitize_input(text: str) -> str:
-    if not text:
-        return ""
-    t = text.strip()
-    # Normalise whitespace
-    t = re.sub(r"\s+", " ", t)
-
-    lower = t.lower()
-    for bad in PROFANITY:
-        if bad in lower:
-            t = re.sub(bad, "***", t, flags=re.IGNORECASE)
-
-    return t
+    return normalize_text(text).text
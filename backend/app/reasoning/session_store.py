@@ -0,0 +1,368 @@
+"""
+ARE-3.5 Session stores
+
+Pluggable storage for SessionMemory:
+- LRUSessionStore: in-process, bounded by entry count + bytes, idle TTL
+- SQLiteSessionStore: survives restarts, shared across uvicorn workers;
+  bounded by entry count + bytes of stored session data, idle TTL
+
+Both expire sessions that have been idle (SessionMemory.last_updated) for
+longer than the TTL, so unknown / random session ids cannot grow memory
+without bound.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from .memory import SessionMemory
+
+
+class SessionStore(ABC):
+    """
+    Interface used by the API layer.
+
+    get_or_create() hands out a session; save() must be called after the
+    engine mutated it so backends that copy state (SQLite) persist it.
+
+    `blocking_io` tells async callers whether get/save wait on disk and
+    must stay off the event loop.
+    """
+
+    blocking_io = False
+
+    @abstractmethod
+    def get(self, session_id: str) -> Optional[SessionMemory]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def peek(self, session_id: str) -> Optional[SessionMemory]:
+        """Like get(), but leaves LRU order, metrics and expired rows alone."""
+        raise NotImplementedError
+
+    def get_or_create(self, session_id: str) -> SessionMemory:
+        session = self.get(session_id)
+        if session is None:
+            session = SessionMemory(session_id=session_id)
+            self._count("created")
+        return session
+
+    @abstractmethod
+    def save(self, session: SessionMemory) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def sweep(self) -> int:
+        """Drop idle sessions. Returns the number removed."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        raise NotImplementedError
+
+    def _count(self, name: str, n: int = 1) -> None:
+        pass
+
+
+def _session_bytes(session: SessionMemory) -> int:
+    # Serialized size: cheap, stable proxy for the memory a session holds
+    return len(json.dumps(session.to_dict(), separators=(",", ":")))
+
+
+class LRUSessionStore(SessionStore):
+    def __init__(
+        self,
+        max_entries: int = 50_000,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: float = 6 * 3600,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+
+        self._items: "OrderedDict[str, SessionMemory]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "created": 0,
+            "evicted_ttl": 0,
+            "evicted_entries": 0,
+            "evicted_bytes": 0,
+        }
+
+    # Internal helpers (caller holds the lock) ------------------------------
+
+    def _expired(self, session: SessionMemory, now: float) -> bool:
+        return now - session.last_updated > self.ttl_seconds
+
+    def _remove(self, session_id: str) -> None:
+        self._items.pop(session_id, None)
+        self._bytes -= self._sizes.pop(session_id, 0)
+
+    def _evict(self, now: float) -> None:
+        # Idle sessions first: LRU order roughly follows last_updated
+        while self._items:
+            oldest_id, oldest = next(iter(self._items.items()))
+            if not self._expired(oldest, now):
+                break
+            self._remove(oldest_id)
+            self._metrics["evicted_ttl"] += 1
+
+        while len(self._items) > self.max_entries:
+            self._remove(next(iter(self._items)))
+            self._metrics["evicted_entries"] += 1
+
+        while self._bytes > self.max_bytes and len(self._items) > 1:
+            self._remove(next(iter(self._items)))
+            self._metrics["evicted_bytes"] += 1
+
+    def _count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._metrics[name] += n
+
+    # SessionStore ------------------------------------------------------------
+
+    def get(self, session_id: str) -> Optional[SessionMemory]:
+        with self._lock:
+            session = self._items.get(session_id)
+            if session is None:
+                self._metrics["misses"] += 1
+                return None
+            if self._expired(session, self._clock()):
+                self._remove(session_id)
+                self._metrics["evicted_ttl"] += 1
+                self._metrics["misses"] += 1
+                return None
+            self._items.move_to_end(session_id)
+            self._metrics["hits"] += 1
+            return session
+
+    def peek(self, session_id: str) -> Optional[SessionMemory]:
+        with self._lock:
+            session = self._items.get(session_id)
+            if session is None or self._expired(session, self._clock()):
+                return None
+            return session
+
+    def save(self, session: SessionMemory) -> None:
+        size = _session_bytes(session)
+        with self._lock:
+            sid = session.session_id
+            self._bytes += size - self._sizes.get(sid, 0)
+            self._sizes[sid] = size
+            self._items[sid] = session
+            self._items.move_to_end(sid)
+            self._evict(self._clock())
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._remove(session_id)
+
+    def sweep(self) -> int:
+        now = self._clock()
+        with self._lock:
+            expired = [sid for sid, s in self._items.items() if self._expired(s, now)]
+            for sid in expired:
+                self._remove(sid)
+            self._metrics["evicted_ttl"] += len(expired)
+            return len(expired)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._items),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                **self._metrics,
+            }
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    SQLite (WAL mode) backend. One connection per thread; every uvicorn
+    worker opening the same file sees the same sessions.
+    """
+
+    blocking_io = True
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 500_000,
+        max_bytes: int = 512 * 1024 * 1024,
+        ttl_seconds: float = 6 * 3600,
+        sweep_every: int = 1000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.sweep_every = sweep_every
+        self._clock = clock
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._metrics: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "created": 0,
+            "evicted_ttl": 0,
+            "evicted_entries": 0,
+            "evicted_bytes": 0,
+        }
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._conn() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS reason_sessions ("
+                " session_id TEXT PRIMARY KEY,"
+                " data TEXT NOT NULL,"
+                " last_updated REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS reason_sessions_last_updated"
+                " ON reason_sessions (last_updated)"
+            )
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._metrics[name] += n
+
+    def get(self, session_id: str) -> Optional[SessionMemory]:
+        row = self._conn().execute(
+            "SELECT data, last_updated FROM reason_sessions WHERE session_id = ?",
+            (session_id,),
+        ).fetchone()
+        if row is None:
+            self._count("misses")
+            return None
+        if self._clock() - row[1] > self.ttl_seconds:
+            self.delete(session_id)
+            self._count("evicted_ttl")
+            self._count("misses")
+            return None
+        self._count("hits")
+        return SessionMemory.from_dict(json.loads(row[0]))
+
+    def peek(self, session_id: str) -> Optional[SessionMemory]:
+        row = self._conn().execute(
+            "SELECT data, last_updated FROM reason_sessions WHERE session_id = ?",
+            (session_id,),
+        ).fetchone()
+        if row is None or self._clock() - row[1] > self.ttl_seconds:
+            return None
+        return SessionMemory.from_dict(json.loads(row[0]))
+
+    def save(self, session: SessionMemory) -> None:
+        data = json.dumps(session.to_dict(), separators=(",", ":"))
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO reason_sessions (session_id, data, last_updated)"
+                " VALUES (?, ?, ?)",
+                (session.session_id, data, session.last_updated),
+            )
+        with self._lock:
+            self._writes += 1
+            due = self._writes % self.sweep_every == 0
+        if due:
+            self.sweep()
+
+    def delete(self, session_id: str) -> None:
+        with self._conn() as conn:
+            conn.execute("DELETE FROM reason_sessions WHERE session_id = ?", (session_id,))
+
+    def sweep(self) -> int:
+        cutoff = self._clock() - self.ttl_seconds
+        with self._conn() as conn:
+            expired = conn.execute(
+                "DELETE FROM reason_sessions WHERE last_updated < ?", (cutoff,)
+            ).rowcount
+            over = conn.execute(
+                "DELETE FROM reason_sessions WHERE session_id IN ("
+                " SELECT session_id FROM reason_sessions"
+                " ORDER BY last_updated DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+            # Byte cap: keep the newest sessions whose data fits, drop the rest
+            # (the newest one is always kept, like the memory backend)
+            oversize = conn.execute(
+                "DELETE FROM reason_sessions WHERE session_id IN ("
+                " SELECT session_id FROM ("
+                "  SELECT session_id, SUM(length(data)) OVER ("
+                "   ORDER BY last_updated DESC, session_id ROWS UNBOUNDED PRECEDING) AS total,"
+                "   ROW_NUMBER() OVER (ORDER BY last_updated DESC, session_id) AS rank"
+                "  FROM reason_sessions)"
+                " WHERE total > ? AND rank > 1)",
+                (self.max_bytes,),
+            ).rowcount
+        self._count("evicted_ttl", expired)
+        self._count("evicted_entries", over)
+        self._count("evicted_bytes", oversize)
+        return expired + over + oversize
+
+    def stats(self) -> Dict[str, int]:
+        entries, size = self._conn().execute(
+            "SELECT COUNT(*), COALESCE(SUM(length(data)), 0) FROM reason_sessions"
+        ).fetchone()
+        with self._lock:
+            return {
+                "entries": entries,
+                "bytes": size,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                **self._metrics,
+            }
+
+
+def create_session_store_from_env() -> SessionStore:
+    """
+    REASON_SESSION_BACKEND      memory (default) | sqlite
+    REASON_SESSION_TTL_SECONDS  idle expiry (default 6h)
+    REASON_SESSION_MAX_ENTRIES  hard cap on sessions
+    REASON_SESSION_MAX_BYTES    hard cap on session bytes (default 64 MiB memory, 512 MiB sqlite)
+    REASON_SESSION_DB_PATH      SQLite file (sqlite backend)
+    """
+    backend = os.getenv("REASON_SESSION_BACKEND", "memory").lower()
+    ttl = float(os.getenv("REASON_SESSION_TTL_SECONDS", 6 * 3600))
+
+    if backend == "sqlite":
+        return SQLiteSessionStore(
+            path=os.getenv("REASON_SESSION_DB_PATH", "data/reason_sessions.db"),
+            max_entries=int(os.getenv("REASON_SESSION_MAX_ENTRIES", 500_000)),
+            max_bytes=int(os.getenv("REASON_SESSION_MAX_BYTES", 512 * 1024 * 1024)),
+            ttl_seconds=ttl,
+        )
+
+    return LRUSessionStore(
+        max_entries=int(os.getenv("REASON_SESSION_MAX_ENTRIES", 50_000)),
+        max_bytes=int(os.getenv("REASON_SESSION_MAX_BYTES", 64 * 1024 * 1024)),
+        ttl_seconds=ttl,
+    )
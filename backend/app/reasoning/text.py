@@ -0,0 +1,93 @@
+"""
+ARE-3.5 Text normalization
+
+First stage of every turn. One call folds whitespace, masks profanity,
+lower-cases, detects rejections and splits the result into tokens; later
+stages read the NormalizedText instead of re-normalizing the message.
+
+All patterns are compiled once at import:
+- whitespace: str.split() / " ".join() (same characters as `\\s`, one C pass)
+- profanity: a single alternation over PROFANITY, substituted in one pass
+- rejection: a single word-bounded alternation over REJECTION_PHRASES
+
+Each step is linear in the message length, so the cost for a message at the
+request-size limit is a few passes over it, not one per pattern.
+"""
+
+import re
+from typing import Tuple
+
+
+PROFANITY = (
+    "fuck", "shit", "bastard", "asshole",
+)
+
+REJECTION_PHRASES = (
+    "no",
+    "no thanks",
+    "not now",
+    "don't want",
+    "do not want",
+    "stop",
+    "skip",
+    "leave it",
+)
+
+MASK = "***"
+
+_PROFANITY_RE = re.compile("|".join(map(re.escape, PROFANITY)), re.IGNORECASE)
+# Longest first, so the alternation reads the same as the phrase list it replaces
+_REJECTION_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(p) for p in sorted(REJECTION_PHRASES, key=len, reverse=True)) + r")\b"
+)
+
+
+class NormalizedText:
+    """
+    text      whitespace-folded, profanity-masked message (what sanitize_input returns)
+    clean     text lower-cased (what normalize(text) returns)
+    tokens    clean split on spaces
+    """
+
+    __slots__ = ("text", "clean", "tokens", "masked", "is_rejection")
+
+    def __init__(self, text: str, clean: str, tokens: Tuple[str, ...], masked: bool, is_rejection: bool):
+        self.text = text
+        self.clean = clean
+        self.tokens = tokens
+        self.masked = masked
+        self.is_rejection = is_rejection
+
+    def __repr__(self) -> str:
+        return f"NormalizedText({self.text!r}, tokens={len(self.tokens)}, rejection={self.is_rejection})"
+
+
+EMPTY = NormalizedText("", "", (), False, False)
+
+
+def fold_whitespace(text: str) -> str:
+    """Strip and collapse every whitespace run to one space."""
+    return " ".join(text.split())
+
+
+def mask_profanity(text: str) -> Tuple[str, bool]:
+    masked, hits = _PROFANITY_RE.subn(MASK, text)
+    return masked, hits > 0
+
+
+def is_rejection(clean: str) -> bool:
+    return _REJECTION_RE.search(clean) is not None
+
+
+def normalize_text(raw: str) -> NormalizedText:
+    if not raw:
+        return EMPTY
+    text, masked = mask_profanity(fold_whitespace(raw))
+    clean = text.lower()
+    return NormalizedText(
+        text=text,
+        clean=clean,
+        tokens=tuple(clean.split()),
+        masked=masked,
+        is_rejection=is_rejection(clean),
+    )
@@ -0,0 +1,121 @@
+"""
+ARE-3.5 Stage timings
+
+Per-stage latency histograms for ReasoningEngine.process, aggregated in
+process and rendered in Prometheus text format for /internal/metrics.
+
+Only every `sample_every`-th request is timed (monotonic ns between stage
+boundaries), so unsampled requests pay for one counter increment. A sampled
+request only appends its marks to a queue; the queue is folded into the
+histograms with NumPy once per FOLD_BATCH samples or on scrape. A request
+can also ask for its own breakdown, which is always timed and recorded.
+"""
+
+import itertools
+import os
+import threading
+from collections import deque
+from typing import Deque, Dict, Sequence
+
+import numpy as np
+
+
+STAGES = (
+    "sanitize_input",
+    "analyze_message",
+    "detect_intent",
+    "update_from_analysis",
+    "state_transition",
+    "route_message",
+    "humanize",
+    "build_response",
+)
+
+# Histogram upper bounds in ns (Prometheus `le`, rendered in seconds); +Inf is implicit
+BUCKETS_NS = (
+    1_000, 2_500, 5_000, 10_000, 25_000, 50_000, 100_000,
+    250_000, 500_000, 1_000_000, 2_500_000, 5_000_000, 10_000_000,
+)
+
+# Sampled requests folded into the histograms per batch (and on every scrape)
+FOLD_BATCH = 1024
+
+
+class StageTimings:
+    def __init__(self, sample_every: int = 16, stages: Sequence[str] = STAGES) -> None:
+        self.sample_every = sample_every
+        self.stages = tuple(stages)
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+        self._seen = -1  # last counter value handed out
+        # Sampled marks wait here and are folded into the histograms in bulk
+        self._pending: Deque[Sequence[int]] = deque()
+        self._bounds = np.array(BUCKETS_NS, dtype=np.int64)
+        self._buckets = np.zeros((len(self.stages), len(BUCKETS_NS) + 1), dtype=np.int64)
+        self._sum_ns = np.zeros(len(self.stages), dtype=np.int64)
+        self._count = 0
+
+    def should_sample(self) -> bool:
+        """Called once per request; also counts requests."""
+        n = self._seen = next(self._counter)
+        return self.sample_every > 0 and n % self.sample_every == 0
+
+    def record(self, marks: Sequence[int]) -> None:
+        """marks: perf_counter_ns() before the first stage and after each one."""
+        self._pending.append(marks)
+        if len(self._pending) >= FOLD_BATCH:
+            self._fold()
+
+    def _fold(self) -> None:
+        with self._lock:
+            rows = [self._pending.popleft() for _ in range(len(self._pending))]
+            if not rows:
+                return
+            durations = np.diff(np.array(rows, dtype=np.int64), axis=1)
+            slots = np.searchsorted(self._bounds, durations, side="left")
+            for i in range(len(self.stages)):
+                self._buckets[i] += np.bincount(slots[:, i], minlength=self._buckets.shape[1])
+            self._sum_ns += durations.sum(axis=0)
+            self._count += len(rows)
+
+    def breakdown(self, marks: Sequence[int]) -> Dict[str, float]:
+        """Per-stage µs for one request's marks (for SystemResponse.meta)."""
+        return {stage: (marks[i + 1] - marks[i]) / 1_000 for i, stage in enumerate(self.stages)}
+
+    def prometheus(self) -> str:
+        self._fold()
+        with self._lock:
+            buckets = self._buckets.tolist()
+            sums = self._sum_ns.tolist()
+            count = self._count
+        total = self._seen + 1
+        name = "reasoning_stage_duration_seconds"
+        lines = [
+            "# HELP reasoning_requests_total Messages processed by the reasoning engine.",
+            "# TYPE reasoning_requests_total counter",
+            f"reasoning_requests_total {total}",
+            "# HELP reasoning_requests_sampled_total Messages whose stages were timed.",
+            "# TYPE reasoning_requests_sampled_total counter",
+            f"reasoning_requests_sampled_total {count}",
+            f"# HELP {name} Time spent in each ReasoningEngine.process stage (sampled).",
+            f"# TYPE {name} histogram",
+        ]
+        for stage, counts, sum_ns in zip(self.stages, buckets, sums):
+            cumulative = 0
+            for bound, n in zip(BUCKETS_NS, counts):
+                cumulative += n
+                lines.append(f'{name}_bucket{{stage="{stage}",le="{bound / 1e9:g}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{stage="{stage}",le="+Inf"}} {count}')
+            lines.append(f'{name}_sum{{stage="{stage}"}} {sum_ns / 1e9:.9f}')
+            lines.append(f'{name}_count{{stage="{stage}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+def create_stage_timings_from_env() -> StageTimings:
+    """
+    REASON_TIMING_SAMPLE_EVERY   time one request in N (default 16; 0 disables sampling)
+    """
+    return StageTimings(sample_every=int(os.getenv("REASON_TIMING_SAMPLE_EVERY", "16")))
+
+
+STAGE_TIMINGS = create_stage_timings_from_env()
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import os
+import re
+import threading
+from itertools import islice
+from typing import Dict, Optional, Tuple
+
+from fastapi import HTTPException
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Tokens are whitespace-separated runs, the same split reasoning/text.py uses
+_TOKEN = re.compile(r"\S+")
+
+
+class MessageTooLarge(ValueError):
+  pass
+
+
+class RequestBudget:
+  """Size caps applied before a request reaches the reasoning / chat pipeline.
+
+  Two layers:
+  - body bytes, enforced by BodySizeLimitMiddleware while the body streams
+    in (Content-Length is checked first), so an oversize body is never
+    buffered whole or JSON-decoded;
+  - message bytes (UTF-8) and tokens, enforced by `apply()` on the user
+    text once the body is parsed. Policy "truncate" trims the message to
+    both caps; "reject" raises MessageTooLarge (mapped to 413).
+  """
+
+  POLICIES = ("truncate", "reject")
+
+  def __init__(
+    self,
+    max_body_bytes: int = 8 << 20,
+    max_chat_body_bytes: int = 64 << 10,
+    chat_prefixes: Tuple[str, ...] = ("/reason/", "/chat/"),
+    max_message_bytes: int = 4_096,
+    max_message_tokens: int = 512,
+    policy: str = "truncate",
+  ) -> None:
+    if policy not in self.POLICIES:
+      raise ValueError(f"policy must be one of {self.POLICIES}, got {policy!r}")
+    if max_message_bytes < 1 or max_message_tokens < 1:
+      raise ValueError("message caps must be at least 1")
+    self.max_body_bytes = max_body_bytes
+    self.max_chat_body_bytes = max_chat_body_bytes
+    self.chat_prefixes = chat_prefixes
+    self.max_message_bytes = max_message_bytes
+    self.max_message_tokens = max_message_tokens
+    self.policy = policy
+    self._counts: Dict[str, int] = {"bodies_rejected": 0, "messages_truncated": 0, "messages_rejected": 0}
+    self._lock = threading.Lock()
+
+  def _count(self, name: str) -> None:
+    with self._lock:
+      self._counts[name] += 1
+
+  def body_limit(self, path: str) -> int:
+    if path.startswith(self.chat_prefixes):
+      return min(self.max_chat_body_bytes, self.max_body_bytes)
+    return self.max_body_bytes
+
+  def _over(self, message: str) -> Tuple[bool, bool]:
+    # Cheap bounds first: a str of n chars is at most 4n UTF-8 bytes and
+    # holds at most (n + 1) // 2 tokens, so typical messages skip the scans.
+    n = len(message)
+    over_bytes = n * 4 > self.max_message_bytes and len(message.encode("utf-8")) > self.max_message_bytes
+    over_tokens = (n + 1) // 2 > self.max_message_tokens and self._token_end(message) is not None
+    return over_bytes, over_tokens
+
+  def _token_end(self, message: str) -> Optional[int]:
+    """End offset of the last allowed token, or None if within the cap."""
+    end = None
+    for i, match in enumerate(islice(_TOKEN.finditer(message), self.max_message_tokens + 1)):
+      if i == self.max_message_tokens:
+        return end
+      end = match.end()
+    return None
+
+  def apply(self, message: str) -> str:
+    """Return `message` within the caps (truncated) or raise MessageTooLarge."""
+    if not message:
+      return message
+    over_bytes, over_tokens = self._over(message)
+    if not (over_bytes or over_tokens):
+      return message
+    if self.policy == "reject":
+      self._count("messages_rejected")
+      raise MessageTooLarge(
+        f"message exceeds {self.max_message_bytes} bytes / {self.max_message_tokens} tokens"
+      )
+    if over_tokens:
+      message = message[: self._token_end(message)]
+    if over_bytes:
+      # Drop a partial trailing code point rather than emit U+FFFD
+      message = message.encode("utf-8")[: self.max_message_bytes].decode("utf-8", "ignore")
+    self._count("messages_truncated")
+    return message
+
+  def stats(self) -> Dict[str, object]:
+    with self._lock:
+      counts = dict(self._counts)
+    return {
+      "policy": self.policy,
+      "max_body_bytes": self.max_body_bytes,
+      "max_chat_body_bytes": self.max_chat_body_bytes,
+      "max_message_bytes": self.max_message_bytes,
+      "max_message_tokens": self.max_message_tokens,
+      **counts,
+    }
+
+
+class BodySizeLimitMiddleware:
+  """Pure ASGI middleware: 413 for bodies over budget.body_limit(path).
+
+  A declared Content-Length over the limit is answered without reading the
+  body. Otherwise `receive` is wrapped and counts chunks as the handler
+  reads them; the first chunk past the limit raises HTTPException(413),
+  which FastAPI re-raises from its body parsing, before json.loads runs.
+  """
+
+  def __init__(self, app: ASGIApp, budget: RequestBudget) -> None:
+    self.app = app
+    self.budget = budget
+
+  async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+    if scope["type"] != "http":
+      await self.app(scope, receive, send)
+      return
+
+    limit = self.budget.body_limit(scope["path"])
+    detail = f"Request body exceeds {limit} bytes"
+    for name, value in scope["headers"]:
+      if name == b"content-length":
+        if value.isdigit() and int(value) > limit:
+          self.budget._count("bodies_rejected")
+          await JSONResponse({"detail": detail}, status_code=413)(scope, receive, send)
+          return
+        break
+
+    received = 0
+
+    async def limited_receive() -> Message:
+      nonlocal received
+      message = await receive()
+      if message["type"] == "http.request":
+        received += len(message.get("body", b""))
+        if received > limit:
+          self.budget._count("bodies_rejected")
+          raise HTTPException(status_code=413, detail=detail)
+      return message
+
+    await self.app(scope, limited_receive, send)
+
+
+def create_request_budget_from_env() -> RequestBudget:
+  """
+  REQUEST_MAX_BODY_BYTES        body cap for every route (default 8 MiB; batch endpoints)
+  REQUEST_MAX_CHAT_BODY_BYTES   body cap for /reason/* and /chat/* (default 64 KiB)
+  REQUEST_MAX_MESSAGE_BYTES     UTF-8 bytes of user text per message (default 4096)
+  REQUEST_MAX_MESSAGE_TOKENS    whitespace tokens per message (default 512)
+  REQUEST_OVERSIZE_POLICY       "truncate" (default) or "reject" (413) for messages over a cap
+  """
+  return RequestBudget(
+    max_body_bytes=int(os.getenv("REQUEST_MAX_BODY_BYTES", 8 << 20)),
+    max_chat_body_bytes=int(os.getenv("REQUEST_MAX_CHAT_BODY_BYTES", 64 << 10)),
+    max_message_bytes=int(os.getenv("REQUEST_MAX_MESSAGE_BYTES", 4_096)),
+    max_message_tokens=int(os.getenv("REQUEST_MAX_MESSAGE_TOKENS", 512)),
+    policy=os.getenv("REQUEST_OVERSIZE_POLICY", "truncate"),
+  )
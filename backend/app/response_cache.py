@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import Callable, Dict, Hashable, NamedTuple, Optional, Tuple
+
+
+class CachedResponse(NamedTuple):
+  body: bytes
+  etag: str
+
+
+class ResponseCache:
+  """Pre-encoded JSON bodies keyed by (key, generation).
+
+  Public content only changes on admin writes, which bump the store's
+  generation counter. Each key keeps the body built for the latest
+  generation seen; an older generation is simply rebuilt on next access.
+  """
+
+  def __init__(self, max_entries: int = 10_000) -> None:
+    self.max_entries = max_entries
+    self._entries: Dict[Hashable, Tuple[int, CachedResponse]] = {}
+    self._lock = threading.Lock()
+
+  def get_or_build(self, key: Hashable, generation: int, build: Callable[[], bytes]) -> CachedResponse:
+    entry = self._entries.get(key)
+    if entry is not None and entry[0] == generation:
+      return entry[1]
+
+    body = build()
+    digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+    cached = CachedResponse(body=body, etag=f'"{generation}-{digest}"')
+    with self._lock:
+      if len(self._entries) >= self.max_entries and key not in self._entries:
+        self._entries.clear()
+      self._entries[key] = (generation, cached)
+    return cached
+
+  def clear(self) -> None:
+    with self._lock:
+      self._entries.clear()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+  """If-None-Match check (weak comparison, list and "*" supported)."""
+  if not if_none_match:
+    return False
+  for candidate in if_none_match.split(","):
+    candidate = candidate.strip()
+    if candidate == "*":
+      return True
+    if candidate.startswith("W/"):
+      candidate = candidate[2:]
+    if candidate == etag:
+      return True
+  return False
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
-from typing import List, Optional
-from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field
+
+# Upper bound on payloads per /labs/*/run-batch call; replay larger sets in chunks
+MAX_BATCH_ITEMS = 10_000
+
+# Hard ceiling on chat message length (422 above it); RequestBudget then
+# truncates or rejects to its own, smaller byte/token caps
+MAX_MESSAGE_CHARS = 16_000
 
 
 class SuggestedReply(BaseModel):
@@ -17,7 +24,7 @@ class ChatSessionCreateResponse(BaseModel):
 
 class ChatMessageRequest(BaseModel):
   session_id: str
-  message: str
+  message: str = Field(max_length=MAX_MESSAGE_CHARS)
 
 
 class ChatMessageResponse(BaseModel):
@@ -91,6 +98,14 @@ class AuditResponse(BaseModel):
   recommendations: List[AuditRecommendation]
 
 
+class AuditBatchRequest(BaseModel):
+  payloads: List[AuditRequest] = Field(max_length=MAX_BATCH_ITEMS)
+
+
+class AuditBatchResponse(BaseModel):
+  results: List[AuditResponse]
+
+
 # ----------------------
 # Labs: Build Cost & Delivery Model Estimator
 # ----------------------
@@ -119,3 +134,67 @@ class EstimatorResponse(BaseModel):
   plan: List[str]
   recommendations: List[str]
 
+
+class EstimatorBatchRequest(BaseModel):
+  payloads: List[EstimatorRequest] = Field(max_length=MAX_BATCH_ITEMS)
+
+
+class EstimatorBatchResponse(BaseModel):
+  results: List[EstimatorResponse]
+
+
+# ----------------------
+# Labs: batch runs for engines that take free-form payloads
+# ----------------------
+
+
+class LabsBatchRequest(BaseModel):
+  payloads: List[Dict[str, Any]] = Field(max_length=MAX_BATCH_ITEMS)
+
+
+# ----------------------
+# Reasoning engine (ARE-3.5)
+# ----------------------
+
+
+class ReasonChatRequest(BaseModel):
+  # Optional here so a missing id keeps its 400 from the handler (not a 422)
+  session_id: Optional[str] = None
+  message: Optional[str] = None
+  page: Optional[str] = None
+  context: Dict[str, Any] = {}
+  history: List[Any] = []
+  timings: bool = False  # per-stage timings in meta["timings_us"]
+
+
+class ReasonChatResponse(BaseModel):
+  session_id: str
+  intent: str
+  intent_confidence: float
+  action: str
+  action_payload: Dict[str, Any]
+  bot_reply: str
+  meta: Dict[str, Any] = {}
+
+
+class ReasonLabNextRequest(BaseModel):
+  session_id: Optional[str] = None
+  lab_tool: Optional[str] = None
+  lab: Optional[str] = None  # older alias of lab_tool
+  lab_result: Optional[Dict[str, Any]] = None
+  result: Optional[Dict[str, Any]] = None  # older alias of lab_result
+  context: Dict[str, Any] = {}
+
+
+class NextAction(BaseModel):
+  label: str
+  type: str
+  target: Optional[str] = None
+  payload: Dict[str, Any] = {}
+
+
+class ReasonLabNextResponse(BaseModel):
+  action: str
+  action_payload: Dict[str, Any]
+  bot_reply: str
+  next_actions: List[NextAction]
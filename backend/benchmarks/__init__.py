@@ -0,0 +1,6 @@
+"""
+Backend micro-benchmarks.
+
+Run from the backend/ directory, e.g.:
+    python -m benchmarks.marker_scan
+"""
@@ -0,0 +1,119 @@
+"""
+Conversation analytics (app.analytics) cost:
+
+    record     per-call latency of AnalyticsLog.record_turn (the request path)
+    ingest     records/s AnalyticsStore.write sustains, rollups included,
+               while loading --days of synthetic sessions
+    funnel     funnel query latency from the daily + hourly rollups, for a week,
+               a month and the whole range, totals and per-day series
+    raw scan   the same distinct-session counts computed from the raw turns
+               and lab_runs tables, for comparison
+
+    python -m benchmarks.analytics [--days 180] [--sessions 200000]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from app.analytics import AnalyticsLog, AnalyticsStore
+
+INTENTS = ["new_project", "existing_system", "careers", "contact_human", "unknown"]
+STATES = ["greeting", "new_project", "existing_system", "careers", "contact_human", "handoff_ready"]
+TOOLS = ["build_estimator", "audit", "architecture_blueprint", "ai_readiness"]
+
+
+def _sessions(count: int, start: float, seconds: float, seed: int = 11):
+    """Records of `count` chat sessions spread over [start, start + seconds), in time order."""
+    rng = random.Random(seed)
+    starts = sorted(start + rng.random() * seconds for _ in range(count))
+    for n, ts in enumerate(starts):
+        session_id = f"s-{n}"
+        tool = rng.choice(TOOLS)
+        turns = rng.randint(1, 8)
+        for t in range(turns):
+            action = "show_message"
+            if t == turns - 1:
+                roll = rng.random()
+                action = "open_lab_tool" if roll < 0.35 else "escalate_human" if roll < 0.45 else action
+            fields = (session_id, rng.choice(STATES), rng.choice(INTENTS), round(rng.random(), 2),
+                      action, tool if action == "open_lab_tool" else None)
+            yield ("turn", ts + t * 20, fields)
+            if action == "open_lab_tool" and rng.random() < 0.6:
+                result = {"scores": {"load": rng.randint(0, 40), "data": rng.randint(0, 40)}, "tier": rng.choice("ABC")}
+                yield ("lab_run", ts + t * 20 + 120, (tool, session_id, result))
+        if rng.random() < 0.05:
+            yield ("lab_run", ts, (rng.choice(TOOLS), None, {"scores": {"score": rng.randint(0, 100)}}))
+
+
+def _timed(fn, repeat: int = 20) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=int, default=180)
+    parser.add_argument("--sessions", type=int, default=200_000)
+    parser.add_argument("--records", type=int, default=200_000, help="record_turn calls timed")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AnalyticsStore(os.path.join(tmp, "analytics.db"))
+
+        log = AnalyticsLog(AnalyticsStore(os.path.join(tmp, "record.db")), capacity=args.records)
+        start = time.perf_counter()
+        for n in range(args.records):
+            log.record_turn(f"s-{n % 5000}", "new_project", "new_project", 0.8, "show_message")
+        record_s = time.perf_counter() - start
+        print(f"record   {record_s / args.records * 1e6:.2f} us/call over {args.records} calls")
+
+        end = time.time() // 3600 * 3600
+        begin = end - args.days * 86400
+        written, batch, write_s = 0, [], 0.0
+        for record in _sessions(args.sessions, begin, args.days * 86400):
+            batch.append(record)
+            if len(batch) == 1_000:
+                t0 = time.perf_counter()
+                store.write(batch)
+                write_s += time.perf_counter() - t0
+                written += len(batch)
+                batch = []
+        if batch:
+            t0 = time.perf_counter()
+            store.write(batch)
+            write_s += time.perf_counter() - t0
+            written += len(batch)
+        counts = store.counts()
+        print(f"ingest   {written / write_s:,.0f} records/s into {counts['turns']:,} turns, "
+              f"{counts['lab_runs']:,} lab runs over {args.days} days "
+              f"({counts['funnel_hourly']:,} hourly, {counts['funnel_daily']:,} daily rollup rows)")
+
+        for label, since in (("7d", end - 7 * 86400), ("30d", end - 30 * 86400), (f"{args.days}d", None)):
+            for bucket in (None, "day"):
+                ms = _timed(lambda: store.funnel(since=since, until=end, bucket=bucket))
+                print(f"funnel   {label:<5} {bucket or 'totals':<7} {ms:7.2f} ms")
+        ms = _timed(lambda: store.funnel(since=end - 30 * 86400, until=end, bucket="day", tool="audit"))
+        print(f"funnel   30d   day, tool=audit {ms:.2f} ms")
+
+        conn = store._conn()
+        raw = (
+            "SELECT"
+            " (SELECT COUNT(DISTINCT session_id) FROM turns WHERE ts >= :since),"
+            " (SELECT COUNT(DISTINCT session_id) FROM turns WHERE ts >= :since AND action = 'open_lab_tool'),"
+            " (SELECT COUNT(DISTINCT session_id) FROM lab_runs WHERE ts >= :since AND session_id IS NOT NULL),"
+            " (SELECT COUNT(DISTINCT session_id) FROM turns WHERE ts >= :since AND action = 'escalate_human')"
+        )
+        ms = _timed(lambda: conn.execute(raw, {"since": begin}).fetchone(), repeat=3)
+        print(f"raw scan {args.days}d totals {ms:9.2f} ms")
+        totals = store.funnel(until=end)["totals"]
+        print(f"totals   {totals}  raw {conn.execute(raw, {'since': begin}).fetchone()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Admin auth (app.auth) cost:
+
+    decode     the old per-request path: jwt.decode with the raw secret
+    verify     TokenVerifier.verify with the cache off (prebuilt HMAC key,
+               kid lookup) and on (SHA-256 of the token + dict lookup)
+    admin      GET /admin/jobs through the app (TestClient), cache off / on,
+               p50 / p95 per request
+
+    python -m benchmarks.auth [--calls 20000] [--requests 2000]
+"""
+
+import argparse
+import statistics
+import time
+
+from fastapi.testclient import TestClient
+from jose import jwt
+
+from app.auth import ALGORITHM, SECRET_KEY, TokenVerifier, create_access_token, require_admin
+from app.main import app
+
+
+def _per_call_us(fn, calls: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def _admin_latency(client: TestClient, headers, requests: int):
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = client.get("/admin/jobs", headers=headers)
+        samples.append((time.perf_counter() - start) * 1e6)
+        assert response.status_code == 200, response.status_code
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--requests", type=int, default=2_000)
+    args = parser.parse_args()
+
+    token = create_access_token({"sub": "bench@ameotech.com", "is_admin": True, "role": "admin"})
+    # Previous secret first in the list, so a kid-less token would pay for a miss
+    uncached = TokenVerifier(["previous-secret", SECRET_KEY], max_entries=0)
+    cached = TokenVerifier(["previous-secret", SECRET_KEY], max_entries=1024)
+
+    us = _per_call_us(lambda: jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM]), args.calls)
+    print(f"decode   jwt.decode(secret)        {us:8.2f} us/call")
+    us = _per_call_us(lambda: uncached.verify(token), args.calls)
+    print(f"verify   cache off                 {us:8.2f} us/call")
+    us = _per_call_us(lambda: cached.verify(token), args.calls)
+    print(f"verify   cache on                  {us:8.2f} us/call  {cached.stats()['hits']} hits")
+
+    headers = {"Authorization": f"Bearer {token}"}
+    previous = require_admin.verifier
+    try:
+        with TestClient(app) as client:
+            for label, verifier in (("cache off", uncached), ("cache on", cached)):
+                require_admin.verifier = verifier
+                p50, p95 = _admin_latency(client, headers, args.requests)
+                print(f"admin    GET /admin/jobs {label:<9} p50 {p50:7.1f} us  p95 {p95:7.1f} us")
+    finally:
+        require_admin.verifier = previous
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Architecture Blueprint: run_architecture_blueprint vs. BlueprintEngine.
+
+    cold   every call is a new input (cache misses, result assembled)
+    warm   inputs repeat from a small working set (LRU hits)
+
+    python -m benchmarks.blueprint [--calls 20000]
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, List
+
+from app.labs.architecture_blueprint_engine import (
+    _FIELDS,
+    BlueprintEngine,
+    run_architecture_blueprint,
+)
+
+DESCRIPTIONS = ["", "B2B saas with chat", "multi tenant marketplace", "internal tool for the ops team"]
+
+
+def generate_payloads(count: int, seed: int = 11) -> List[dict]:
+    rng = random.Random(seed)
+    payloads = []
+    for _ in range(count):
+        payload = {name: rng.choice([v for v in values if v]) for name, _, values, _ in _FIELDS}
+        payload["description"] = rng.choice(DESCRIPTIONS)
+        payload["seo_needed"] = rng.random() < 0.3
+        payloads.append(payload)
+    return payloads
+
+
+def _calls_per_sec(fn: Callable[[dict], dict], payloads: List[dict]) -> float:
+    start = time.perf_counter()
+    for payload in payloads:
+        fn(payload)
+    return len(payloads) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--working-set", type=int, default=500)
+    args = parser.parse_args()
+
+    cold = generate_payloads(args.calls)
+    hot = generate_payloads(args.working_set, seed=12)
+    rng = random.Random(3)
+    warm = [rng.choice(hot) for _ in range(args.calls)]
+
+    start = time.perf_counter()
+    engine = BlueprintEngine(max_entries=args.working_set * 2, precompute=True)
+    precompute_ms = (time.perf_counter() - start) * 1e3
+    plain = BlueprintEngine(max_entries=args.working_set * 2, precompute=False)
+    for payload in hot:
+        engine.run(payload)
+
+    print(f"precompute tables       {precompute_ms:8.2f} ms")
+    print(f"{'':24}{'calls/s':>10}")
+    print(f"{'legacy':<24}{_calls_per_sec(run_architecture_blueprint, cold):>10.0f}")
+    print(f"{'engine cold':<24}{_calls_per_sec(plain.run, cold):>10.0f}")
+    print(f"{'engine cold + tables':<24}{_calls_per_sec(BlueprintEngine(precompute=True).run, cold):>10.0f}")
+    print(f"{'engine warm':<24}{_calls_per_sec(engine.run, warm):>10.0f}")
+    print(engine.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Concurrent content reads while an admin keeps writing: snapshot reads
+(current store) vs. the previous lock-around-every-read store.
+
+Each reader thread loops over get_by_slug / published list_items; one
+writer thread updates a random item every `--write-interval` seconds.
+Reports aggregate reads/sec and p99 read latency per thread count.
+
+Under CPython's GIL reads never run truly in parallel, so aggregate
+throughput stays roughly flat; what the snapshot path removes is readers
+queueing behind each other and behind writes (the p99 column).
+
+    python -m benchmarks.content_reads [--items 5000] [--threads 1,2,4,8,16,32]
+"""
+
+import argparse
+import random
+import threading
+import time
+from typing import List
+
+from app.content_store import InMemoryContentStore
+from app.schemas import ContentItemCreate, ContentStatus, ContentType
+
+from .content_store import populate
+
+
+class LockedReadsContentStore(InMemoryContentStore):
+    """Previous behaviour: readers and writers share one lock."""
+
+    def list_items(self, type=None, status=None):
+        with self._write_lock:
+            return super().list_items(type, status)
+
+    def get_by_slug(self, type, slug, status=None):
+        with self._write_lock:
+            return super().get_by_slug(type, slug, status)
+
+
+def _run(store: InMemoryContentStore, slugs: list, threads: int, seconds: float, write_interval: float):
+    stop = threading.Event()
+    latencies: List[List[float]] = [[] for _ in range(threads)]
+    ids = [item.id for item in store.list_items()]
+
+    def reader(n: int) -> None:
+        rng = random.Random(n)
+        out = latencies[n]
+        published = dict(type=ContentType.CASE_STUDY, status=ContentStatus.PUBLISHED)
+        while not stop.is_set():
+            start = time.perf_counter()
+            if rng.random() < 0.5:
+                store.get_by_slug(*rng.choice(slugs))
+            else:
+                store.list_items(**published)
+            out.append(time.perf_counter() - start)
+
+    def writer() -> None:
+        rng = random.Random(99)
+        while not stop.is_set():
+            item = store.get(rng.choice(ids))
+            store.update(item.id, ContentItemCreate(
+                type=item.type, title=item.title + ".", slug=item.slug, body_rich=item.body_rich,
+                status=item.status,
+            ))
+            time.sleep(write_interval)
+
+    workers = [threading.Thread(target=reader, args=(n,)) for n in range(threads)]
+    workers.append(threading.Thread(target=writer))
+    for w in workers:
+        w.start()
+    time.sleep(seconds)
+    stop.set()
+    for w in workers:
+        w.join()
+
+    merged = sorted(lat for per_thread in latencies for lat in per_thread)
+    p99 = merged[int(len(merged) * 0.99)] if merged else 0.0
+    return len(merged) / seconds, p99
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=5_000)
+    parser.add_argument("--threads", default="1,2,4,8,16,32")
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--write-interval", type=float, default=0.005)
+    args = parser.parse_args()
+
+    print(f"{'threads':>7}  {'store':<8} {'reads/s':>10} {'p99 µs':>10}")
+    for threads in [int(t) for t in args.threads.split(",")]:
+        for name, cls in (("locked", LockedReadsContentStore), ("snapshot", InMemoryContentStore)):
+            store = cls()
+            slugs = populate(store, args.items)
+            rps, p99 = _run(store, slugs, threads, args.seconds, args.write_interval)
+            print(f"{threads:>7}  {name:<8} {rps:>10.0f} {p99 * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
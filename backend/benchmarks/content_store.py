@@ -0,0 +1,91 @@
+"""
+InMemoryContentStore lookups at 50k items: secondary indexes vs. the
+previous full scans (reproduced below over the same items dict).
+
+    python -m benchmarks.content_store [--items 50000]
+"""
+
+import argparse
+import random
+import time
+
+from app.content_store import InMemoryContentStore
+from app.schemas import ContentItem, ContentStatus, ContentType
+
+
+def legacy_list_items(store, type=None, status=None):
+    items = list(store._snapshot.items.values())
+    if type:
+        items = [i for i in items if i.type == type]
+    if status:
+        items = [i for i in items if i.status == status]
+    return items
+
+
+def legacy_get_by_slug(store, type, slug, status=None):
+    for item in store._snapshot.items.values():
+        if item.type == type and item.slug == slug:
+            if status and item.status != status:
+                continue
+            return item
+    return None
+
+
+def populate(store: InMemoryContentStore, count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    slugs = []
+    items = []
+    for n in range(count):
+        type = ContentType.CASE_STUDY if n % 5 else ContentType.JOB_POST
+        status = rng.choice([ContentStatus.DRAFT, ContentStatus.PUBLISHED, ContentStatus.ARCHIVED])
+        # Keep the public pages realistic: only a small share is published
+        if status == ContentStatus.PUBLISHED and rng.random() > 0.01:
+            status = ContentStatus.DRAFT
+        slug = f"item-{n}"
+        items.append(ContentItem(
+            id=f"id-{n}", type=type, title=f"Item {n}", slug=slug, body_rich="...", status=status,
+        ))
+        slugs.append((type, slug))
+    # One batch: each create() publishes a full snapshot copy, which is fine
+    # for admin edits but quadratic for 50k inserts
+    with store._write_lock:
+        store._commit(items)
+    return slugs
+
+
+def _per_call(fn, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    store = InMemoryContentStore()
+    slugs = populate(store, args.items)
+    rng = random.Random(1)
+    lookups = [rng.choice(slugs) for _ in range(args.calls)]
+
+    published = dict(type=ContentType.CASE_STUDY, status=ContentStatus.PUBLISHED)
+    assert legacy_list_items(store, **published) == store.list_items(**published)
+
+    it = iter(lookups * 2)
+    slug_before = _per_call(lambda: legacy_get_by_slug(store, *next(it)), args.calls)
+    it = iter(lookups * 2)
+    slug_after = _per_call(lambda: store.get_by_slug(*next(it)), args.calls)
+    list_before = _per_call(lambda: legacy_list_items(store, **published), args.calls)
+    list_after = _per_call(lambda: store.list_items(**published), args.calls)
+
+    print(f"items:            {len(store.list_items())}")
+    print(f"published cases:  {len(store.list_items(**published))}")
+    print(f"get_by_slug       before {slug_before * 1e6:10.1f} µs   after {slug_after * 1e6:8.1f} µs")
+    print(f"list_items        before {list_before * 1e6:10.1f} µs   after {list_after * 1e6:8.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Synthetic but realistic chat messages for benchmarks.
+Deterministic for a given seed so runs are comparable.
+"""
+
+import random
+from typing import List
+
+
+OPENERS = [
+    "hi", "hello", "hey there", "ok", "thanks", "so", "quick question", "",
+]
+
+BODIES = [
+    "I want to build a new app for my startup",
+    "we have an idea for a saas platform",
+    "how much would an mvp cost",
+    "what is the budget for a prototype",
+    "can you give me a ballpark estimate",
+    "our website is slow and crashing",
+    "there are bugs in our existing system",
+    "we need maintenance and support for a legacy app",
+    "any job openings for backend engineers?",
+    "is there an internship or intern position",
+    "I am looking for a career at ameotech",
+    "we need a pricing engine for 20k skus",
+    "help with our data pipeline and warehouse",
+    "what do you suggest for the tech stack",
+    "why not django instead of .net",
+    "we use react and next.js with typescript",
+    "my tech stack is flutter vs react native",
+    "tell me more about ameotech",
+    "what kind of work do you do",
+    "can i trust you guys, is this a scam",
+    "are you a bot or chatgpt",
+    "what do you mean",
+    "no thanks, not now",
+    "this is a stupid useless bot",
+    "talk to someone real please",
+    "can you call me tomorrow",
+    "book a call with your team",
+    "analytics dashboard on snowflake",
+]
+
+CLOSERS = [
+    "", "thanks", "please", "asap", "for next quarter", "we are a team of 5",
+]
+
+
+def generate_messages(count: int, seed: int = 42) -> List[str]:
+    rng = random.Random(seed)
+    messages = []
+    for _ in range(count):
+        parts = [rng.choice(OPENERS), rng.choice(BODIES)]
+        if rng.random() < 0.3:
+            parts.append(rng.choice(BODIES))
+        parts.append(rng.choice(CLOSERS))
+        messages.append(" ".join(p for p in parts if p))
+    return messages
@@ -0,0 +1,91 @@
+"""
+Feedback ingestion (app.feedback) cost:
+
+    record     per-call latency of FeedbackLog.record (the request path)
+               while the writer thread flushes in the background
+    writer     rows/s the writer sustains into SQLite
+    summary    thumbs-down rate GROUP BY over --rows rows, wall time and
+               Python-side peak memory (tracemalloc), which stays at the
+               size of the result, not the table
+
+    python -m benchmarks.feedback [--rows 1000000] [--records 200000]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from app.feedback import FeedbackLog, FeedbackStore
+
+INTENTS = ["new_project", "existing_system", "careers", "contact_human", "unknown", "pricing_engine"]
+STATES = ["greeting", "new_project", "existing_system", "careers", "contact_human", "handoff_ready", "unknown"]
+ACTIONS = ["show_message", "show_options", "open_lab_tool", "escalate_human"]
+EVENTS = ["thumbs_up", "thumbs_down", "next_action_clicked"]
+
+
+def _payloads(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    for n in range(count):
+        yield {
+            "session_id": f"s-{n % 5000}",
+            "event": rng.choice(EVENTS),
+            "action": rng.choice(ACTIONS),
+            "intent": rng.choice(INTENTS),
+            "state": rng.choice(STATES),
+            "payload": {"lab_tool": "audit"} if n % 7 == 0 else {},
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--records", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = FeedbackStore(os.path.join(tmp, "feedback.db"))
+        log = FeedbackLog(store, max_batch=1_000, max_delay=0.2, capacity=max(args.records, 1))
+        payloads = list(_payloads(args.records))
+        log.start()
+        start = time.perf_counter()
+        for payload in payloads:
+            log.record(payload)
+        record_s = time.perf_counter() - start
+        log.stop()
+        writer_s = time.perf_counter() - start
+        stats = log.stats()
+        print(f"record   {record_s / args.records * 1e6:.2f} us/call over {args.records} calls")
+        print(f"writer   {stats['flushed'] / writer_s:,.0f} rows/s "
+              f"({stats['batches']} batches, dropped {stats['dropped']})")
+
+        # Fill the table directly up to --rows for the summary timing
+        remaining = args.rows - store.count()
+        now = time.time()
+        batch = []
+        for n, payload in enumerate(_payloads(max(remaining, 0), seed=8)):
+            batch.append((now - n, payload, None))
+            if len(batch) == 50_000:
+                store.write(batch)
+                batch = []
+        if batch:
+            store.write(batch)
+        rows = store.count()
+
+        for by in (("intent",), ("intent", "state", "action")):
+            tracemalloc.start()
+            start = time.perf_counter()
+            result = store.summary(by)
+            seconds = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"summary  by {','.join(by):<22} {rows:,} rows  {seconds:.2f} s  "
+                  f"{len(result)} groups  peak {peak / 1024:.0f} KiB")
+        worst = result[0]
+        print(f"worst    {worst}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Intent registry hot swap: reload latency, match latency, and scoring under
+concurrent reloads.
+
+Two registry versions (the bundled one and a variant with changed weights)
+are written alternately to a temp file while scorer threads classify corpus
+messages. Every score dict must equal what one complete matcher -- version A
+or version B -- produces for that message; a mix would mean a half-built
+matcher was visible.
+
+    python -m benchmarks.intent_registry [--seconds 3] [--threads 4]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
+from app.reasoning.matcher import IntentMatcher
+from app.reasoning.registry import DEFAULT_REGISTRY_PATH, IntentRegistry, parse_registry
+from app.reasoning.utils import normalize
+
+from .corpus import generate_messages
+
+SESSION = SimpleNamespace(last_intent=None, goal=None)
+PAGES = ["/", "/services", "/careers", "/labs/pricing", "/data"]
+
+
+def _variant(doc: dict) -> dict:
+    doc = json.loads(json.dumps(doc))
+    doc["version"] = f"{doc['version']}-b"
+    for cfg in doc["intents"].values():
+        cfg["weight"] = round(cfg.get("weight", 1.0) * 1.5, 3)
+    return doc
+
+
+def _write(path: str, doc: dict) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(doc, f)
+    os.replace(tmp, path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    with open(DEFAULT_REGISTRY_PATH, encoding="utf-8") as f:
+        doc_a = json.load(f)
+    doc_b = _variant(doc_a)
+    messages = [normalize(m) for m in generate_messages(500)]
+    cases = [(m, PAGES[i % len(PAGES)]) for i, m in enumerate(messages)]
+
+    # Expected scores per version, from matchers built directly
+    expected = {}
+    for doc in (doc_a, doc_b):
+        version, intents = parse_registry(doc)
+        matcher = IntentMatcher(intents, version=version)
+        expected[version] = [matcher.score(m, p, SESSION) for m, p in cases]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "intent_registry.json")
+        _write(path, doc_a)
+        registry = IntentRegistry(path, poll_seconds=0)
+
+        stop = threading.Event()
+        scored = [0] * args.threads
+        mismatches = [0] * args.threads
+
+        def scorer(n: int) -> None:
+            i = n
+            while not stop.is_set():
+                matcher = registry.current
+                message, page = cases[i % len(cases)]
+                if matcher.score(message, page, SESSION) != expected[matcher.version][i % len(cases)]:
+                    mismatches[n] += 1
+                registry.score(message, page, SESSION)  # match-latency stats
+                scored[n] += 1
+                i += args.threads
+
+        threads = [threading.Thread(target=scorer, args=(n,)) for n in range(args.threads)]
+        for t in threads:
+            t.start()
+        deadline = time.monotonic() + args.seconds
+        swaps = 0
+        while time.monotonic() < deadline:
+            _write(path, doc_b if swaps % 2 == 0 else doc_a)
+            registry.reload()
+            swaps += 1
+        stop.set()
+        for t in threads:
+            t.join()
+
+        stats = registry.stats()
+        print(f"{swaps} reloads while {args.threads} threads scored {sum(scored)} messages")
+        print(f"scores not matching version A or B: {sum(mismatches)}")
+        print(f"reload latency  {stats['reload_latency']}")
+        print(f"match latency   {stats['match_latency']}")
+        assert sum(mismatches) == 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Labs engines: scalar run_* in a Python loop vs. the batch entry points,
+over the same synthetic submissions:
+
+    run_*_batch     full results, identical to the scalar ones (checked)
+    score_*_batch   score columns only (what weight recalibration needs)
+
+    python -m benchmarks.labs_batch [--size 20000]
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, List
+
+from app.audit_engine import run_audit, run_audit_batch, score_audit_batch
+from app.build_estimator_engine import (
+    PROJECT_TYPE_COMPLEXITY,
+    run_estimator,
+    run_estimator_batch,
+    score_estimator_batch,
+)
+from app.labs.ai_readiness_engine import (
+    DATA_SIGNALS,
+    WORKFLOW_SIGNALS,
+    run_ai_readiness,
+    run_ai_readiness_batch,
+    score_ai_readiness_batch,
+)
+from app.labs.architecture_blueprint_engine import (
+    _FIELDS,
+    run_architecture_blueprint,
+    run_architecture_blueprint_batch,
+    score_architecture_blueprint_batch,
+)
+
+
+def audit_payloads(rng: random.Random, count: int) -> List[dict]:
+    return [{
+        "product_stage": rng.choice(["idea", "mvp", "early_revenue", "growth", "scaleup"]),
+        "release_freq": rng.choice(["ad_hoc", "monthly", "biweekly", "weekly", "daily"]),
+        "ci_cd": rng.random() < 0.5,
+        "testing": rng.choice(["none", "low", "medium", "high"]),
+        "data_centralized": rng.random() < 0.5,
+        "analytics": rng.choice(["none", "basic", "intermediate", "advanced"]),
+        "pain_points": rng.choice([[], ["slow releases"]]),
+    } for _ in range(count)]
+
+
+def estimator_payloads(rng: random.Random, count: int) -> List[dict]:
+    types = list(PROJECT_TYPE_COMPLEXITY)
+    return [{
+        "project_types": rng.sample(types, rng.randrange(0, 4)),
+        "urgency": rng.choice(["4-6", "8-12", "future"]),
+        "team": rng.choice(["none", "small", "strong", "mature"]),
+        "budget": rng.choice(["exploring", "5-10", "10-20", "20-40", "40+"]),
+    } for _ in range(count)]
+
+
+def readiness_payloads(rng: random.Random, count: int) -> List[dict]:
+    return [{
+        "data_maturity": rng.sample(list(DATA_SIGNALS), rng.randrange(0, 4)),
+        "workflow_maturity": rng.sample(list(WORKFLOW_SIGNALS), rng.randrange(0, 4)),
+        "ai_opportunities": ["x"] * rng.randrange(0, 6),
+        "org_stage": rng.choice(["startup", "growth", "mid", "enterprise"]),
+        "team_strength": rng.choice(["none", "small", "strong", "mature"]),
+        "budget": rng.choice(["low", "moderate", "good", "strong"]),
+        "urgency": rng.choice(["fast", "medium", "slow"]),
+    } for _ in range(count)]
+
+
+def blueprint_payloads(rng: random.Random, count: int) -> List[dict]:
+    payloads = []
+    for _ in range(count):
+        payload = {name: rng.choice([v for v in values if v]) for name, _, values, _ in _FIELDS}
+        payload["description"] = rng.choice(["", "B2B saas with chat", "multi tenant marketplace"])
+        payloads.append(payload)
+    return payloads
+
+
+def _seconds(fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=20_000)
+    args = parser.parse_args()
+
+    rng = random.Random(21)
+    engines = [
+        ("audit", run_audit, run_audit_batch, score_audit_batch, audit_payloads(rng, args.size)),
+        ("build_estimator", run_estimator, run_estimator_batch, score_estimator_batch,
+         estimator_payloads(rng, args.size)),
+        ("ai_readiness", run_ai_readiness, run_ai_readiness_batch, score_ai_readiness_batch,
+         readiness_payloads(rng, args.size)),
+        ("architecture_blueprint", run_architecture_blueprint, run_architecture_blueprint_batch,
+         score_architecture_blueprint_batch, blueprint_payloads(rng, args.size)),
+    ]
+
+    print(f"{'engine':<24}{'scalar ms':>11}{'run_batch':>11}{'score_batch':>13}{'scores speedup':>16}")
+    for name, scalar, batch, score_batch, payloads in engines:
+        assert batch(payloads) == [scalar(p) for p in payloads], name
+        scalar_s = _seconds(lambda: [scalar(p) for p in payloads])
+        batch_s = _seconds(lambda: batch(payloads))
+        score_s = _seconds(lambda: score_batch(payloads))
+        print(
+            f"{name:<24}{scalar_s * 1e3:>11.1f}{batch_s * 1e3:>11.1f}{score_s * 1e3:>13.1f}"
+            f"{scalar_s / score_s:>15.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+HTTP load test for the reasoning / labs / chat endpoints.
+
+Starts uvicorn once per mode and drives it with `--concurrency` async
+clients for `--seconds`, reporting requests/sec and latency percentiles:
+
+    threadpool   INLINE_CPU_BUDGET_US=0  (every call hops to the threadpool,
+                 like the old sync handlers)
+    inline       default budget          (cheap calls stay on the event loop)
+
+    python -m benchmarks.load_test [--concurrency 64] [--seconds 10]
+    python -m benchmarks.load_test --url http://127.0.0.1:8000   # existing server
+
+Needs uvicorn (requirements.txt) and httpx.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from .corpus import generate_messages
+
+MODES = {"threadpool": "0", "inline": None}
+
+
+def _requests(rng: random.Random, messages: List[str]) -> Tuple[str, dict]:
+    roll = rng.random()
+    if roll < 0.6:
+        return "/reason/chat-route", {
+            "session_id": f"load-{rng.randrange(2_000)}",
+            "message": rng.choice(messages),
+            "page": rng.choice(["/", "/services", "/labs", "/careers"]),
+        }
+    if roll < 0.8:
+        return "/reason/lab-next", {
+            "lab_tool": rng.choice(["audit", "build_estimator", "ai_readiness"]),
+            "lab_result": {"scores": {"engineering": rng.randrange(100), "score": rng.randrange(100)}},
+        }
+    return "/labs/ai-readiness/run", {"answers": {}}
+
+
+async def _client(client: httpx.AsyncClient, seed: int, messages: List[str], deadline: float,
+                  latencies: List[float], errors: Dict[int, int]) -> None:
+    rng = random.Random(seed)
+    while time.perf_counter() < deadline:
+        path, body = _requests(rng, messages)
+        start = time.perf_counter()
+        try:
+            response = await client.post(path, json=body)
+            status = response.status_code
+        except httpx.HTTPError:
+            status = -1
+        latencies.append(time.perf_counter() - start)
+        if status != 200:
+            errors[status] = errors.get(status, 0) + 1
+
+
+async def drive(url: str, concurrency: int, seconds: float, warmup: float) -> Dict[str, float]:
+    messages = generate_messages(2_000, seed=3)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30.0) as client:
+        if warmup:
+            await asyncio.gather(*[
+                _client(client, n, messages, time.perf_counter() + warmup, [], {}) for n in range(concurrency)
+            ])
+        latencies: List[float] = []
+        errors: Dict[int, int] = {}
+        start = time.perf_counter()
+        await asyncio.gather(*[
+            _client(client, 1_000 + n, messages, start + seconds, latencies, errors) for n in range(concurrency)
+        ])
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+
+    def pct(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1e3 if latencies else 0.0
+
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": pct(0.50),
+        "p99_ms": pct(0.99),
+        "errors": sum(errors.values()),
+    }
+
+
+def _start_server(port: int, budget: Optional[str]) -> subprocess.Popen:
+    env = dict(os.environ)
+    env.pop("INLINE_CPU_BUDGET_US", None)
+    if budget is not None:
+        env["INLINE_CPU_BUDGET_US"] = budget
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+
+
+def _wait_ready(url: str, timeout: float = 20.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            httpx.get(f"{url}/internal/cpu-guard/stats", timeout=1.0)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server at {url} did not start")
+
+
+def _print(mode: str, result: Dict[str, float]) -> None:
+    print(
+        f"{mode:<11} {result['requests']:>9} {result['rps']:>9.0f} "
+        f"{result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f} {result['errors']:>7}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="drive an already running server instead of starting one per mode")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    args = parser.parse_args()
+
+    print(f"{'mode':<11} {'requests':>9} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    if args.url:
+        _print("server", asyncio.run(drive(args.url, args.concurrency, args.seconds, args.warmup)))
+        return
+
+    for mode, budget in MODES.items():
+        url = f"http://127.0.0.1:{args.port}"
+        server = _start_server(args.port, budget)
+        try:
+            _wait_ready(url)
+            _print(mode, asyncio.run(drive(url, args.concurrency, args.seconds, args.warmup)))
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
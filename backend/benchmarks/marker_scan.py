@@ -0,0 +1,72 @@
+"""
+Per-turn marker scan cost: shared marker table vs. per-stage rescans.
+
+"before" replays the `any(m in clean for m in <list>)` checks the analyzer,
+classifier and router used to run on every turn (including the lists that
+were scanned twice); "after" is one MarkerTable.scan().
+
+    python -m benchmarks.marker_scan [--messages 5000] [--repeat 5]
+"""
+
+import argparse
+import time
+
+from app.reasoning.markers import MARKER_TABLE, scan_markers
+from app.reasoning.utils import normalize
+
+from .corpus import generate_messages
+
+
+# Order and duplication of the old per-stage scans
+LEGACY_SCANS = [
+    # analyzer
+    "confusion", "insult", "trust", "bot",
+    # classifier (topic hint, then hard markers)
+    "careers", "existing", "project_hint", "human",
+    "careers", "project_strong", "existing", "project_word",
+    # router (new_project lane)
+    "company", "cost", "suggest", "tech",
+    "comparison", "mentions_next", "mentions_react", "trust_word", "cost",
+]
+
+
+def legacy_scan(clean: str) -> frozenset:
+    hits = set()
+    for group in LEGACY_SCANS:
+        if any(m in clean for m in MARKER_TABLE[group]):
+            hits.add(group)
+    return frozenset(hits)
+
+
+def _time(fn, messages, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for m in messages:
+            fn(m)
+        best = min(best, time.perf_counter() - start)
+    return best / len(messages)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    messages = [normalize(m) for m in generate_messages(args.messages)]
+
+    mismatches = sum(1 for m in messages if legacy_scan(m) != scan_markers(m))
+
+    before = _time(legacy_scan, messages, args.repeat)
+    after = _time(scan_markers, messages, args.repeat)
+
+    print(f"messages:          {len(messages)}")
+    print(f"flag mismatches:   {mismatches}")
+    print(f"before (per turn): {before * 1e6:8.2f} µs")
+    print(f"after  (per turn): {after * 1e6:8.2f} µs")
+    print(f"speedup:           {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
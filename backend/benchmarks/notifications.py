@@ -0,0 +1,117 @@
+"""
+Sales webhook delivery (app.notifications.WebhookDispatcher) against the
+local stub server (scripts/webhook_stub.py):
+
+    burst     N notifications in bursts; posts, connections and time vs. the
+              old one-AsyncClient-per-notification path
+    flaky     stub fails ~30% of posts with 503; every item must still arrive
+    outage    stub answers 500 until restarted healthy; items land in the
+              outbox and are delivered after the next start()
+
+    python -m benchmarks.notifications [--count 500] [--burst 50]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+import httpx
+
+from app.notifications import WebhookDispatcher
+from scripts.webhook_stub import StubState, serve
+
+
+async def _old_path(url: str, count: int) -> float:
+    # What main._post_sales_webhook did per notification
+    start = time.perf_counter()
+    for n in range(count):
+        async with httpx.AsyncClient(timeout=5) as client:
+            await client.post(url, json={"text": str({"n": n})})
+    return time.perf_counter() - start
+
+
+async def _submit_bursts(dispatcher: WebhookDispatcher, count: int, burst: int) -> None:
+    for n in range(count):
+        dispatcher.submit({"n": n, "reason": "escalate_human"})
+        if (n + 1) % burst == 0:
+            await asyncio.sleep(0.02)
+
+
+async def _wait_delivered(dispatcher: WebhookDispatcher, expected: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while dispatcher.stats()["delivered"] < expected and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+
+
+async def run(count: int, burst: int) -> None:
+    state = StubState(seed=1)
+    server = serve(state)
+    url = f"http://127.0.0.1:{server.server_address[1]}/hook"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        outbox = os.path.join(tmp, "outbox.jsonl")
+
+        old_seconds = await _old_path(url, count)
+        old = state.stats()
+        state.reset()
+
+        dispatcher = WebhookDispatcher(url, outbox, batch_window=0.05)
+        await dispatcher.start()
+        start = time.perf_counter()
+        await _submit_bursts(dispatcher, count, burst)
+        await _wait_delivered(dispatcher, count)
+        new_seconds = time.perf_counter() - start
+        await dispatcher.stop()
+        new = state.stats()
+        print(f"{'burst':<10}{'posts':>8}{'conns':>8}{'items':>8}{'seconds':>10}")
+        print(f"{'old':<10}{old['posts']:>8}{old['connections']:>8}{old['items_delivered']:>8}{old_seconds:>10.3f}")
+        print(f"{'queued':<10}{new['posts']:>8}{new['connections']:>8}{new['items_delivered']:>8}{new_seconds:>10.3f}")
+        assert new["items_delivered"] == count
+
+        state.reset()
+        state.fail_rate = 0.3
+        dispatcher = WebhookDispatcher(url, outbox, batch_window=0.02, max_batch=10, backoff_base=0.01, max_attempts=8)
+        await dispatcher.start()
+        await _submit_bursts(dispatcher, count, burst)
+        await _wait_delivered(dispatcher, count)
+        await dispatcher.stop()
+        stats = dispatcher.stats()
+        print(f"\nflaky (30% 503): delivered {state.stats()['items_delivered']}/{count}, "
+              f"posts {stats['posts']}, retries {stats['retries']}, spilled {stats['spilled']}")
+        assert state.stats()["items_delivered"] + stats["spilled"] == count
+
+        if os.path.exists(outbox):
+            os.remove(outbox)
+        state.reset()
+        state.fail_rate, state.status = 0.0, 500
+        dispatcher = WebhookDispatcher(url, outbox, batch_window=0.02, backoff_base=0.01, max_attempts=3)
+        await dispatcher.start()
+        await _submit_bursts(dispatcher, count, burst)
+        await dispatcher.stop()
+        with open(outbox, encoding="utf-8") as f:
+            spilled = sum(1 for _ in f)
+        state.reset()
+        state.status = None
+        dispatcher = WebhookDispatcher(url, outbox, batch_window=0.02)
+        await dispatcher.start()
+        await _wait_delivered(dispatcher, count)
+        await dispatcher.stop()
+        print(f"outage: {spilled} item(s) in outbox while down, "
+              f"{state.stats()['items_delivered']} delivered after restart, outbox left: {os.path.exists(outbox)}")
+        assert spilled == count and state.stats()["items_delivered"] == count
+
+    server.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--burst", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.count, args.burst))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+"""
+Replay benchmark for the ARE-3.5 pipeline (ReasoningEngine.process).
+
+Drives the engine with multi-turn conversations from synthetic scenario
+generators (careers, new_project, existing_system, insults, rejections,
+meta questions) and reports:
+
+    throughput       turns/s over the whole replay
+    latency          per-turn percentiles, overall and per scenario
+    allocations      tracemalloc pass: transient peak and retained bytes, and
+                     net allocated blocks per turn
+    session memory   retained bytes per live session after 1..N turns
+    outcomes         intent / state / action counts and a digest of every
+                     reply, so classifier or router changes show up too
+
+Results are written as JSON; --baseline compares a run against a previous
+one and exits 1 on a regression beyond --tolerance or on changed outcomes.
+Allocation, memory and outcome figures are deterministic; timings are only
+comparable against a baseline recorded on the same host
+(benchmarks/baselines/replay.json was recorded on a single-core CI box).
+
+    python -m benchmarks.replay [--conversations 2000] [--output replay.json]
+    python -m benchmarks.replay --baseline benchmarks/baselines/replay.json
+    python -m benchmarks.replay --record convs.jsonl      # save the generated conversations
+    python -m benchmarks.replay --replay convs.jsonl      # replay saved ones instead
+"""
+
+import argparse
+import gc
+import hashlib
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List, Sequence, Tuple
+
+from app.reasoning.engine import ReasoningEngine
+from app.reasoning.memory import SessionMemory
+
+FORMAT_VERSION = 1
+
+SCENARIOS: Dict[str, Dict] = {
+    "careers": {
+        "pages": ["/careers", "/", "/careers/backend-engineer"],
+        "messages": [
+            "hi, any job openings?", "are you hiring backend engineers", "is there an internship or intern position",
+            "I am looking for a career at ameotech", "how do I apply", "can I send my cv", "what roles are open",
+            "developer role in data team", "internshp for students", "opportunity for a junior dev",
+        ],
+    },
+    "new_project": {
+        "pages": ["/", "/services", "/ai", "/automation"],
+        "messages": [
+            "I want to build a new app for my startup", "we have an idea for a saas platform", "mvp prototype",
+            "how much would an mvp cost", "can you give me a ballpark estimate", "what do you suggest for the tech stack",
+            "we use react and next.js with typescript", "why not django instead of .net", "my tech stack is flutter",
+            "timeline is about 3 months", "tell me more about ameotech", "budget is around 20k",
+        ],
+    },
+    "existing_system": {
+        "pages": ["/services", "/", "/data"],
+        "messages": [
+            "our website is slow and crashing", "there are bugs in our existing system", "legacy refactor needed",
+            "we need maintenance and support for a legacy app", "fix the issue with our checkout", "upgrade our platform",
+            "the app is down every night", "performance problems on the dashboard", "modify my app",
+        ],
+    },
+    "insults": {
+        "pages": ["/", "/services"],
+        "messages": [
+            "this is a stupid useless bot", "you suck", "worst bot ever", "you are still dummy", "idiot",
+            "I want a new app", "our website is slow", "is this a scam",
+        ],
+    },
+    "rejections": {
+        "pages": ["/", "/services", "/careers"],
+        "messages": [
+            "no thanks", "not now", "skip", "leave it", "stop", "no, I don't want the estimator",
+            "I want to build a new app", "there are bugs in our existing system", "any job openings?",
+        ],
+    },
+    "meta": {
+        "pages": ["/", "/labs/pricing", "/services"],
+        "messages": [
+            "are you a bot", "are you chatgpt", "what do you mean", "can i trust you guys", "who are you",
+            "what kind of work do you do", "are you real", "explain again", "talk to someone real please",
+        ],
+    },
+}
+
+OPENERS = ["", "", "hi", "hello", "ok", "so", "quick question"]
+CLOSERS = ["", "", "thanks", "please", "asap"]
+
+
+def generate_conversations(count: int, seed: int = 17, max_turns: int = 10) -> List[Dict]:
+    """Conversations of 2..max_turns turns; ~80% of turns come from the scenario's own pool."""
+    rng = random.Random(seed)
+    names = list(SCENARIOS)
+    conversations = []
+    for n in range(count):
+        scenario = names[n % len(names)]
+        spec = SCENARIOS[scenario]
+        page = rng.choice(spec["pages"])
+        turns = []
+        for _ in range(rng.randint(2, max_turns)):
+            pool = spec if rng.random() < 0.8 else SCENARIOS[rng.choice(names)]
+            parts = [rng.choice(OPENERS), rng.choice(pool["messages"]), rng.choice(CLOSERS)]
+            turns.append({"message": " ".join(p for p in parts if p), "page": page})
+        conversations.append({"id": f"{scenario}-{n}", "scenario": scenario, "turns": turns})
+    return conversations
+
+
+def _percentiles(values: Sequence[float]) -> Dict[str, float]:
+    ordered = sorted(values)
+    if not ordered:
+        return {"p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0, "mean": 0.0}
+
+    def pick(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    return {
+        "p50": round(pick(0.50), 2),
+        "p90": round(pick(0.90), 2),
+        "p99": round(pick(0.99), 2),
+        "max": round(ordered[-1], 2),
+        "mean": round(sum(ordered) / len(ordered), 2),
+    }
+
+
+def replay(conversations: List[Dict]) -> Tuple[Dict, Dict]:
+    """Timed replay; returns (timing results, outcomes)."""
+    engine = ReasoningEngine()
+    latencies: Dict[str, List[float]] = {}
+    intents, states, actions = Counter(), Counter(), Counter()
+    digest = hashlib.sha256()
+    clock = time.perf_counter_ns
+    total_ns = 0
+
+    for conv in conversations:
+        session = SessionMemory(session_id=conv["id"])
+        timings = latencies.setdefault(conv["scenario"], [])
+        for turn in conv["turns"]:
+            start = clock()
+            result = engine.process(session=session, user_raw_message=turn["message"], page=turn["page"])
+            elapsed = clock() - start
+            total_ns += elapsed
+            timings.append(elapsed / 1_000)
+            intents[result.intent] += 1
+            states[session.state] += 1
+            actions[result.action] += 1
+            digest.update(json.dumps(
+                [result.intent, round(result.intent_confidence, 6), result.action, result.action_payload, result.bot_reply],
+                sort_keys=True,
+            ).encode("utf-8"))
+
+    all_latencies = [v for values in latencies.values() for v in values]
+    timing = {
+        "turns": len(all_latencies),
+        "throughput_turns_per_s": round(len(all_latencies) / (total_ns / 1e9), 1) if total_ns else 0.0,
+        "latency_us": _percentiles(all_latencies),
+        "by_scenario": {
+            scenario: {"turns": len(values), **_percentiles(values)} for scenario, values in sorted(latencies.items())
+        },
+    }
+    outcomes = {
+        "intents": dict(sorted(intents.items())),
+        "states": dict(sorted(states.items())),
+        "actions": dict(sorted(actions.items())),
+        "digest": digest.hexdigest(),
+    }
+    return timing, outcomes
+
+
+def allocations(conversations: List[Dict], max_turns: int) -> Dict:
+    """Per-turn tracemalloc figures over the first max_turns turns."""
+    engine = ReasoningEngine()
+    peaks, retained, blocks = [], [], []
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for conv in conversations:
+            session = SessionMemory(session_id=conv["id"])
+            for turn in conv["turns"]:
+                if len(peaks) >= max_turns:
+                    break
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                blocks_before = sys.getallocatedblocks()
+                engine.process(session=session, user_raw_message=turn["message"], page=turn["page"])
+                current, peak = tracemalloc.get_traced_memory()
+                peaks.append(peak - before)
+                retained.append(current - before)
+                blocks.append(sys.getallocatedblocks() - blocks_before)
+    finally:
+        tracemalloc.stop()
+    return {
+        "turns": len(peaks),
+        "peak_bytes_per_turn": _percentiles(peaks),
+        "retained_bytes_per_turn_mean": round(sum(retained) / len(retained), 1) if retained else 0.0,
+        "net_blocks_per_turn_mean": round(sum(blocks) / len(blocks), 2) if blocks else 0.0,
+    }
+
+
+def session_memory(sessions: int, turns: int, seed: int = 23) -> Dict:
+    """Retained bytes per live session after k turns (all sessions advance one turn at a time)."""
+    conversations = generate_conversations(sessions, seed=seed, max_turns=turns)
+    engine = ReasoningEngine()
+    checkpoints = sorted({1, 2, 5, 10, turns} & set(range(1, turns + 1)))
+    by_turn: Dict[str, float] = {}
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        live = [SessionMemory(session_id=conv["id"]) for conv in conversations]
+        for k in range(turns):
+            for session, conv in zip(live, conversations):
+                turn = conv["turns"][k % len(conv["turns"])]
+                engine.process(session=session, user_raw_message=turn["message"], page=turn["page"])
+            if k + 1 in checkpoints:
+                gc.collect()
+                by_turn[str(k + 1)] = round((tracemalloc.get_traced_memory()[0] - base - live.__sizeof__()) / sessions, 1)
+    finally:
+        tracemalloc.stop()
+
+    first, last = by_turn[str(checkpoints[0])], by_turn[str(checkpoints[-1])]
+    return {
+        "sessions": sessions,
+        "bytes_per_session_by_turn": by_turn,
+        "growth_bytes_per_turn": round((last - first) / max(checkpoints[-1] - checkpoints[0], 1), 2),
+    }
+
+
+# (path in results, higher is better)
+TRACKED = [
+    (("throughput_turns_per_s",), True),
+    (("latency_us", "p50"), False),
+    (("latency_us", "p99"), False),
+    (("allocations", "peak_bytes_per_turn", "mean"), False),
+    (("allocations", "retained_bytes_per_turn_mean"), False),
+    (("session_memory", "growth_bytes_per_turn"), False),
+]
+
+
+def _get(results: Dict, path: Sequence[str]):
+    for key in path:
+        results = results[key]
+    return results
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Human-readable regressions (empty if none)."""
+    problems = []
+    if results["outcomes"] != baseline["outcomes"]:
+        changed = [k for k in results["outcomes"] if results["outcomes"][k] != baseline["outcomes"].get(k)]
+        problems.append(f"outcomes changed: {', '.join(changed)}")
+    for path, higher_is_better in TRACKED:
+        new, old = _get(results, path), _get(baseline, path)
+        name = ".".join(path)
+        if higher_is_better and new < old * (1 - tolerance):
+            problems.append(f"{name}: {old} -> {new}")
+        # small absolute floor so near-zero values (e.g. growth) don't flap
+        if not higher_is_better and new > old * (1 + tolerance) + 16:
+            problems.append(f"{name}: {old} -> {new}")
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--conversations", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=17)
+    parser.add_argument("--alloc-turns", type=int, default=2_000, help="turns traced with tracemalloc")
+    parser.add_argument("--sessions", type=int, default=1_000, help="live sessions for the memory growth pass")
+    parser.add_argument("--session-turns", type=int, default=20)
+    parser.add_argument("--record", help="write the generated conversations as JSONL and exit")
+    parser.add_argument("--replay", help="replay conversations from a JSONL file instead of generating")
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--baseline", help="compare against a previous results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args()
+
+    if args.replay:
+        with open(args.replay, encoding="utf-8") as f:
+            conversations = [json.loads(line) for line in f if line.strip()]
+    else:
+        conversations = generate_conversations(args.conversations, seed=args.seed)
+    if args.record:
+        with open(args.record, "w", encoding="utf-8") as f:
+            for conv in conversations:
+                f.write(json.dumps(conv, ensure_ascii=False) + "\n")
+        print(f"wrote {len(conversations)} conversations to {args.record}")
+        return
+
+    replay(conversations[: max(1, len(conversations) // 10)])  # warm-up
+    timing, outcomes = replay(conversations)
+    results = {
+        "format": FORMAT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "config": {
+            "conversations": len(conversations),
+            "source": args.replay or f"generated(seed={args.seed})",
+            "alloc_turns": args.alloc_turns,
+            "sessions": args.sessions,
+            "session_turns": args.session_turns,
+        },
+        **timing,
+        "allocations": allocations(conversations, args.alloc_turns),
+        "session_memory": session_memory(args.sessions, args.session_turns),
+        "outcomes": outcomes,
+    }
+
+    print(json.dumps({k: v for k, v in results.items() if k != "outcomes"}, indent=2))
+    print(f"outcomes digest {outcomes['digest'][:16]}  actions {outcomes['actions']}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        problems = compare(results, baseline, args.tolerance)
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        if problems:
+            sys.exit(1)
+        print(f"no regressions vs {args.baseline} (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
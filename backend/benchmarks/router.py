@@ -0,0 +1,139 @@
+"""
+Compiled routing tables (reasoning.router) vs. the frozen if/else router
+(benchmarks.legacy_router):
+
+    check   same reply, payload and session effects for random analysis
+            flags / session states (covers every rule of every state)
+    timing  cost per routed turn on real turns: corpus conversations run
+            through analyzer / classifier / state machine, captured just
+            before routing
+
+    python -m benchmarks.router [--cases 50000] [--conversations 2000] [--describe]
+"""
+
+import argparse
+import json
+import random
+import time
+from types import SimpleNamespace
+from typing import Callable, List, Tuple
+
+from app.reasoning.analyzer import analyze_message
+from app.reasoning.classifier import detect_intent
+from app.reasoning.markers import MARKER_TABLE
+from app.reasoning.memory import SessionMemory
+from app.reasoning.router import ROUTER, route_message
+from app.reasoning.safety import sanitize_input
+from app.reasoning.state_machine import StateMachine
+
+from .corpus import generate_messages
+from .legacy_router import route_message as legacy_route_message
+
+STATES = [
+    "contact_human", "handoff_ready", "careers", "new_project", "existing_system",
+    "pricing_engine", "data_platform", "unknown", "greeting",
+]
+MESSAGE_TYPES = ["normal", "confused", "meta", "insult", "trust"]
+TOPIC_HINTS = [None, "project_like", "existing_like", "careers_like"]
+STAGES = ["intro", "idea", "shaping"]
+LAST_ACTIONS = [None, "show_message", "show_options", "open_lab_tool"]
+
+
+def generate_cases(rng: random.Random, count: int) -> List[Tuple[str, dict, dict]]:
+    groups = list(MARKER_TABLE)
+    cases = []
+    for _ in range(count):
+        analysis = {
+            "clean": "",
+            "message_type": rng.choice(MESSAGE_TYPES),
+            "is_rejection": rng.random() < 0.2,
+            "topic_hint": rng.choice(TOPIC_HINTS),
+            "markers": frozenset(g for g in groups if rng.random() < 0.15),
+        }
+        session = {
+            "new_project_stage": rng.choice(STAGES),
+            "last_action": rng.choice(LAST_ACTIONS),
+            "goal": rng.choice([None, "new_project"]),
+            "clarifier_loops": rng.randrange(-1, 5),
+        }
+        cases.append((rng.choice(STATES), analysis, session))
+    return cases
+
+
+def capture_turns(conversations: int, seed: int = 7) -> List[Tuple[str, dict, dict]]:
+    rng = random.Random(seed)
+    messages = generate_messages(conversations * 4, seed=seed)
+    pages = ["/", "/services", "/careers", "/labs/pricing", "/data"]
+    sm = StateMachine()
+    cases = []
+    for n in range(conversations):
+        session = SessionMemory(session_id=f"bench-{n}")
+        for _ in range(rng.randint(1, 8)):
+            message = sanitize_input(rng.choice(messages))
+            analysis = analyze_message(message)
+            intent, _, _ = detect_intent(message=message, analysis=analysis, session=session, page=rng.choice(pages))
+            session.update_from_analysis(analysis)
+            session.state = sm.transition(current=session.state, intent=intent, analysis=analysis, session=session)
+            snapshot = {
+                "new_project_stage": session.new_project_stage,
+                "last_action": session.last_action,
+                "goal": session.goal,
+                "clarifier_loops": session.clarifier_loops,
+            }
+            cases.append((session.state, analysis, snapshot))
+            session.last_action = route_message(session.state, intent, 0.0, session, analysis).action
+    return cases
+
+
+def _turns(cases) -> List[Tuple[str, SimpleNamespace, dict]]:
+    return [(state, SimpleNamespace(**session), analysis) for state, analysis, session in cases]
+
+
+def check(cases) -> None:
+    for (state, new_session, analysis), (_, old_session, _) in zip(_turns(cases), _turns(cases)):
+        got = route_message(state, "", 0.0, new_session, analysis)
+        expected = legacy_route_message(state, "", 0.0, old_session, analysis)
+        assert got == expected, (state, analysis, vars(old_session))
+        assert vars(new_session) == vars(old_session), (state, analysis)
+
+
+def _turns_per_sec(route: Callable, cases, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        turns = _turns(cases)
+        start = time.perf_counter()
+        for state, session, analysis in turns:
+            route(state, "", 0.0, session, analysis)
+        best = min(best, time.perf_counter() - start)
+    return len(cases) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cases", type=int, default=50_000)
+    parser.add_argument("--conversations", type=int, default=2_000)
+    parser.add_argument("--describe", action="store_true", help="print the compiled tables and exit")
+    args = parser.parse_args()
+
+    if args.describe:
+        print(json.dumps(ROUTER.describe(), indent=2, ensure_ascii=False))
+        return
+
+    cases = generate_cases(random.Random(5), args.cases)
+    check(cases)
+    turns = capture_turns(args.conversations)
+    check(turns)
+    print(f"{len(cases)} random + {len(turns)} captured cases: compiled router matches the legacy router")
+
+    for name, table in ROUTER.tables.items():
+        print(f"  {name:<16}{len(table.rules):>3} rules {len(table.predicates):>3} predicates {len(table.table):>6} entries")
+
+    legacy = _turns_per_sec(legacy_route_message, turns)
+    compiled = _turns_per_sec(route_message, turns)
+    print(f"{'':16}{'turns/s':>12}  ({len(turns)} captured turns, best of 5)")
+    print(f"{'legacy':<16}{legacy:>12.0f}")
+    print(f"{'compiled':<16}{compiled:>12.0f}  ({compiled / legacy:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
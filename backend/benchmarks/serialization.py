@@ -0,0 +1,118 @@
+"""
+Response serialization cost for /reason/chat-route and /reason/lab-next.
+
+    before  handler returns a dict; FastAPI runs jsonable_encoder over it and
+            JSONResponse json.dumps the result (what `payload: dict` routes did)
+    after   handler returns the typed model serialized by pydantic-core
+            (ReasonChatResponse.model_construct / ReasonLabNextResponse,
+            then model_dump_json into a Response)
+    parse   request body as `dict` vs. ReasonChatRequest
+
+Responses are real: chat-route ones come from corpus conversations run
+through the reasoning engine, lab-next ones from the lab-next handler.
+
+    python -m benchmarks.serialization [--messages 2000] [--rounds 5]
+"""
+
+import argparse
+import json
+import time
+from typing import Callable, List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.main import _json, _reason_lab_next
+from app.reasoning.engine import ReasoningEngine
+from app.reasoning.memory import SessionMemory
+from app.schemas import ReasonChatRequest, ReasonChatResponse, ReasonLabNextRequest, ReasonLabNextResponse
+
+from .corpus import generate_messages
+
+PAGES = ["/", "/services", "/careers", "/labs/pricing", "/data"]
+
+LAB_REQUESTS = [
+    {"lab_tool": "audit", "lab_result": {"scores": {"product": 70, "engineering": 40, "data_ai": 30}}},
+    {"lab_tool": "audit", "lab_result": {"scores": {"product": 80, "engineering": 75, "data_ai": 70}}},
+    {"lab_tool": "build_estimator", "lab_result": {}},
+    {"lab_tool": "architecture_blueprint", "lab_result": {}},
+    {"lab_tool": "ai_readiness", "lab_result": {"scores": {"score": 40}}},
+    {"lab_tool": "ai_readiness", "lab_result": {"scores": {"score": 68}}},
+    {"lab_tool": "ai_readiness", "lab_result": {"scores": {"score": 90}}},
+    {"lab": "unknown"},
+]
+
+
+def _chat_results(count: int) -> List:
+    engine = ReasoningEngine()
+    sessions = [SessionMemory(session_id=f"bench-{n}") for n in range(count // 6 + 1)]
+    return [
+        engine.process(session=sessions[i // 6], user_raw_message=message, page=PAGES[i % len(PAGES)])
+        for i, message in enumerate(generate_messages(count))
+    ]
+
+
+def _best_us(fn: Callable, items: List, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for item in items:
+            fn(item)
+        best = min(best, time.perf_counter() - start)
+    return best / len(items) * 1e6
+
+
+def _before(content: dict) -> bytes:
+    return JSONResponse(content=jsonable_encoder(content)).body
+
+
+def _chat_dict(r) -> dict:
+    return {
+        "session_id": r.session_id,
+        "intent": r.intent,
+        "intent_confidence": r.intent_confidence,
+        "action": r.action,
+        "action_payload": r.action_payload,
+        "bot_reply": r.bot_reply,
+        "meta": r.meta,
+    }
+
+
+def _chat_after(r) -> bytes:
+    return _json(ReasonChatResponse.model_construct(**_chat_dict(r))).body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=2_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    results = _chat_results(args.messages)
+    lab_models = [ReasonLabNextRequest(**body) for body in LAB_REQUESTS] * (args.messages // len(LAB_REQUESTS))
+    lab_dicts = [json.loads(_reason_lab_next(m).body) for m in lab_models]
+
+    # Same JSON either way
+    for r in results:
+        assert json.loads(_before(_chat_dict(r))) == json.loads(_chat_after(r))
+
+    rows = [
+        ("chat-route", _best_us(lambda r: _before(_chat_dict(r)), results, args.rounds),
+         _best_us(_chat_after, results, args.rounds)),
+        # lab-next "after" includes validating next_actions into NextAction models
+        ("lab-next", _best_us(_before, lab_dicts, args.rounds),
+         _best_us(lambda d: _json(ReasonLabNextResponse(**d)).body, lab_dicts, args.rounds)),
+    ]
+    any_dict = TypeAdapter(dict)
+    bodies = [{"session_id": "s", "message": m, "page": "/"} for m in generate_messages(args.messages)]
+    rows.append(("parse request", _best_us(any_dict.validate_python, bodies, args.rounds),
+                 _best_us(ReasonChatRequest.model_validate, bodies, args.rounds)))
+
+    print(f"{'us per response':<16}{'before':>10}{'after':>10}{'speedup':>10}")
+    for name, before, after in rows:
+        print(f"{name:<16}{before:>10.2f}{after:>10.2f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
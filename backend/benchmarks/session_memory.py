@@ -0,0 +1,65 @@
+"""
+Bytes per live session for reasoning (SessionMemory) and chat
+(chat_engine.SessionState) sessions, measured with tracemalloc.
+
+    python -m benchmarks.session_memory [--sizes 10000 100000] [--messages 20]
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from app.chat_engine import Message, SessionState
+from app.reasoning.memory import SessionMemory
+
+
+def _reason_session(i: int) -> SessionMemory:
+    s = SessionMemory(session_id=f"sess-{i:08d}")
+    s.update_from_analysis({"message_type": "normal", "tone": "neutral"})
+    s.last_intent = "new_project"
+    s.last_confidence = 0.85
+    s.state = "new_project"
+    s.mode = "new_project"
+    s.goal = "new_project"
+    s.last_action = "show_message"
+    return s
+
+
+def _chat_session(i: int, messages: int) -> SessionState:
+    s = SessionState(id=f"sess-{i:08d}")
+    s.domain = "pricing"
+    s.stage = "budget"
+    for n in range(messages):
+        role = "user" if n % 2 == 0 else "assistant"
+        s.messages.append(Message(role=role, content=f"message {n} for session {i}"))
+    return s
+
+
+def _bytes_per_session(factory, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Do not count the holding list itself
+    per_list = (after - before - sessions.__sizeof__()) / count
+    del sessions
+    return per_list
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--messages", type=int, default=20, help="chat messages per session")
+    args = parser.parse_args()
+
+    print(f"{'sessions':>10}  {'SessionMemory B':>16}  {'SessionState B':>15}")
+    for n in args.sizes:
+        reason = _bytes_per_session(_reason_session, n)
+        chat = _bytes_per_session(lambda i: _chat_session(i, args.messages), n)
+        print(f"{n:>10}  {reason:>16.0f}  {chat:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
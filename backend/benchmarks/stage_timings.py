@@ -0,0 +1,94 @@
+"""
+Overhead of per-stage timing in ReasoningEngine.process.
+
+    instrumentation   cost of the timing code itself, measured in isolation:
+                      unsampled requests pay should_sample() plus eight
+                      `marks is not None` checks, sampled ones also nine
+                      perf_counter_ns() calls and record()
+    end to end        the same corpus conversations with sampling off, 1-in-N
+                      and every request, interleaved over several rounds
+                      (best round per mode); on a noisy host the difference
+                      is within run-to-run variation
+
+Also prints the per-stage breakdown collected by the every-request run.
+
+    python -m benchmarks.stage_timings [--messages 5000] [--rounds 5] [--sample-every 16]
+"""
+
+import argparse
+import time
+import timeit
+from typing import Dict, List
+
+from app.reasoning.engine import ReasoningEngine
+from app.reasoning.memory import SessionMemory
+from app.reasoning.timing import STAGES, StageTimings
+
+from .corpus import generate_messages
+
+PAGES = ["/", "/services", "/careers", "/labs/pricing", "/data"]
+
+
+def _run(engine: ReasoningEngine, messages: List[str]) -> float:
+    sessions = [SessionMemory(session_id=f"bench-{n}") for n in range(len(messages) // 6 + 1)]
+    start = time.perf_counter()
+    for i, message in enumerate(messages):
+        engine.process(session=sessions[i // 6], user_raw_message=message, page=PAGES[i % len(PAGES)])
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=5_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--sample-every", type=int, default=16)
+    args = parser.parse_args()
+
+    messages = generate_messages(args.messages)
+    every = StageTimings(sample_every=1)
+    modes = {
+        "off": ReasoningEngine(StageTimings(sample_every=0)),
+        f"1 in {args.sample_every}": ReasoningEngine(StageTimings(sample_every=args.sample_every)),
+        "every request": ReasoningEngine(every),
+    }
+    _run(modes["off"], messages)  # warm-up
+
+    best: Dict[str, float] = {name: float("inf") for name in modes}
+    for _ in range(args.rounds):
+        for name, engine in modes.items():
+            best[name] = min(best[name], _run(engine, messages))
+
+    base = best["off"]
+    per_msg_us = base / len(messages) * 1e6
+    probe = StageTimings(sample_every=args.sample_every)
+    marks = [0] * (len(STAGES) + 1)
+    n = 200_000
+    sample_us = timeit.timeit(probe.should_sample, number=n) / n * 1e6
+    checks_us = timeit.timeit("marks is not None", globals={"marks": None}, number=n * 8) / n * 1e6
+    clock_us = timeit.timeit(time.perf_counter_ns, number=n * 9) / n * 1e6
+    record_us = timeit.timeit(lambda: probe.record(marks), number=n // 10) / (n // 10) * 1e6
+    unsampled = sample_us + checks_us
+    sampled = unsampled + clock_us + record_us
+    amortized = unsampled + (clock_us + record_us) / max(args.sample_every, 1)
+    print("instrumentation cost per message:")
+    print(f"  unsampled {unsampled:.3f} us, sampled {sampled:.3f} us, "
+          f"1 in {args.sample_every} amortized {amortized:.3f} us "
+          f"= {amortized / per_msg_us * 100:.2f}% of {per_msg_us:.1f} us/msg")
+
+    print(f"\n{'end to end':<16}{'us/msg':>10}{'vs off':>10}")
+    for name, seconds in best.items():
+        print(f"{name:<16}{seconds / len(messages) * 1e6:>10.1f}{(seconds / base - 1) * 100:>9.2f}%")
+
+    print("\nstage means (every request):")
+    sums = {}
+    for line in every.prometheus().splitlines():
+        if line.startswith("reasoning_stage_duration_seconds_sum"):
+            stage = line.split('"')[1]
+            sums[stage] = float(line.rsplit(" ", 1)[1])
+    count = args.messages * args.rounds
+    for stage in STAGES:
+        print(f"  {stage:<22}{sums[stage] / count * 1e6:>8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Weight sweep over synthetic submissions: score once with the batch scorers,
+then evaluate every grid point with app.labs.sweep.
+
+The default weights are always part of the grid; their distributions are
+checked against run_architecture_blueprint_batch / run_ai_readiness_batch.
+
+    python -m benchmarks.sweep [--submissions 100000] [--points 1000]
+"""
+
+import argparse
+import random
+import time
+from collections import Counter
+
+import numpy as np
+
+from app.labs.ai_readiness_engine import run_ai_readiness_batch, score_ai_readiness_batch
+from app.labs.architecture_blueprint_engine import run_architecture_blueprint_batch, score_architecture_blueprint_batch
+from app.labs.scoring_model import SCORING_MODEL
+from app.labs.sweep import NEXT_STEPS, TIERS, sweep_ai_readiness, sweep_blueprint_tiers
+
+from .labs_batch import blueprint_payloads, readiness_payloads
+
+
+def random_grid(rng: np.random.Generator, points: int, default) -> np.ndarray:
+    weights = rng.dirichlet(np.ones(4), size=points)
+    weights[0] = default
+    return weights
+
+
+def _next_step(result: dict) -> str:
+    if result["scores"]["data"] < 60 or result["scores"]["workflows"] < 60 or result["scores"]["org"] < 60:
+        return "blocked"
+    return "ready" if result["next_actions"][0]["type"] == "open_lab_tool" else "mixed"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--submissions", type=int, default=100_000)
+    parser.add_argument("--points", type=int, default=1_000)
+    parser.add_argument("--check", type=int, default=5_000, help="submissions checked against run_*_batch")
+    args = parser.parse_args()
+
+    rng = random.Random(31)
+    grid_rng = np.random.default_rng(31)
+    model = SCORING_MODEL.current
+
+    blueprints = blueprint_payloads(rng, args.submissions)
+    forms = readiness_payloads(rng, args.submissions)
+
+    start = time.perf_counter()
+    blueprint_columns = score_architecture_blueprint_batch(blueprints, model)
+    readiness_columns = score_ai_readiness_batch(forms, model)
+    score_s = time.perf_counter() - start
+
+    blueprint_grid = random_grid(grid_rng, args.points, model.overall)
+    readiness_grid = random_grid(grid_rng, args.points, model.readiness)
+
+    start = time.perf_counter()
+    tiers = sweep_blueprint_tiers(blueprint_columns, blueprint_grid, model.tier_cutoffs)
+    tiers_s = time.perf_counter() - start
+    start = time.perf_counter()
+    readiness = sweep_ai_readiness(readiness_columns, readiness_grid)
+    readiness_s = time.perf_counter() - start
+
+    print(f"{args.submissions} submissions x {args.points} weight settings")
+    print(f"score columns (both engines)   {score_s * 1e3:9.1f} ms")
+    print(f"blueprint tier sweep           {tiers_s * 1e3:9.1f} ms")
+    print(f"ai readiness sweep             {readiness_s * 1e3:9.1f} ms")
+
+    # Default grid point vs. the production code path, on a prefix of the submissions
+    n = min(args.check, args.submissions)
+    head = {name: column[:n] for name, column in blueprint_columns.items()}
+    expected = Counter(r["overview"]["tier"] for r in run_architecture_blueprint_batch(blueprints[:n], model))
+    got = sweep_blueprint_tiers(head, blueprint_grid[:1], model.tier_cutoffs)["tiers"][0]
+    assert dict(zip(TIERS, got.tolist())) == {t: expected.get(t, 0) for t in TIERS}, (got, expected)
+
+    head = {name: column[:n] for name, column in readiness_columns.items()}
+    results = run_ai_readiness_batch(forms[:n], model)
+    expected = Counter(_next_step(r) for r in results)
+    got = sweep_ai_readiness(head, readiness_grid[:1])
+    assert dict(zip(NEXT_STEPS, got["next_steps"][0].tolist())) == {s: expected.get(s, 0) for s in NEXT_STEPS}
+    assert got["mean"][0] == sum(r["scores"]["score"] for r in results) / n
+    print(f"default weights match run_*_batch on {n} submissions")
+
+    best = int(np.argmax(tiers["tiers"][:, 3]))
+    print(f"most tier-D outcomes at weights {np.round(blueprint_grid[best], 3).tolist()}: "
+          f"{dict(zip(TIERS, tiers['tiers'][best].tolist()))}")
+
+
+if __name__ == "__main__":
+    main()
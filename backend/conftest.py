@@ -0,0 +1,6 @@
+# Lets `pytest` import the `app` and `benchmarks` packages from any working
+# directory (repo root or backend/), not only via `python -m pytest` here.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
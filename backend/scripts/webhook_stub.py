@@ -0,0 +1,143 @@
+"""
+Local stand-in for the sales webhook (Slack-style incoming webhook).
+
+Accepts JSON POSTs on any path and counts posts, items (the dispatcher's
+"count" field, 1 for single payloads) and distinct client connections, so
+pooling and coalescing can be checked. Failures can be injected:
+
+    --fail-rate 0.3     answer 503 to ~30% of posts
+    --status 500        answer every post with this status
+    --retry-after 1     add Retry-After to injected failures
+    --delay-ms 50       wait before answering
+
+GET /stats returns the counters; POST /reset clears them.
+
+    python scripts/webhook_stub.py [--port 8099] [--fail-rate 0.0]
+    SALES_WEBHOOK_URL=http://127.0.0.1:8099/hook uvicorn app.main:app
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+
+class StubState:
+    def __init__(self, fail_rate: float = 0.0, status: Optional[int] = None,
+                 retry_after: Optional[int] = None, delay_ms: float = 0.0, seed: int = 0) -> None:
+        self.fail_rate = fail_rate
+        self.status = status
+        self.retry_after = retry_after
+        self.delay_ms = delay_ms
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.posts = 0
+            self.failed = 0
+            self.items = 0
+            self.connections = set()
+            self.bodies: List[Dict[str, Any]] = []
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "posts": self.posts,
+                "failed": self.failed,
+                "items_delivered": self.items,
+                "connections": len(self.connections),
+            }
+
+
+def make_handler(state: StubState):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse is visible
+
+        def _reply(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self) -> None:
+            if self.path == "/stats":
+                self._reply(200, state.stats())
+            else:
+                self._reply(404, {"detail": "not found"})
+
+        def do_POST(self) -> None:
+            raw = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            if self.path == "/reset":
+                state.reset()
+                self._reply(200, {"ok": True})
+                return
+            if state.delay_ms:
+                time.sleep(state.delay_ms / 1000)
+            try:
+                body = json.loads(raw or b"{}")
+            except json.JSONDecodeError:
+                self._reply(400, {"detail": "invalid json"})
+                return
+            with state._lock:
+                state.connections.add(self.client_address)
+                state.posts += 1
+                status = state.status
+                if status is None and state._rng.random() < state.fail_rate:
+                    status = 503
+                if status is not None and status >= 300:
+                    state.failed += 1
+                else:
+                    state.items += int(body.get("count", 1)) if isinstance(body, dict) else 1
+                    state.bodies.append(body)
+            if status is not None and status >= 300:
+                headers = {"Retry-After": str(state.retry_after)} if state.retry_after is not None else None
+                self._reply(status, {"ok": False}, headers)
+            else:
+                self._reply(200, {"ok": True})
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return Handler
+
+
+def serve(state: StubState, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """Start in a daemon thread; the bound port is server.server_address[1]."""
+    server = ThreadingHTTPServer((host, port), make_handler(state))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--status", type=int)
+    parser.add_argument("--retry-after", type=int)
+    parser.add_argument("--delay-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    state = StubState(args.fail_rate, args.status, args.retry_after, args.delay_ms)
+    server = serve(state, args.host, args.port)
+    print(f"webhook stub on http://{args.host}:{server.server_address[1]}/hook (GET /stats)")
+    try:
+        while True:
+            time.sleep(5)
+            print(state.stats())
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
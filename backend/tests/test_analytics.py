@@ -0,0 +1,31 @@
+from app.analytics import AnalyticsStore
+
+HOUR = 3600 * 480000
+
+
+def _turn(session_id, ts=HOUR, action="show_message", lab_tool=None):
+    return ("turn", ts, (session_id, "greeting", "new_project", 0.9, action, lab_tool))
+
+
+def _lab_run(session_id, ts=HOUR + 60, tool="audit"):
+    return ("lab_run", ts, (tool, session_id, {"scores": {"load": 10}}))
+
+
+def test_lab_run_without_chat_is_not_a_funnel_stage(tmp_path):
+    store = AnalyticsStore(str(tmp_path / "analytics.db"))
+    store.write([_lab_run("no-chat"), _lab_run(None)])
+    store.write([_turn("chat"), _lab_run("chat")])
+    store.write([_lab_run("chat", ts=HOUR + 120), _lab_run("no-chat", ts=HOUR + 120)])
+
+    funnel = store.funnel(since=HOUR, until=HOUR + 3600)
+    assert funnel["totals"]["chat_started"] == 1
+    assert funnel["totals"]["lab_run"] == 1
+    assert funnel["totals"]["lab_runs"] == 5
+    assert funnel["conversion"]["lab_run"] <= 1.0
+
+
+def test_lab_run_counts_when_chat_starts_in_the_same_batch(tmp_path):
+    store = AnalyticsStore(str(tmp_path / "analytics.db"))
+    store.write([_lab_run("s", ts=HOUR + 30), _turn("s", ts=HOUR + 10)])
+
+    assert store.funnel(since=HOUR, until=HOUR + 3600)["totals"]["lab_run"] == 1
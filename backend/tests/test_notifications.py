@@ -0,0 +1,67 @@
+import asyncio
+import json
+
+from app.notifications import WebhookDispatcher
+
+
+def _dispatcher(tmp_path):
+    return WebhookDispatcher(
+        "http://127.0.0.1:9/hook",
+        outbox_path=str(tmp_path / "outbox.jsonl"),
+        batch_window=0.01,
+        max_attempts=1,
+    )
+
+
+def _outbox(tmp_path):
+    path = tmp_path / "outbox.jsonl"
+    return [json.loads(line) for line in path.read_text().splitlines()] if path.exists() else []
+
+
+def test_worker_survives_unexpected_errors_and_spills_the_batch(tmp_path):
+    async def scenario():
+        dispatcher = _dispatcher(tmp_path)
+        await dispatcher.start()
+
+        async def broken_post(*args, **kwargs):
+            raise ValueError("boom")
+
+        dispatcher._client.post = broken_post
+        dispatcher.submit({"n": 1})
+        await asyncio.sleep(0.1)
+        assert dispatcher.running
+        dispatcher.submit({"n": 2})
+        await asyncio.sleep(0.1)
+        stats = dispatcher.stats()
+        await dispatcher.stop()
+        return stats
+
+    stats = asyncio.run(scenario())
+    assert stats["worker_errors"] == 2
+    records = _outbox(tmp_path)
+    assert [r["payload"] for r in records] == [{"n": 1}, {"n": 2}]
+    assert all(r["reason"] == "ValueError: boom" and not r.get("dead_letter") for r in records)
+
+
+def test_stop_spills_the_queue_and_closes_the_client_after_the_worker_died(tmp_path):
+    async def scenario():
+        dispatcher = _dispatcher(tmp_path)
+        await dispatcher.start()
+
+        async def crashed():
+            raise RuntimeError("worker crashed")
+
+        # Swap the worker for one that has died with an exception
+        dispatcher._task.cancel()
+        dispatcher._task = asyncio.create_task(crashed())
+        await asyncio.sleep(0.01)
+        assert not dispatcher.running
+        dispatcher.submit({"n": 3})  # not running: goes to the outbox, not the dead queue
+        dispatcher._queue.put_nowait({"n": 4})
+        client = dispatcher._client
+        await dispatcher.stop()
+        return client
+
+    client = asyncio.run(scenario())
+    assert client.is_closed
+    assert sorted(r["payload"]["n"] for r in _outbox(tmp_path)) == [3, 4]
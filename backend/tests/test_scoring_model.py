@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from app.labs.scoring_model import ScoringModel, ScoringModelStore
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"blueprint": "x"},
+        {"blueprint": ["load"]},
+        {"ai_readiness": 3},
+        {"blueprint": {"load": "heavy"}},
+        {"ai_readiness": {"weights": [0.3, 0.7]}},
+    ],
+)
+def test_from_dict_rejects_non_object_sections(config):
+    with pytest.raises(ValueError):
+        ScoringModel.from_dict(config)
+
+
+def test_reload_keeps_old_model_when_a_section_is_not_an_object(tmp_path):
+    path = tmp_path / "labs_scoring.json"
+    path.write_text(json.dumps({"blueprint": {"tier_cutoffs": [30, 50, 70]}}))
+    store = ScoringModelStore(str(path))
+    active = store.current
+
+    path.write_text(json.dumps({"blueprint": "x"}))
+    with pytest.raises(ValueError):
+        store.reload()
+    assert store.current is active
+    assert store.current.tier_cutoffs == (30, 50, 70)
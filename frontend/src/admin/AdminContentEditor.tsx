@@ -5,6 +5,7 @@ const API_BASE = import.meta.env.VITE_API_BASE ?? (import.meta.env.DEV ? "${impo
 import React, { useEffect, useState, FormEvent } from 'react';
 import { useLocation, useNavigate, useParams } from 'react-router-dom';
 import { useAdminRole } from './AdminRoleContext';
+import { adminAuthHeaders } from '../api/adminAuth';
 
 const API_BASE = import.meta.env.VITE_API_BASE ?? '${import.meta.env.VITE_API_BASE}/?';
 
@@ -278,7 +279,7 @@ This is for job title: "${title || '[[ADD JOB TITLE HERE]]'}".`;
       try {
         const res = await fetch(`${API_BASE}/admin/content/${id}`, {
           headers: {
-            'x-role': role,
+            ...adminAuthHeaders(),
           },
         });
         if (!res.ok) throw new Error('Failed to load content item');
@@ -340,7 +341,7 @@ This is for job title: "${title || '[[ADD JOB TITLE HERE]]'}".`;
         method,
         headers: {
           'Content-Type': 'application/json',
-          'x-role': role,
+          ...adminAuthHeaders(),
         },
         body: JSON.stringify(payload),
       });
@@ -372,7 +373,7 @@ This is for job title: "${title || '[[ADD JOB TITLE HERE]]'}".`;
       const res = await fetch(`${API_BASE}/admin/content/${targetId}/publish`, {
         method: 'POST',
         headers: {
-          'x-role': role,
+          ...adminAuthHeaders(),
         },
       });
       if (!res.ok) {
@@ -400,7 +401,7 @@ This is for job title: "${title || '[[ADD JOB TITLE HERE]]'}".`;
       const res = await fetch(`${API_BASE}/admin/content/${targetId}/archive`, {
         method: 'POST',
         headers: {
-          'x-role': role,
+          ...adminAuthHeaders(),
         },
       });
       if (!res.ok) {
@@ -5,6 +5,7 @@ const API_BASE = import.meta.env.VITE_API_BASE ?? (import.meta.env.DEV ? "${impo
 import React, { useEffect, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { useAdminRole } from './AdminRoleContext';
+import { adminAuthHeaders } from '../api/adminAuth';
 
 const API_BASE = import.meta.env.VITE_API_BASE ?? '${import.meta.env.VITE_API_BASE}/?';
 
@@ -27,7 +28,7 @@ export const AdminContentPage: React.FC = () => {
       try {
         const res = await fetch(`${API_BASE}/admin/content`, {
           headers: {
-            'x-role': role,
+            ...adminAuthHeaders(),
           },
         });
         if (!res.ok) {
@@ -0,0 +1,7 @@
+// Bearer token issued by /auth/login (AdminLoginPage), sent to every /admin/* call.
+const TOKEN_KEY = "ameotech_admin_token";
+
+export function adminAuthHeaders(): Record<string, string> {
+  const token = typeof window === "undefined" ? null : window.localStorage.getItem(TOKEN_KEY);
+  return token ? { Authorization: `Bearer ${token}` } : {};
+}
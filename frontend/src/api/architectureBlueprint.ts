@@ -1,3 +1,5 @@
+import { chatSessionHeaders } from './chatSession';
+
 const API_BASE = import.meta.env.VITE_API_BASE ?? "";
 
 
@@ -71,7 +73,7 @@ export async function runArchitectureBlueprint(
 ): Promise<ArchitectureBlueprintResponse> {
   const res = await fetch(`${API_BASE}/labs/architecture-blueprint/run`, {
     method: 'POST',
-    headers: { 'Content-Type': 'application/json' },
+    headers: { 'Content-Type': 'application/json', ...chatSessionHeaders() },
     body: JSON.stringify(payload),
   });
 
@@ -0,0 +1,17 @@
+// Chat session id, kept per browser tab so lab runs started from the chat
+// can be linked to the conversation (sent to /labs/*/run as X-Session-Id).
+const STORAGE_KEY = "ameotech_chat_session";
+
+export function getOrCreateChatSessionId(create: () => string): string {
+  if (typeof window === "undefined") return create();
+  const existing = window.sessionStorage.getItem(STORAGE_KEY);
+  if (existing) return existing;
+  const id = create();
+  window.sessionStorage.setItem(STORAGE_KEY, id);
+  return id;
+}
+
+export function chatSessionHeaders(): Record<string, string> {
+  const id = typeof window === "undefined" ? null : window.sessionStorage.getItem(STORAGE_KEY);
+  return id ? { "X-Session-Id": id } : {};
+}
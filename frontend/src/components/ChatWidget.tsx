@@ -1,4 +1,5 @@
 import React, { useState } from "react";
+import { getOrCreateChatSessionId } from "../api/chatSession";
 
 const API_BASE =
   import.meta.env.VITE_API_BASE ??
@@ -46,7 +47,7 @@ export const ChatWidget: React.FC = () => {
   const [loading, setLoading] = useState(false);
   const [suggestions, setSuggestions] = useState<SuggestedReply[]>([]);
   const [nextActions, setNextActions] = useState<NextAction[]>([]);
-  const [sessionId] = useState(() => createId());
+  const [sessionId] = useState(() => getOrCreateChatSessionId(createId));
 
   const appendMessage = (role: ChatMessage["role"], content: string) => {
     setMessages((prev) => [...prev, { id: createId(), role, content }]);
@@ -163,22 +164,7 @@ export const ChatWidget: React.FC = () => {
     }
 
     if (a.type === "escalate_human") {
-      try {
-        await fetch(`${API_BASE}/internal/notify-sales`, {
-          method: "POST",
-          headers: { "Content-Type": "application/json" },
-          body: JSON.stringify({
-            session_id: sessionId,
-            source: "chat",
-            last_message: messages[messages.length - 1]?.content,
-            transcript: messages,
-            next_action: a,
-          }),
-        }).catch(() => {});
-      } catch {
-        // ignore
-      }
-
+      // Sales is notified by the backend when the reasoning engine escalates
       const href =
         a.payload?.link ||
         "mailto:hello@ameotech.com?subject=Ameotech%20chat%20escalation";
@@ -3,6 +3,7 @@ const API_BASE =
   (import.meta.env.DEV ? 'http://localhost:8000' : '');
 
 import React, { useState } from 'react';
+import { chatSessionHeaders } from '../api/chatSession';
 
 type Step = 0 | 1 | 2 | 3 | 4;
 
@@ -75,7 +76,7 @@ export const BuildEstimatorWizard: React.FC = () => {
     try {
       const resp = await fetch(`${API_BASE}/labs/build-estimator/run`, {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
+        headers: { 'Content-Type': 'application/json', ...chatSessionHeaders() },
         body: JSON.stringify(form),
       });
       if (!resp.ok) throw new Error('Failed to run estimator');